@@ -0,0 +1,107 @@
+"""Memory footprint of the mission catalog: dicts vs frozen records.
+
+Builds a synthetic 10k-mission catalog from the real missions, parses it
+from JSON as a data file would be, and compares the memory it retains as
+plain dicts with the memory it retains as ``Mission``/``Requirement``
+records. Also compares the allocations of serving one (time window,
+level) listing the old way (copying every mission, then encoding) with
+serving the pre-serialized view.
+
+Run from backend/:
+
+    python -m benchmarks.bench_mission_memory
+"""
+import gc
+import json
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from fastapi.encoders import jsonable_encoder
+
+from models.mission import Mission
+from services.mission_catalog import MISSIONS_PATH
+from services.mission_service import mission_service
+
+CATALOG_SIZE = 10_000
+REQUESTS = 1_000
+
+
+def synthetic_catalog_json(size: int) -> bytes:
+    """A flat JSON list of ``size`` missions cycled from the real catalog."""
+    catalog = json.loads(MISSIONS_PATH.read_bytes())['missions']
+    base = [
+        mission
+        for levels in catalog.values()
+        for missions in levels.values()
+        for mission in missions
+    ]
+    return json.dumps([
+        {**base[i % len(base)], 'id': f"{base[i % len(base)]['id']}-{i}"}
+        for i in range(size)
+    ]).encode()
+
+
+def retained_bytes(build: Callable[[], Any]) -> int:
+    """Memory still allocated after ``build`` returns, keeping its result alive."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current
+
+
+def allocated_bytes(call: Callable[[], Any], repeat: int) -> int:
+    """Total bytes allocated by ``repeat`` calls (peak, since results are dropped)."""
+    gc.collect()
+    tracemalloc.start()
+    total = 0
+    for _ in range(repeat):
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        call()
+        _, peak = tracemalloc.get_traced_memory()
+        total += peak - before
+    tracemalloc.stop()
+    return total
+
+
+def legacy_listing(missions: List[Dict[str, Any]]) -> bytes:
+    """The old per-request path: copy each mission, then let FastAPI encode it."""
+    copies = [dict(mission) for mission in missions]
+    payload = {"success": True, "data": copies, "count": len(copies)}
+    return json.dumps(jsonable_encoder(payload)).encode()
+
+
+def main() -> None:
+    blob = synthetic_catalog_json(CATALOG_SIZE)
+
+    as_dicts = retained_bytes(lambda: json.loads(blob))
+
+    def load_records():
+        raw = json.loads(blob)
+        records = tuple(Mission.from_dict(mission) for mission in raw)
+        del raw
+        return records
+
+    as_records = retained_bytes(load_records)
+
+    print(f"{CATALOG_SIZE} missions")
+    print(f"  dicts:   {as_dicts / 1e6:8.2f} MB")
+    print(f"  records: {as_records / 1e6:8.2f} MB  ({1 - as_records / as_dicts:.0%} less)")
+
+    level_missions = [
+        mission for mission in json.loads(blob)
+        if mission['timeWindow'] == 'morning' and mission['level'] == 1
+    ][:4]
+    legacy = allocated_bytes(lambda: legacy_listing(level_missions), REQUESTS)
+    current = allocated_bytes(lambda: mission_service.get_missions_view('morning', 1).body, REQUESTS)
+    print(f"{REQUESTS} /missions/morning/1 responses")
+    print(f"  copy + encode:   {legacy / 1e6:8.2f} MB allocated")
+    print(f"  pre-serialized:  {current / 1e6:8.2f} MB allocated")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""Micro-benchmark for /api/receptors/status response assembly.
+
+Compares the previous assembly (a linear ``next()`` search over the
+receptor list per cluster, then FastAPI's ``jsonable_encoder`` and
+``json.dumps``) with the current one (receptor details keyed by ID,
+prebuilt cluster templates and orjson) on synthetic receptor sets.
+
+Run from backend/:
+
+    python -m benchmarks.bench_status_format
+"""
+import json
+import timeit
+from datetime import datetime
+from typing import Any, Dict, List
+
+from fastapi.encoders import jsonable_encoder
+
+from models.nutrition import NutrientInput, ReceptorEfficiency
+from routers import receptors as receptors_router
+from services.receptor_service import receptor_service
+
+RECEPTORS_PER_SYSTEM = (10, 100, 1000, 5000)
+REPEATS = 5
+
+
+def synthetic_dataset(per_system: int) -> Dict[str, Any]:
+    """Receptor data with ``per_system`` clusters in each body system."""
+    return {
+        system_key: {
+            'name': system_data.get('name', system_key),
+            'receptors': {
+                f"{system_key}_{i}": {
+                    'name': f"Cluster {i}",
+                    'primary_receptor': f"R{i}",
+                    'description': f"Synthetic cluster {i}",
+                    'recommendations': ["Take with food"],
+                }
+                for i in range(per_system)
+            },
+        }
+        for system_key, system_data in receptor_service.receptor_data.items()
+    }
+
+
+def synthetic_status(receptor_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Statuses for every synthetic receptor, some with active factors."""
+    status = {}
+    for system_key, system_data in receptor_data.items():
+        details = [
+            ReceptorEfficiency.model_construct(
+                receptor_id=key,
+                efficiency_percentage=60.0 + (i % 90),
+                enhancement_factors=["Vitamin C"] if i % 3 == 0 else [],
+                limiting_factors=["Calcium"] if i % 5 == 0 else [],
+            )
+            for i, key in enumerate(system_data['receptors'])
+        ]
+        status[system_key] = receptor_service.build_system_status(system_key, details)
+    return status
+
+
+def legacy_format(status: Dict[str, Any], nutrients: List[NutrientInput]) -> Dict[str, Any]:
+    """The assembly this router used before receptor details were keyed by ID."""
+    status_dict = {}
+    for system_key, system_status in status.items():
+        system_data = receptor_service.receptor_data.get(system_key, {})
+        receptor_details = list(system_status.receptor_details.values())
+        clusters = []
+        for receptor_key, receptor_info in system_data.get('receptors', {}).items():
+            rd = next((rd for rd in receptor_details if rd.receptor_id == receptor_key), None)
+            efficiency = rd.efficiency_percentage if rd else 100
+            if efficiency >= 90:
+                status_level = 'optimal'
+            elif efficiency >= 70:
+                status_level = 'good'
+            elif efficiency >= 50:
+                status_level = 'attention'
+            else:
+                status_level = 'concern'
+            clusters.append({
+                "id": receptor_key,
+                "name": receptor_info.get("name", receptor_key),
+                "icon": receptor_info.get("icon", "🔬"),
+                "description": receptor_info.get("description", ""),
+                "status": status_level,
+                "efficiency": int(efficiency),
+                "receptors": [receptor_info.get("primary_receptor", "")],
+                "currentNutrients": (rd.enhancement_factors + rd.limiting_factors) if rd else [],
+                "recommendations": receptor_info.get("recommendations", [])
+            })
+        status_dict[system_key] = {
+            "system": system_status.system.value,
+            "efficiency": system_status.efficiency,
+            "active_receptors": system_status.active_receptors,
+            "clusters": clusters,
+            "commentary": receptor_service.generate_expert_commentary(
+                system_key, system_status.efficiency, nutrients
+            ),
+            "last_updated": system_status.last_updated.isoformat(),
+            "notes": system_status.notes
+        }
+    return status_dict
+
+
+def best_of(func) -> float:
+    """Best wall-clock time of one call, in milliseconds."""
+    number = 1
+    while timeit.timeit(func, number=number) < 0.2 and number < 1000:
+        number *= 2
+    return min(timeit.repeat(func, number=number, repeat=REPEATS)) / number * 1000
+
+
+def main() -> None:
+    original_data = receptor_service.receptor_data
+    original_version = receptor_service.data_version
+    nutrients = [NutrientInput(name="Vitamin C", amount=500, unit="mg", timing=datetime.now())]
+
+    print(f"{'receptors':>10} {'legacy ms':>11} {'current ms':>11} {'speedup':>8}")
+    try:
+        for per_system in RECEPTORS_PER_SYSTEM:
+            receptor_service.receptor_data = synthetic_dataset(per_system)
+            # New version so the router rebuilds its cluster templates
+            receptor_service.data_version += 1
+            status = synthetic_status(receptor_service.receptor_data)
+
+            def legacy():
+                payload = {"success": True, "data": legacy_format(status, nutrients)}
+                json.dumps(jsonable_encoder(payload))
+
+            def current():
+                receptors_router._json_response({
+                    "success": True,
+                    "data": receptors_router._format_receptor_status(status, nutrients)
+                })
+
+            assert json.loads(receptors_router._json_response(
+                {"data": receptors_router._format_receptor_status(status, nutrients)}
+            ).body) == {"data": legacy_format(status, nutrients)}
+
+            legacy_ms = best_of(legacy)
+            current_ms = best_of(current)
+            total = per_system * len(status)
+            print(f"{total:>10} {legacy_ms:>11.3f} {current_ms:>11.3f} {legacy_ms / current_ms:>7.1f}x")
+    finally:
+        receptor_service.receptor_data = original_data
+        receptor_service.data_version = original_version
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""Stress test for concurrent GameService mutations.
+
+Fires thousands of mission completions for a few users from many threads
+at once: every requirement of every catalog mission is ticked twice,
+interleaved with state reads. Afterwards each user's points must equal
+the points sent, each mission must appear exactly once in
+``completed_missions`` and every level must count all of its missions
+in each time window, and the all-time and weekly leaderboards must
+show each user's points. The thread switch interval is cut to the
+minimum so lost updates surface quickly if the per-user locking
+regresses.
+
+The ``memory`` backend runs one service in-process. The ``shared``
+backend runs the production setup, NDJSON event logs plus SQLite state
+and leaderboard, in several processes sharing one temporary directory,
+so the log's file locks and the leaderboard's transactions are
+contended across processes; a fresh service checks the result.
+
+Run from backend/ (both backends unless one is named):
+
+    python -m benchmarks.stress_game_concurrency [memory|shared]
+"""
+import random
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+from services.game_events import NDJSONGameEventLog
+from services.game_service import GameService
+from services.game_store import MemoryGameStateStore, SQLiteGameStateStore
+from services.leaderboard import SQLiteLeaderboard
+from services.mission_catalog import requirement_ids
+from services.mission_service import mission_service
+
+BACKENDS = ('memory', 'shared')
+
+USERS = 100
+# Each requirement tick is sent this many times
+DUPLICATES = 2
+THREADS = 32
+# Server processes sharing the log and database in the shared run
+PROCESSES = 4
+POINTS_PER_TICK = 3
+
+Tick = Tuple[str, str, str]
+
+
+def workload(seed: int = 0) -> List[Tick]:
+    """Shuffled (user, mission, requirement) ticks, duplicates included."""
+    ticks = [
+        (f"user-{u}", mission.id, requirement_id)
+        for u in range(USERS)
+        for mission in mission_service.catalog.missions
+        for requirement_id in requirement_ids(mission)
+        for _ in range(DUPLICATES)
+    ]
+    random.Random(seed).shuffle(ticks)
+    return ticks
+
+
+def build_service(directory: Optional[Path]) -> GameService:
+    """In-memory service, or one on the shared log and database in ``directory``."""
+    if directory is None:
+        return GameService(MemoryGameStateStore())
+    database = directory / 'game_state.db'
+    return GameService(
+        SQLiteGameStateStore(database),
+        NDJSONGameEventLog(directory / 'game_events'),
+        leaderboard=SQLiteLeaderboard(database)
+    )
+
+
+def hammer(service: GameService, ticks: Sequence[Tick]) -> None:
+    """Send the ticks from ``THREADS`` threads, with state reads mixed in."""
+    sys.setswitchinterval(1e-6)
+
+    def complete(tick: Tick) -> None:
+        user_id, mission_id, requirement_id = tick
+        service.complete_mission(user_id, mission_id, {
+            "requirementId": requirement_id,
+            "pointsEarned": POINTS_PER_TICK,
+        })
+        if random.random() < 0.1:
+            service.get_game_state(user_id)
+
+    with ThreadPoolExecutor(max_workers=THREADS) as pool:
+        list(pool.map(complete, ticks))
+
+
+def run_process(directory: Path, ticks: Sequence[Tick]) -> None:
+    """One server process's share of the shared run."""
+    service = build_service(directory)
+    try:
+        hammer(service, ticks)
+    finally:
+        service.close()
+
+
+def check(service: GameService, ticks_per_user: int) -> List[str]:
+    """Everything that does not match what was sent."""
+    catalog = mission_service.catalog
+    expected_points = ticks_per_user * POINTS_PER_TICK
+    failures = []
+    for u in range(USERS):
+        user_id = f"user-{u}"
+        state = service.get_game_state(user_id)
+        if state["totalPoints"] != expected_points:
+            failures.append(f"{user_id}: {state['totalPoints']} points, expected {expected_points}")
+        completed = state["completedMissions"]
+        if len(completed) != len(set(completed)) or len(completed) != len(catalog.missions):
+            failures.append(
+                f"{user_id}: {len(completed)} completed missions "
+                f"({len(set(completed))} distinct), expected {len(catalog.missions)}"
+            )
+        for level, totals in catalog.level_mission_counts.items():
+            windows = state["levelProgress"][f"level{level}"]["windows"]
+            for time_window, total in totals.items():
+                window_completed = windows[time_window]["completed"]
+                if window_completed != total:
+                    failures.append(
+                        f"{user_id}: level{level} {time_window} completed {window_completed}, expected {total}"
+                    )
+        for window in ('all', 'weekly'):
+            points = service.leaderboard.standing(window, user_id)["points"]
+            if points != expected_points:
+                failures.append(f"{user_id}: {points} points on the {window} leaderboard, expected {expected_points}")
+    return failures
+
+
+def run(backend: str) -> List[str]:
+    """Run the workload on one backend and return its failures."""
+    ticks = workload()
+    ticks_per_user = len(ticks) // USERS
+    with tempfile.TemporaryDirectory() as tmp:
+        if backend == 'memory':
+            service = build_service(None)
+            start = time.perf_counter()
+            hammer(service, ticks)
+            elapsed = time.perf_counter() - start
+            workers = f"{THREADS} threads"
+        else:
+            directory = Path(tmp)
+            # Start up once, as the server does, before the race
+            service = build_service(directory)
+            service.load_leaderboard()
+            service.close()
+            start = time.perf_counter()
+            with ProcessPoolExecutor(max_workers=PROCESSES) as pool:
+                list(pool.map(run_process, [directory] * PROCESSES, [
+                    ticks[p::PROCESSES] for p in range(PROCESSES)
+                ]))
+            elapsed = time.perf_counter() - start
+            workers = f"{PROCESSES} processes x {THREADS} threads"
+            service = build_service(directory)
+        try:
+            failures = check(service, ticks_per_user)
+            # Live updates must have kept the shared leaderboard complete
+            caught_up = service.reconcile_leaderboard()
+            if caught_up:
+                failures.append(f"leaderboard was behind the logs of {caught_up} users")
+        finally:
+            service.close()
+
+    print(f"{backend}: {len(ticks)} completions for {USERS} users on {workers} in {elapsed:.2f} s")
+    return failures
+
+
+def main() -> None:
+    backends = sys.argv[1:] or BACKENDS
+    failures = []
+    for backend in backends:
+        if backend not in BACKENDS:
+            sys.exit(f"Unknown backend {backend!r}; choose from {', '.join(BACKENDS)}")
+        failures += [f"{backend}: {failure}" for failure in run(backend)]
+    if failures:
+        print("FAILED")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+    print("OK: points, completed missions, level progress and leaderboards are exact")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Expert commentary templates for the receptor status view."""
+from typing import Dict
+
+
+# Efficiency tiers, highest first: (minimum average efficiency, tier)
+EFFICIENCY_TIERS = (
+    (120.0, "enhanced"),
+    (90.0, "optimal"),
+    (70.0, "adequate"),
+    (float("-inf"), "compromised"),
+)
+
+# Tier to use when a system has no template for a tier yet
+TIER_FALLBACKS = {
+    "enhanced": "optimal",
+}
+
+# System notes per tier
+SYSTEM_NOTES: Dict[str, str] = {
+    "enhanced": "System operating at enhanced efficiency",
+    "optimal": "System functioning optimally",
+    "adequate": "System functioning adequately with room for improvement",
+    "compromised": "System efficiency compromised - check limiting factors",
+}
+
+# Commentary per body system and tier. ``{nutrients}`` is the comma-separated
+# names of the last few logged nutrients and ``{efficiency}`` the system's
+# average efficiency.
+COMMENTARY_TEMPLATES: Dict[str, Dict[str, str]] = {
+    "intestinal": {
+        "optimal": "Your absorption patterns show excellent utilization of {nutrients}. The intestinal receptors are optimally primed for nutrient uptake.",
+        "adequate": "Good intestinal absorption detected. Recent intake of {nutrients} is being processed efficiently with minor optimization opportunities.",
+        "compromised": "Absorption efficiency could be improved. Consider timing and combinations when taking {nutrients} for better uptake.",
+    },
+    "hepatic": {
+        "optimal": "Liver enzyme activity is well-supported. Your recent nutrients ({nutrients}) are being metabolized optimally.",
+        "adequate": "Hepatic processing is functioning well. The nutrients you've taken are supporting detoxification pathways adequately.",
+        "compromised": "Liver support could be enhanced. Consider spacing your nutrient intake and supporting Phase II detoxification.",
+    },
+    "circulatory": {
+        "optimal": "Nutrient delivery systems are performing excellently. Your {nutrients} are being transported efficiently throughout your body.",
+        "adequate": "Good circulatory transport detected. Nutrients are reaching their targets with reasonable efficiency.",
+        "compromised": "Transport efficiency could be improved. Consider cardiovascular support nutrients alongside {nutrients}.",
+    },
+    "cellular": {
+        "optimal": "Cellular utilization is optimal. Mitochondrial function is well-supported by your current nutrient profile including {nutrients}.",
+        "adequate": "Cells are utilizing nutrients adequately. Energy production pathways are functioning with good efficiency.",
+        "compromised": "Cellular efficiency needs support. Consider cofactors for energy production alongside your current nutrients.",
+    },
+}
+
+# Used for systems without templates
+DEFAULT_COMMENTARY = "System analysis shows {efficiency:.0f}% efficiency with recent nutrients: {nutrients}."
+
+# Shown in place of the nutrient names when nothing is logged
+NO_NUTRIENTS = "no tracked nutrients"
+
+# How many of the most recent nutrients commentary mentions
+COMMENTARY_NUTRIENT_COUNT = 5
@@ -0,0 +1,54 @@
+"""Mission receptor names mapped onto receptor clusters.
+
+Missions name the transporters, channels and signalling proteins they
+target (``targetReceptors`` in ``data/missions.json``). Names that the
+receptor dataset already lists as a cluster's receptor, protein or gene
+are matched through its lookup indexes; this table covers the rest.
+Values are (system, cluster) pairs of the receptor dataset.
+"""
+from typing import Dict, Tuple
+
+RECEPTOR_CLUSTERS: Dict[str, Tuple[Tuple[str, str], ...]] = {
+    # Iron handling
+    'transferrin-receptor': (('circulatory', 'transport_proteins'), ('intestinal', 'iron')),
+    # Calcium absorption and its vitamin D / K control
+    'calcium-channels': (('intestinal', 'calcium'),),
+    'VDR': (('intestinal', 'calcium'),),
+    'osteocalcin': (('intestinal', 'calcium'),),
+    # Copper and zinc transport and storage
+    'CTR1': (('intestinal', 'trace_minerals'),),
+    'ATP7A': (('intestinal', 'trace_minerals'),),
+    'ZnT1': (('intestinal', 'trace_minerals'),),
+    'ZIP14': (('intestinal', 'trace_minerals'),),
+    'MT1': (('intestinal', 'trace_minerals'),),
+    'MT2': (('intestinal', 'trace_minerals'),),
+    # B vitamin carriers
+    'thiamine-transporter': (('intestinal', 'b_vitamins'),),
+    'riboflavin-transporter': (('intestinal', 'b_vitamins'),),
+    # Fat-soluble vitamin uptake and hepatic handling
+    'CD36': (('intestinal', 'fat_soluble'),),
+    'SEC14L2': (('intestinal', 'fat_soluble'),),
+    'StARD3': (('intestinal', 'fat_soluble'),),
+    'alpha-TTP': (('hepatic', 'vitamin_storage'),),
+    'VKORC1': (('hepatic', 'vitamin_storage'),),
+    # Detoxification
+    'Nrf2': (('hepatic', 'phase_2'),),
+    'GSTP1': (('hepatic', 'phase_2'),),
+    'DIO1': (('hepatic', 'phase_1'),),
+    # Mitochondrial energy metabolism
+    'AMPK': (('cellular', 'mitochondria'),),
+    'PGC-1alpha': (('cellular', 'mitochondria'),),
+    'SIRT1': (('cellular', 'mitochondria'),),
+    'NAMPT': (('cellular', 'mitochondria'),),
+    'PARP1': (('cellular', 'mitochondria'),),
+    'OCTN2': (('cellular', 'mitochondria'),),
+    # Amino acid uptake and protein synthesis
+    'mTOR': (('cellular', 'protein_synthesis'),),
+    'LAT1': (('cellular', 'protein_synthesis'),),
+    'PEPT1': (('cellular', 'protein_synthesis'),),
+    'ASCT2': (('cellular', 'protein_synthesis'),),
+    'collagen-receptors': (('cellular', 'protein_synthesis'),),
+    # Vascular tone
+    'Na-K-ATPase': (('circulatory', 'vascular_function'),),
+    'KCNJ2': (('circulatory', 'vascular_function'),),
+}
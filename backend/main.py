@@ -3,10 +3,14 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
+import asyncio
 import logging
 
 # Import routers
 from routers import missions, game, receptors
+from services.game_service import game_service
+from services.mission_service import mission_service
+from services.supplement_scheduler import supplement_scheduler
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -17,8 +21,18 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI):
     """Manage application lifecycle."""
     logger.info("Starting HealthCore Backend...")
+    players = await asyncio.to_thread(game_service.load_leaderboard)
+    if players:
+        logger.info(f"Seeded leaderboard with {players} players")
+    players = await asyncio.to_thread(game_service.reconcile_leaderboard)
+    if players:
+        logger.info(f"Caught up leaderboard for {players} players from the game logs")
+    catalog_watcher = asyncio.create_task(mission_service.watch_catalog())
     yield
     logger.info("Shutting down HealthCore Backend...")
+    catalog_watcher.cancel()
+    supplement_scheduler.shutdown()
+    game_service.close()
 
 
 app = FastAPI(
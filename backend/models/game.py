@@ -0,0 +1,16 @@
+"""Game request models for HealthCore."""
+
+from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class MissionCompletion(BaseModel):
+    """One requirement tick of a mission.
+
+    Accepts the client's camelCase keys as well as the field names.
+    """
+    model_config = ConfigDict(populate_by_name=True)
+
+    mission_id: str = Field(alias="missionId")
+    requirement_id: Optional[str] = Field(default=None, alias="requirementId")
+    points_earned: float = Field(default=0, alias="pointsEarned")
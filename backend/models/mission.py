@@ -0,0 +1,159 @@
+"""Mission catalog file schema and the immutable records it loads into."""
+import sys
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Dict, List, Tuple, Union
+
+import orjson
+from pydantic import BaseModel, Field, model_validator
+
+from data.missions import MissionCategory, RequirementType, TimeWindow
+
+
+class RequirementSchema(BaseModel):
+    """A requirement as written in ``data/missions.json``."""
+    type: RequirementType
+    target: str
+    amount: Union[int, float]
+    unit: str
+    description: str
+
+
+class MissionSchema(BaseModel):
+    """A mission as written in ``data/missions.json``."""
+    id: str = Field(min_length=1)
+    title: str
+    description: str
+    icon: str
+    level: int = Field(ge=1)
+    timeWindow: TimeWindow
+    targetReceptors: List[str] = Field(default_factory=list)
+    basePoints: int = Field(ge=0)
+    category: MissionCategory
+    requirements: List[RequirementSchema] = Field(default_factory=list)
+
+
+class MissionCatalogFile(BaseModel):
+    """Schema of ``data/missions.json``.
+
+    ``missions`` is keyed by time window, then ``level<N>``; every mission
+    must sit under its own window and level, and IDs must be unique.
+    Bump ``version`` whenever the file changes so clients can delta-sync.
+    """
+    version: int = Field(ge=1)
+    missions: Dict[TimeWindow, Dict[str, List[MissionSchema]]]
+
+    @model_validator(mode='after')
+    def check_placement(self) -> "MissionCatalogFile":
+        seen = set()
+        for time_window, levels in self.missions.items():
+            for level_key, missions in levels.items():
+                for mission in missions:
+                    if mission.timeWindow != time_window or f"level{mission.level}" != level_key:
+                        raise ValueError(
+                            f"Mission {mission.id} is listed under {time_window.value}/{level_key}"
+                        )
+                    if mission.id in seen:
+                        raise ValueError(f"Duplicate mission id: {mission.id}")
+                    seen.add(mission.id)
+        return self
+
+
+def _text(value: Any) -> str:
+    """Enum value or string, interned: categories, units and receptors repeat a lot."""
+    return sys.intern(value.value if isinstance(value, Enum) else str(value))
+
+
+@dataclass(frozen=True, slots=True)
+class Requirement:
+    """One requirement of a mission."""
+    type: str
+    target: str
+    amount: Union[int, float]
+    unit: str
+    description: str
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Requirement":
+        return cls(
+            type=_text(data['type']),
+            target=_text(data['target']),
+            amount=data['amount'],
+            unit=_text(data['unit']),
+            description=data['description'],
+        )
+
+    def to_json(self) -> Dict[str, Any]:
+        """JSON shape of the catalog (matches the client's interface)."""
+        return {
+            "type": self.type,
+            "target": self.target,
+            "amount": self.amount,
+            "unit": self.unit,
+            "description": self.description,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class Mission:
+    """A catalog mission; shared by every request and never mutated."""
+    id: str
+    title: str
+    description: str
+    icon: str
+    level: int
+    time_window: str
+    target_receptors: Tuple[str, ...]
+    base_points: int
+    category: str
+    requirements: Tuple[Requirement, ...]
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Mission":
+        return cls(
+            id=data['id'],
+            title=data['title'],
+            description=data['description'],
+            icon=_text(data['icon']),
+            level=data['level'],
+            time_window=_text(data['timeWindow']),
+            target_receptors=tuple(_text(r) for r in data.get('targetReceptors', [])),
+            base_points=data['basePoints'],
+            category=_text(data['category']),
+            requirements=tuple(Requirement.from_dict(r) for r in data.get('requirements', [])),
+        )
+
+    def to_json(self) -> Dict[str, Any]:
+        """JSON shape of the catalog (matches the client's interface)."""
+        return {
+            "id": self.id,
+            "title": self.title,
+            "description": self.description,
+            "icon": self.icon,
+            "level": self.level,
+            "timeWindow": self.time_window,
+            "targetReceptors": self.target_receptors,
+            "basePoints": self.base_points,
+            "category": self.category,
+            "requirements": self.requirements,
+        }
+
+
+def _encode_record(value: Any) -> Any:
+    if isinstance(value, (Mission, Requirement)):
+        return value.to_json()
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def encode_catalog(payload: Any) -> bytes:
+    """Serialize catalog payloads containing Mission/Requirement records.
+
+    The single encoder for mission responses: records are written in the
+    client's camelCase shape straight from their slots, with no
+    intermediate dict copies of the catalog.
+    """
+    return orjson.dumps(
+        payload,
+        default=_encode_record,
+        option=orjson.OPT_PASSTHROUGH_DATACLASS
+    )
@@ -41,20 +41,24 @@ class MealInput(BaseModel):
 
 class ReceptorEfficiency(BaseModel):
     """Receptor efficiency calculation result."""
-    receptor_type: ReceptorType
+    receptor_id: str
+    receptor_type: Optional[ReceptorType] = None
     efficiency_percentage: float
-    active_transporters: List[str]
-    enhancers: List[str]
-    inhibitors: List[str]
-    recommendations: List[str]
+    limiting_factors: List[str] = Field(default_factory=list)
+    enhancement_factors: List[str] = Field(default_factory=list)
+    active_transporters: List[str] = Field(default_factory=list)
+    recommendations: List[str] = Field(default_factory=list)
 
 
 class SystemStatus(BaseModel):
     """Status of a body system."""
     system: BodySystem
-    receptor_clusters: List[ReceptorEfficiency]
-    overall_efficiency: float
-    bottlenecks: List[str]
+    efficiency: float
+    active_receptors: int
+    # Keyed by receptor_id, in the system's receptor order
+    receptor_details: Dict[str, ReceptorEfficiency]
+    last_updated: datetime = Field(default_factory=datetime.now)
+    notes: str = ""
 
 
 class NutritionStatus(BaseModel):
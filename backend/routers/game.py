@@ -1,13 +1,18 @@
 """API routes for game state management."""
-from fastapi import APIRouter, HTTPException, Body
-from typing import Dict, Any
+from fastapi import APIRouter, HTTPException, Body, Query
+from typing import Dict, Any, List
+from models.game import MissionCompletion
 from services.game_service import game_service
+from services.leaderboard import DEFAULT_LEADERBOARD_SIZE, MAX_LEADERBOARD_SIZE
 
 router = APIRouter(prefix="/api/game", tags=["game"])
 
+# Handlers are plain functions so FastAPI runs them in its threadpool: the
+# game service blocks on user locks, log file locks, file I/O and SQLite.
+
 
 @router.get("/state/{user_id}")
-async def get_game_state(user_id: str):
+def get_game_state(user_id: str):
     """Get current game state for a user."""
     game_state = game_service.get_game_state(user_id)
     return {
@@ -16,8 +21,48 @@ async def get_game_state(user_id: str):
     }
 
 
+@router.get("/leaderboard")
+def get_leaderboard(
+    window: str = Query("all"),
+    limit: int = Query(DEFAULT_LEADERBOARD_SIZE, ge=1, le=MAX_LEADERBOARD_SIZE)
+):
+    """Get the top players by points: all time, today ('daily') or this week ('weekly')."""
+    try:
+        board = game_service.leaderboard.top(window, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {
+        "success": True,
+        "data": board
+    }
+
+
+@router.get("/leaderboard/{user_id}")
+def get_leaderboard_standing(user_id: str, window: str = Query("all")):
+    """Get a user's rank and points on a leaderboard window."""
+    try:
+        standing = game_service.leaderboard.standing(window, user_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {
+        "success": True,
+        "data": standing
+    }
+
+
+@router.get("/events/{user_id}")
+def get_game_events(user_id: str):
+    """Get a user's game event history (completions, level-ups, resets)."""
+    events = game_service.get_events(user_id)
+    return {
+        "success": True,
+        "data": events,
+        "count": len(events)
+    }
+
+
 @router.post("/mission-complete")
-async def complete_mission(
+def complete_mission(
     user_id: str = Body(...),
     mission_id: str = Body(...),
     completion_data: Dict[str, Any] = Body(...)
@@ -27,8 +72,25 @@ async def complete_mission(
     return result
 
 
+@router.post("/missions-complete")
+def complete_missions(
+    user_id: str = Body(...),
+    completions: List[MissionCompletion] = Body(...)
+):
+    """Handle several requirement completions in one request.
+    
+    The completions are applied together as one state change, and the
+    result aggregates points, newly completed missions and level-up
+    availability.
+    """
+    try:
+        return game_service.complete_missions(user_id, completions)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @router.post("/level-up")
-async def level_up(
+def level_up(
     user_id: str = Body(...),
     level: int = Body(...),
     time_window: str = Body(...)
@@ -39,7 +101,7 @@ async def level_up(
 
 
 @router.post("/reset/{user_id}")
-async def reset_game_state(user_id: str):
+def reset_game_state(user_id: str):
     """Reset game state for a user."""
     result = game_service.reset_game_state(user_id)
     return result
\ No newline at end of file
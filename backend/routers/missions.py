@@ -1,65 +1,204 @@
 """API routes for missions."""
-from fastapi import APIRouter, HTTPException, Query
-from typing import Optional, List
-from services.mission_service import mission_service
+from fastapi import APIRouter, Body, HTTPException, Header, Query
+from fastapi.responses import Response
+from typing import List, Optional, Sequence
+import orjson
+from models.mission import encode_catalog
+from models.nutrition import NutrientInput
+from services.mission_service import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    CatalogView,
+    mission_service,
+)
+from services.mission_recommender import (
+    DEFAULT_RECOMMENDATIONS,
+    MAX_RECOMMENDATIONS,
+    RECEPTOR_DATA_NONE,
+    mission_recommender,
+)
 
 router = APIRouter(prefix="/api/missions", tags=["missions"])
 
 
-@router.get("/{time_window}/{level}")
-async def get_missions(time_window: str, level: int):
-    """Get missions for a specific time window and level."""
+def _catalog_response(view: CatalogView, if_none_match: Optional[str]) -> Response:
+    """Serve pre-serialized catalog bytes, or 304 if the client's copy is current."""
+    headers = {
+        "ETag": view.etag,
+        "Cache-Control": "no-cache",
+        "X-Catalog-Version": str(mission_service.version)
+    }
+    if if_none_match and _etag_matches(if_none_match, view.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=view.body, media_type="application/json", headers=headers)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison as RFC 9110 requires for If-None-Match."""
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        candidate.strip().removeprefix("W/") == etag
+        for candidate in if_none_match.split(",")
+    )
+
+
+@router.get("/filter")
+async def filter_missions(
+    category: Optional[str] = Query(None),
+    receptor: Optional[str] = Query(None),
+    window: Optional[str] = Query(None),
+    level: Optional[int] = Query(None),
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)
+):
+    """Get missions matching all given filters, with cursor pagination.
+    
+    Pass the returned ``next_cursor`` as ``cursor`` to get the next page;
+    it is ``null`` on the last page.
+    """
     try:
-        missions = mission_service.get_missions(time_window, level)
-        return {
-            "success": True,
-            "data": missions,
-            "count": len(missions)
-        }
+        page = mission_service.filter_missions(
+            {"category": category, "receptor": receptor, "window": window, "level": level},
+            cursor=cursor,
+            limit=limit
+        )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+    # Splice the pre-serialized missions into the envelope
+    body = (
+        b'{"success":true,"data":' + page.body
+        + b',"count":' + str(len(page.missions)).encode()
+        + b',"total":' + str(page.total).encode()
+        + b',"next_cursor":' + orjson.dumps(page.next_cursor) + b'}'
+    )
+    return Response(content=body, media_type="application/json")
 
-@router.get("/")
-async def get_all_missions():
-    """Get all missions organized by time window and level."""
-    missions = mission_service.get_all_missions()
+
+@router.get("/catalog/version")
+async def get_catalog_version():
+    """Get the current mission catalog version."""
     return {
         "success": True,
-        "data": missions
+        "version": mission_service.version
     }
 
 
+@router.get("/catalog/changes")
+async def get_catalog_changes(since: int = Query(0, ge=0)):
+    """Get the missions changed and removed since a catalog version.
+    
+    Clients store the returned ``version`` and pass it back as ``since``.
+    ``since=0``, or a version this server does not know, returns the whole
+    catalog with ``full: true``.
+    """
+    changes = mission_service.get_changes(since)
+    return Response(
+        content=encode_catalog({"success": True, **changes}),
+        media_type="application/json"
+    )
+
+
+@router.get("/")
+async def get_all_missions(if_none_match: Optional[str] = Header(None)):
+    """Get all missions organized by time window and level."""
+    return _catalog_response(mission_service.get_all_missions_view(), if_none_match)
+
+
 @router.get("/by-id/{mission_id}")
-async def get_mission_by_id(mission_id: str):
+async def get_mission_by_id(mission_id: str, if_none_match: Optional[str] = Header(None)):
     """Get a specific mission by ID."""
-    mission = mission_service.get_mission_by_id(mission_id)
-    if not mission:
+    view = mission_service.get_mission_view(mission_id)
+    if not view:
         raise HTTPException(status_code=404, detail="Mission not found")
-    
-    return {
-        "success": True,
-        "data": mission
-    }
+
+    return _catalog_response(view, if_none_match)
 
 
 @router.get("/by-category/{category}")
-async def get_missions_by_category(category: str):
+async def get_missions_by_category(category: str, if_none_match: Optional[str] = Header(None)):
     """Get all missions of a specific category."""
-    missions = mission_service.get_missions_by_category(category)
-    return {
-        "success": True,
-        "data": missions,
-        "count": len(missions)
-    }
+    return _catalog_response(mission_service.get_category_view(category), if_none_match)
 
 
 @router.get("/by-receptor/{receptor}")
-async def get_missions_by_receptor(receptor: str):
+async def get_missions_by_receptor(receptor: str, if_none_match: Optional[str] = Header(None)):
     """Get all missions that target a specific receptor."""
-    missions = mission_service.get_missions_by_receptor(receptor)
-    return {
-        "success": True,
-        "data": missions,
-        "count": len(missions)
-    }
\ No newline at end of file
+    return _catalog_response(mission_service.get_receptor_view(receptor), if_none_match)
+
+
+@router.get("/recommended/{user_id}")
+def get_recommended_missions(
+    user_id: str,
+    k: int = Query(DEFAULT_RECOMMENDATIONS, ge=1, le=MAX_RECOMMENDATIONS)
+):
+    """Get the missions that would best lift the user's weakest receptor clusters.
+    
+    Only missions unlocked at the user's level and not yet completed are
+    considered. ``score`` is zero for missions that fill the list by base
+    points because none of their clusters is weak. Receptor status comes
+    from the user's live session on the worker serving the request;
+    ``receptorData`` is ``"none"`` when there is none, and the POST form
+    takes the nutrients instead. Like the game routes, this runs in the
+    threadpool because loading the user's game state blocks on file and
+    SQLite I/O.
+    """
+    return _recommendations_response(user_id, k)
+
+
+@router.post("/recommended/{user_id}")
+def recommend_missions_for_nutrients(
+    user_id: str,
+    nutrients: List[NutrientInput] = Body(...),
+    k: int = Query(DEFAULT_RECOMMENDATIONS, ge=1, le=MAX_RECOMMENDATIONS)
+):
+    """Get recommended missions, scored against the receptor status of ``nutrients``.
+    
+    Takes the same nutrient list as ``/api/receptors/status``, so clients
+    get receptor-aware recommendations without a WebSocket session.
+    """
+    return _recommendations_response(user_id, k, nutrients)
+
+
+def _recommendations_response(
+    user_id: str,
+    k: int,
+    nutrients: Optional[Sequence[NutrientInput]] = None
+) -> Response:
+    recommendations, source = mission_recommender.recommend(user_id, k, nutrients)
+    data = [
+        {
+            "mission": rec.mission,
+            "score": rec.score,
+            "lifts": [
+                {"system": system, "cluster": cluster, "efficiency": efficiency}
+                for system, cluster, efficiency in rec.lifts
+            ]
+        }
+        for rec in recommendations
+    ]
+    body = {"success": True, "data": data, "count": len(data), "receptorData": source}
+    if source == RECEPTOR_DATA_NONE:
+        body["note"] = (
+            "No receptor data for this user; missions are ranked by base points. "
+            "POST the day's nutrients to rank them by receptor status."
+        )
+    return Response(content=encode_catalog(body), media_type="application/json")
+
+
+# Declared last: its two path segments would otherwise capture the
+# /by-id, /by-category, /by-receptor, /recommended and /catalog routes
+@router.get("/{time_window}/{level}")
+async def get_missions(
+    time_window: str,
+    level: int,
+    if_none_match: Optional[str] = Header(None)
+):
+    """Get missions for a specific time window and level."""
+    try:
+        view = mission_service.get_missions_view(time_window, level)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return _catalog_response(view, if_none_match)
@@ -1,66 +1,135 @@
 """API routes for receptor data and status."""
-from fastapi import APIRouter, HTTPException, Body, Query
-from typing import List, Optional
+from fastapi import APIRouter, HTTPException, Body, Query, WebSocket, WebSocketDisconnect
+from fastapi.responses import Response, StreamingResponse
+from pydantic import ValidationError
+from typing import Any, Dict, List, Literal, Optional
+import asyncio
+import json
+import orjson
 from services.receptor_service import receptor_service
-from models.nutrition import NutrientInput
+from models.nutrition import NutrientInput, ReceptorEfficiency, SystemStatus
+from services.receptor_session import RESYNC, ReceptorSession, receptor_sessions
+from services.absorption_timeline import absorption_timeline
+from services.interaction_graph import interaction_graph
+from services.supplement_scheduler import (
+    DEFAULT_TIME_BUDGET_SECONDS,
+    MAX_TIME_BUDGET_SECONDS,
+    supplement_scheduler,
+)
 
 router = APIRouter(prefix="/api/receptors", tags=["receptors"])
 
+# Nutrient lists evaluated per engine pass when streaming batch results
+BATCH_CHUNK_SIZE = 256
+
+# Idle seconds before an SSE stream sends a keep-alive comment
+SSE_KEEPALIVE_SECONDS = 15
+
 
 @router.post("/status")
 async def get_receptor_status(
     nutrients: List[NutrientInput] = Body(...),
-    user_id: Optional[str] = Query(None)
+    user_id: Optional[str] = Query(None),
+    mode: Literal["snapshot", "timeline"] = Query("snapshot")
+):
+    """Calculate receptor status based on nutrient inputs.
+    
+    ``mode=timeline`` applies competition and synergy only between intakes
+    whose ``timing`` falls within the interaction windows.
+    """
+    if mode == "timeline":
+        status = absorption_timeline.evaluate(nutrients)
+    else:
+        status = receptor_service.get_receptor_status(nutrients, user_id)
+    
+    return _json_response({
+        "success": True,
+        "data": _format_receptor_status(status, nutrients)
+    })
+
+
+@router.post("/interactions")
+async def find_nutrient_interactions(nutrients: List[NutrientInput] = Body(...)):
+    """Find every competing and synergistic nutrient pair in a day's log.
+    
+    Only the interaction edges of the logged nutrients are visited, so this
+    is cheap enough to run on every log edit.
+    """
+    return {
+        "success": True,
+        "data": interaction_graph.find_interactions(nutrients)
+    }
+
+
+@router.post("/schedule")
+async def optimize_supplement_schedule(
+    nutrients: List[NutrientInput] = Body(...),
+    time_budget: float = Query(DEFAULT_TIME_BUDGET_SECONDS, gt=0, le=MAX_TIME_BUDGET_SECONDS)
 ):
-    """Calculate receptor status based on nutrient inputs."""
-    status = receptor_service.get_receptor_status(nutrients, user_id)
+    """Assign each supplement or food to a morning/midday/afternoon/evening window.
+    
+    The schedule maximizes receptor efficiency under the competition,
+    synergy and timing rules. Items with a ``timing`` stay in the window it
+    falls in. The search runs in a worker process; when ``time_budget``
+    seconds run out the best schedule found so far is returned with
+    ``optimal: false``.
+    """
+    return {
+        "success": True,
+        "data": await supplement_scheduler.optimize(nutrients, time_budget)
+    }
+
+
+@router.get("/interactions/graph")
+async def get_interaction_graph():
+    """Get the compiled nutrient interaction graph as an adjacency list."""
+    return {
+        "success": True,
+        "data": interaction_graph.to_dict(),
+        "edge_count": interaction_graph.edge_count
+    }
+
+
+@router.post("/status/batch")
+async def get_receptor_status_batch(
+    nutrient_lists: Dict[str, List[NutrientInput]] = Body(...)
+):
+    """Calculate receptor status for many users or meals in one call.
+    
+    The body maps a user or meal ID to its nutrient list. Lists are evaluated
+    together in chunks and streamed back as NDJSON, one ``{"id", "data"}``
+    line per entry, with ``data`` shaped exactly like ``/status``.
+    """
+    def generate():
+        items = list(nutrient_lists.items())
+        for offset in range(0, len(items), BATCH_CHUNK_SIZE):
+            chunk = items[offset:offset + BATCH_CHUNK_SIZE]
+            statuses = receptor_service.get_receptor_status_batch(
+                [nutrients for _, nutrients in chunk]
+            )
+            for (entry_id, nutrients), status in zip(chunk, statuses):
+                line = {
+                    "id": entry_id,
+                    "data": _format_receptor_status(status, nutrients)
+                }
+                yield orjson.dumps(line) + b"\n"
     
-    # Convert to frontend-friendly format with clusters
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
+def _format_receptor_status(
+    status: Dict[str, SystemStatus],
+    nutrients: List[NutrientInput]
+) -> Dict[str, Any]:
+    """Convert service results to the frontend-friendly format with clusters."""
+    templates = _cluster_templates()
     status_dict = {}
     for system_key, system_status in status.items():
-        # Get system data
-        system_data = receptor_service.receptor_data.get(system_key, {})
-        
-        # Create clusters from receptors
-        clusters = []
-        for receptor_key, receptor_info in system_data.get('receptors', {}).items():
-            # Find corresponding efficiency data
-            receptor_efficiency = next(
-                (rd for rd in system_status.receptor_details 
-                 if receptor_info.get('primary_receptor', '').lower() in rd.receptor_type.value.lower()),
-                None
-            )
-            
-            # Determine status based on efficiency
-            efficiency = receptor_efficiency.efficiency_percentage if receptor_efficiency else 100
-            if efficiency >= 90:
-                status_level = 'optimal'
-            elif efficiency >= 70:
-                status_level = 'good'
-            elif efficiency >= 50:
-                status_level = 'attention'
-            else:
-                status_level = 'concern'
-            
-            # Get current nutrients affecting this receptor
-            current_nutrients = []
-            if receptor_efficiency:
-                current_nutrients = (
-                    receptor_efficiency.enhancement_factors + 
-                    receptor_efficiency.limiting_factors
-                )
-            
-            clusters.append({
-                "id": receptor_key,
-                "name": receptor_info.get("name", receptor_key),
-                "icon": receptor_info.get("icon", "🔬"),
-                "description": receptor_info.get("description", ""),
-                "status": status_level,
-                "efficiency": int(efficiency),
-                "receptors": [receptor_info.get("primary_receptor", "")],
-                "currentNutrients": current_nutrients,
-                "recommendations": receptor_info.get("recommendations", [])
-            })
+        details = system_status.receptor_details
+        clusters = [
+            _format_cluster(template, details.get(receptor_key))
+            for receptor_key, template in templates.get(system_key, {}).items()
+        ]
         
         # Generate dynamic commentary
         commentary = receptor_service.generate_expert_commentary(
@@ -79,9 +148,309 @@ async def get_receptor_status(
             "notes": system_status.notes
         }
     
+    return status_dict
+
+
+# data_version -> system -> receptor key -> static cluster fields
+_template_cache: Dict[int, Dict[str, Dict[str, Dict[str, Any]]]] = {}
+
+
+def _cluster_templates() -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """Static part of every cluster entry, built once per dataset version."""
+    data_version = receptor_service.data_version
+    templates = _template_cache.get(data_version)
+    if templates is None:
+        templates = {
+            system_key: {
+                receptor_key: {
+                    "id": receptor_key,
+                    "name": receptor_info.get("name", receptor_key),
+                    "icon": receptor_info.get("icon", "🔬"),
+                    "description": receptor_info.get("description", ""),
+                    "receptors": [receptor_info.get("primary_receptor", "")],
+                    "recommendations": receptor_info.get("recommendations", [])
+                }
+                for receptor_key, receptor_info in system_data.get('receptors', {}).items()
+            }
+            for system_key, system_data in receptor_service.receptor_data.items()
+        }
+        _template_cache.clear()
+        _template_cache[data_version] = templates
+    return templates
+
+
+def _format_cluster(
+    template: Dict[str, Any],
+    receptor_efficiency: Optional[ReceptorEfficiency]
+) -> Dict[str, Any]:
+    """Build the frontend cluster entry for one receptor from its template."""
+    # Determine status based on efficiency
+    efficiency = receptor_efficiency.efficiency_percentage if receptor_efficiency else 100
+    if efficiency >= 90:
+        status_level = 'optimal'
+    elif efficiency >= 70:
+        status_level = 'good'
+    elif efficiency >= 50:
+        status_level = 'attention'
+    else:
+        status_level = 'concern'
+    
+    # Get current nutrients affecting this receptor
+    current_nutrients = []
+    if receptor_efficiency:
+        current_nutrients = (
+            receptor_efficiency.enhancement_factors + 
+            receptor_efficiency.limiting_factors
+        )
+    
+    return {
+        **template,
+        "status": status_level,
+        "efficiency": int(efficiency),
+        "currentNutrients": current_nutrients
+    }
+
+
+def _json_response(payload: Dict[str, Any]) -> Response:
+    """Serialize an already JSON-ready payload with orjson.
+    
+    Skips FastAPI's ``jsonable_encoder`` walk, which dominates the cost of
+    large status responses.
+    """
+    return Response(content=orjson.dumps(payload), media_type="application/json")
+
+
+@router.get("/session/{user_id}")
+async def get_session_status(user_id: str):
+    """Get the full receptor status of a user's incremental session."""
+    session = receptor_sessions.get_or_create(user_id)
+    return _json_response({
+        "success": True,
+        "version": session.version,
+        "data": _format_receptor_status(session.status(), session.nutrients)
+    })
+
+
+@router.post("/session/{user_id}/add")
+async def add_session_nutrient(user_id: str, nutrient: NutrientInput = Body(...)):
+    """Log one nutrient and return only the clusters whose status changed."""
+    session = receptor_sessions.get_or_create(user_id)
+    delta = _publish_delta(user_id, session, session.add(nutrient))
+    return _json_response({
+        "success": True,
+        "version": delta["version"],
+        "data": delta["data"]
+    })
+
+
+@router.post("/session/{user_id}/remove")
+async def remove_session_nutrient(user_id: str, nutrient: NutrientInput = Body(...)):
+    """Remove one logged nutrient and return only the changed clusters."""
+    session = receptor_sessions.get_or_create(user_id)
+    try:
+        diff = session.remove(nutrient)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    
+    delta = _publish_delta(user_id, session, diff)
+    return _json_response({
+        "success": True,
+        "version": delta["version"],
+        "data": delta["data"]
+    })
+
+
+@router.delete("/session/{user_id}")
+async def reset_session(user_id: str):
+    """Discard a user's incremental receptor session."""
+    receptor_sessions.reset(user_id)
+    if receptor_sessions.subscribers.get(user_id):
+        receptor_sessions.publish(user_id, _session_snapshot(user_id))
+    return {
+        "success": True,
+        "message": "Receptor session reset successfully"
+    }
+
+
+@router.websocket("/ws/{user_id}")
+async def receptor_status_socket(websocket: WebSocket, user_id: str):
+    """Live receptor status for a user's session.
+    
+    The server sends a full ``status`` message on connect, then a ``delta``
+    message with only the changed systems and clusters after every change
+    to the session, whichever connection made it. Clients send JSON
+    events:
+    
+    - ``{"action": "add", "nutrient": {...}}``
+    - ``{"action": "remove", "nutrient": {...}}``
+    - ``{"action": "reset"}``
+    - ``{"action": "status"}`` to ask for a full snapshot again
+    
+    Invalid events, binary frames included, are answered with an
+    ``error`` message on this connection only.
+    """
+    await websocket.accept()
+    queue = receptor_sessions.subscribe(user_id)
+    queue.put_nowait(_session_snapshot(user_id))
+    
+    async def push():
+        while True:
+            message = await queue.get()
+            if message is RESYNC:
+                message = _session_snapshot(user_id)
+            await websocket.send_text(orjson.dumps(message).decode())
+    
+    pusher = asyncio.create_task(push())
+    try:
+        while True:
+            frame = await websocket.receive()
+            if frame["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(frame.get("code", 1000))
+            if frame.get("text") is None:
+                receptor_sessions.send(queue, {"type": "error", "detail": "Events must be JSON text frames"})
+                continue
+            try:
+                event = json.loads(frame["text"])
+            except json.JSONDecodeError:
+                event = None
+            error = _apply_session_event(user_id, event, queue)
+            if error:
+                receptor_sessions.send(queue, {"type": "error", "detail": error})
+    except WebSocketDisconnect:
+        pass
+    finally:
+        pusher.cancel()
+        receptor_sessions.unsubscribe(user_id, queue)
+
+
+@router.get("/session/{user_id}/events")
+async def stream_session_events(user_id: str):
+    """Server-sent events fallback for clients that cannot open a WebSocket.
+    
+    Streams the same ``status`` and ``delta`` messages as ``/ws/{user_id}``;
+    changes are made through the ``/session/{user_id}`` REST endpoints.
+    """
+    queue = receptor_sessions.subscribe(user_id)
+    queue.put_nowait(_session_snapshot(user_id))
+    
+    async def generate():
+        try:
+            while True:
+                try:
+                    message = await asyncio.wait_for(queue.get(), SSE_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                if message is RESYNC:
+                    message = _session_snapshot(user_id)
+                yield f"event: {message['type']}\ndata: {orjson.dumps(message).decode()}\n\n"
+        finally:
+            receptor_sessions.unsubscribe(user_id, queue)
+    
+    return StreamingResponse(
+        generate(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+def _apply_session_event(
+    user_id: str,
+    event: Any,
+    queue: "asyncio.Queue"
+) -> Optional[str]:
+    """Apply one WebSocket event to the session; return an error message if invalid."""
+    if not isinstance(event, dict):
+        return "Event must be a JSON object"
+    
+    action = event.get("action")
+    if action == "status":
+        receptor_sessions.send(queue, _session_snapshot(user_id))
+        return None
+    if action == "reset":
+        receptor_sessions.reset(user_id)
+        receptor_sessions.publish(user_id, _session_snapshot(user_id))
+        return None
+    if action not in ("add", "remove"):
+        return f"Unknown action: {action}"
+    
+    try:
+        nutrient = NutrientInput.model_validate(event.get("nutrient"))
+    except ValidationError as e:
+        return f"Invalid nutrient: {e.errors()[0]['msg']}"
+    
+    session = receptor_sessions.get_or_create(user_id)
+    try:
+        diff = session.add(nutrient) if action == "add" else session.remove(nutrient)
+    except ValueError as e:
+        return str(e)
+    
+    _publish_delta(user_id, session, diff)
+    return None
+
+
+def _session_snapshot(user_id: str) -> Dict[str, Any]:
+    """Full ``status`` push message for a user's session."""
+    session = receptor_sessions.get_or_create(user_id)
+    return {
+        "type": "status",
+        "version": session.version,
+        "data": _format_receptor_status(session.status(), session.nutrients)
+    }
+
+
+def _publish_delta(
+    user_id: str,
+    session: ReceptorSession,
+    diff: Dict[str, Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Format a session diff once and push it to the user's live connections."""
+    delta = {
+        "type": "delta",
+        "version": session.version,
+        "data": _format_session_diff(diff)
+    }
+    receptor_sessions.publish(user_id, delta)
+    return delta
+
+
+def _format_session_diff(diff: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Format a session diff with the same cluster entries as ``/status``."""
+    templates = _cluster_templates()
+    formatted = {}
+    for system_key, system_diff in diff.items():
+        system_templates = templates.get(system_key, {})
+        formatted[system_key] = {
+            "efficiency": system_diff["efficiency"],
+            "notes": system_diff["notes"],
+            "clusters": [
+                _format_cluster(
+                    system_templates.get(rd.receptor_id, {"id": rd.receptor_id}), rd
+                )
+                for rd in system_diff["receptors"]
+            ]
+        }
+    return formatted
+
+
+@router.get("/cache/stats")
+async def get_status_cache_stats():
+    """Get hit/miss/eviction counters for the receptor status cache."""
     return {
         "success": True,
-        "data": status_dict
+        "data": receptor_service.get_cache_stats()
+    }
+
+
+@router.post("/reload")
+async def reload_receptor_data():
+    """Reload the receptor dataset, interaction graph and timing windows, invalidating cached statuses."""
+    data_version = receptor_service.reload_receptor_data()
+    interaction_graph.reload()
+    absorption_timeline.reload()
+    return {
+        "success": True,
+        "data_version": data_version
     }
 
 
@@ -98,6 +467,49 @@ async def get_receptor_info(receptor_name: str):
     }
 
 
+@router.get("/by-receptor/{receptor}")
+async def get_clusters_by_receptor(receptor: str):
+    """Find clusters by primary receptor name, full name or cluster ID."""
+    return _lookup_response('receptor', receptor)
+
+
+@router.get("/by-gene/{gene}")
+async def get_clusters_by_gene(gene: str):
+    """Find clusters by gene symbol (e.g. SLC11A2)."""
+    return _lookup_response('gene', gene)
+
+
+@router.get("/by-protein/{protein}")
+async def get_clusters_by_protein(protein: str):
+    """Find clusters by supporting protein (e.g. Ferroportin)."""
+    return _lookup_response('protein', protein)
+
+
+@router.get("/by-substrate/{substrate}")
+async def get_clusters_by_substrate(substrate: str):
+    """Find clusters carrying a substrate; nutrient aliases are accepted."""
+    return _lookup_response('substrate', substrate)
+
+
+@router.get("/by-location/{location}")
+async def get_clusters_by_location(location: str):
+    """Find clusters by tissue location (full text or any comma-separated part)."""
+    return _lookup_response('location', location)
+
+
+def _lookup_response(kind: str, key: str) -> Dict[str, Any]:
+    """Resolve a secondary-index lookup into the standard response shape."""
+    matches = receptor_service.lookup_receptors(kind, key)
+    if not matches:
+        raise HTTPException(status_code=404, detail=f"No receptor cluster found for {kind}: {key}")
+    
+    return {
+        "success": True,
+        "data": matches,
+        "count": len(matches)
+    }
+
+
 @router.get("/system/{system}")
 async def get_system_receptors(system: str):
     """Get all receptors for a specific body system."""
@@ -0,0 +1,150 @@
+"""Time-aware receptor evaluation honoring the interaction matrix timing rules."""
+import re
+from bisect import bisect_left
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from models.nutrition import NutrientInput, SystemStatus
+from services.interaction_graph import InteractionGraph, interaction_graph
+from services.receptor_service import CompiledReceptor, ReceptorService, receptor_service
+from utils.dose_response import dose_mg
+from utils.nutrient_resolver import nutrient_resolver
+from utils.timing import local_naive
+
+
+# Interaction windows read off the "Comprehensive Interaction Matrix" of
+# complete_receptor_mapping.md. A factor only acts on a receptor when it is
+# taken within this window of the receptor's substrate. Durations the
+# matrix's timing rules state take precedence; these cover the pairs it
+# gives none for.
+TIMING_WINDOWS: Dict[frozenset, timedelta] = {
+    # Competition: "separate from calcium by 2+ hours"
+    frozenset({'iron', 'calcium'}): timedelta(hours=2),
+    frozenset({'iron', 'zinc'}): timedelta(hours=2),
+    frozenset({'iron', 'copper'}): timedelta(hours=2),
+    frozenset({'iron', 'manganese'}): timedelta(hours=2),
+    frozenset({'calcium', 'magnesium'}): timedelta(hours=2),
+    # Synergy: vitamin C must be in the gut alongside the iron
+    frozenset({'iron', 'vitamin_c'}): timedelta(hours=1),
+    frozenset({'iron', 'empty_stomach'}): timedelta(minutes=30),
+    # Synergy: vitamin D/K act through expression and activation, so they
+    # support calcium uptake for the whole day
+    frozenset({'calcium', 'vitamin_d'}): timedelta(hours=24),
+    frozenset({'calcium', 'vitamin_k'}): timedelta(hours=24),
+}
+DEFAULT_INTERACTION_WINDOW = timedelta(hours=2)
+
+# "separate from calcium by 2+ hours" in a timing rule
+SEPARATION_RULE = re.compile(
+    r'separate from (?P<other>[\w\s-]+?) by (?P<amount>\d+(?:\.\d+)?)\+? ?(?P<unit>hours?|minutes?)',
+    re.IGNORECASE
+)
+
+
+class AbsorptionTimeline:
+    """Evaluate a day's timestamped nutrient log against the receptors.
+
+    Substrate intake times are kept in sorted per-nutrient arrays, so
+    checking whether a factor intake falls inside a window of any
+    substrate intake is a binary search. A full day therefore evaluates in
+    O(n log n) instead of comparing every pair of intakes.
+
+    Intakes without a ``timing`` are treated as overlapping every window,
+    which matches the snapshot behaviour of ``get_receptor_status``.
+    Receptors whose substrate was not taken at all are evaluated like the
+    snapshot mode, since there is no intake to anchor a window to.
+    """
+
+    def __init__(self, service: ReceptorService, graph: InteractionGraph):
+        self.service = service
+        self.graph = graph
+        self.reload()
+
+    def reload(self) -> None:
+        """Rebuild the windows from the interaction graph's current timing rules."""
+        self.windows: Dict[frozenset, timedelta] = dict(TIMING_WINDOWS)
+        for canonical_id, rules in self.graph.timing_rules.items():
+            for rule in rules:
+                for match in SEPARATION_RULE.finditer(rule):
+                    amount = float(match.group('amount'))
+                    unit = match.group('unit').lower()
+                    window = timedelta(hours=amount) if unit.startswith('hour') else timedelta(minutes=amount)
+                    other_id = nutrient_resolver.resolve(match.group('other'))
+                    self.windows[frozenset({canonical_id, other_id})] = window
+
+    def window_for(self, factor_id: str, substrate_id: str) -> timedelta:
+        """Interaction window between a factor and a receptor substrate."""
+        return self.windows.get(
+            frozenset({factor_id, substrate_id}), DEFAULT_INTERACTION_WINDOW
+        )
+
+    def evaluate(self, nutrients: List[NutrientInput]) -> Dict[str, SystemStatus]:
+        """Calculate receptor status applying interactions only within windows."""
+        intakes: List[Tuple[str, Optional[datetime], float]] = []
+        for n in nutrients:
+            canonical_id = nutrient_resolver.resolve(n.name)
+            intakes.append((canonical_id, n.timing, dose_mg(canonical_id, n.amount, n.unit)))
+
+        # Sorted intake times per canonical nutrient; untimed intakes flagged
+        timed: Dict[str, List[datetime]] = {}
+        untimed = set()
+        for canonical_id, timing, _ in intakes:
+            if timing is None:
+                untimed.add(canonical_id)
+            else:
+                timed.setdefault(canonical_id, []).append(local_naive(timing))
+        for times in timed.values():
+            times.sort()
+
+        # Effective factor doses per receptor
+        receptor_doses: Dict[Tuple[str, str], Dict[str, float]] = {}
+        for canonical_id, timing, dose in intakes:
+            for receptor in self.service.receptors_by_nutrient.get(canonical_id, []):
+                if self._in_window(receptor, canonical_id, timing, timed, untimed):
+                    doses = receptor_doses.setdefault((receptor.system, receptor.key), {})
+                    doses[canonical_id] = doses.get(canonical_id, 0.0) + dose
+
+        status = {}
+        now = datetime.now()
+        empty: Dict[str, float] = {}
+        for system_key, receptors in self.service.compiled_receptors.items():
+            receptor_efficiencies = [
+                self.service._calculate_receptor_efficiency(
+                    receptor, receptor_doses.get((system_key, receptor.key), empty)
+                )
+                for receptor in receptors
+            ]
+            status[system_key] = self.service.build_system_status(
+                system_key, receptor_efficiencies, now
+            )
+
+        return status
+
+    def _in_window(
+        self,
+        receptor: CompiledReceptor,
+        factor_id: str,
+        timing: Optional[datetime],
+        timed: Dict[str, List[datetime]],
+        untimed: set
+    ) -> bool:
+        """True if a factor intake overlaps some intake of the receptor's substrate."""
+        taken = [s for s in receptor.substrate_ids if s in timed or s in untimed]
+        if not taken or timing is None:
+            return True
+
+        moment = local_naive(timing)
+        for substrate_id in taken:
+            if substrate_id in untimed:
+                return True
+            times = timed[substrate_id]
+            window = self.window_for(factor_id, substrate_id)
+            # First substrate intake not earlier than the window start
+            idx = bisect_left(times, moment - window)
+            if idx < len(times) and times[idx] <= moment + window:
+                return True
+        return False
+
+
+# Singleton instance
+absorption_timeline = AbsorptionTimeline(receptor_service, interaction_graph)
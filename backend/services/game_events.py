@@ -0,0 +1,196 @@
+"""Append-only logs of game progress events, one NDJSON stream per user."""
+import abc
+import logging
+import os
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from pathlib import Path
+from typing import Any, ContextManager, Dict, Iterator, List, Sequence, Tuple
+from urllib.parse import quote, unquote
+
+import orjson
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process log locking
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+GAME_EVENTS_PATH = Path(
+    os.getenv("GAME_EVENTS_DIR", Path(__file__).parent.parent.parent / 'data' / 'game_events')
+)
+
+# Bytes read from the end of a stream when looking for recent events,
+# growing fourfold until the oldest one wanted is covered
+TAIL_CHUNK_BYTES = 16 * 1024
+
+# Event types recorded by GameService
+MISSION_COMPLETE = "mission_complete"
+LEVEL_UP = "level_up"
+RESET = "reset"
+
+
+def encode_events(events: Sequence[Dict[str, Any]]) -> bytes:
+    """NDJSON lines for a batch of events."""
+    return b''.join(orjson.dumps(event) + b'\n' for event in events)
+
+
+class GameEventLog(abc.ABC):
+    """Where a user's game events are appended and read back.
+
+    Each event is one JSON line. Positions are byte offsets into the
+    user's stream, so a snapshot can record how far it got and a rebuild
+    reads only the lines after it. A torn last line (a crash mid-write)
+    is ignored, and a malformed line is skipped with a warning.
+    """
+
+    def locked(self, user_id: str) -> ContextManager[None]:
+        """Hold a user's stream exclusively, across processes where the log is shared.
+
+        Appending while holding it guarantees no other writer logged
+        events between reading the stream's tail and the append.
+        """
+        return nullcontext()
+
+    @abc.abstractmethod
+    def append(self, user_id: str, events: Sequence[Dict[str, Any]]) -> int:
+        """Append events in one write; returns the user's stream length after them."""
+
+    @abc.abstractmethod
+    def _read_bytes(self, user_id: str, offset: int) -> bytes:
+        """The user's stream from ``offset`` to its end."""
+
+    @abc.abstractmethod
+    def size(self, user_id: str) -> int:
+        """Length of the user's stream (0 if there is none)."""
+
+    @abc.abstractmethod
+    def users(self) -> List[str]:
+        """Every user with a stream."""
+
+    def read(self, user_id: str, offset: int = 0) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """Events after ``offset``, each with the offset just past it."""
+        return self._parse(user_id, self._read_bytes(user_id, offset), offset)
+
+    def read_since(self, user_id: str, since: datetime) -> List[Dict[str, Any]]:
+        """Events logged at or after ``since``, oldest first.
+
+        Events are appended in time order, so this reads back from the end
+        of the stream only until it reaches an earlier event.
+        """
+        size = self.size(user_id)
+        chunk = TAIL_CHUNK_BYTES
+        while True:
+            offset = max(0, size - chunk)
+            data = self._read_bytes(user_id, offset)
+            if offset:
+                # Start at the first line boundary inside the chunk
+                start = data.find(b'\n') + 1
+                if not start:
+                    chunk *= 4
+                    continue
+                data, offset = data[start:], offset + start
+            events = [event for _, event in self._parse(user_id, data, offset)]
+            if offset == 0 or (events and datetime.fromisoformat(events[0]['at']) < since):
+                return [event for event in events if datetime.fromisoformat(event['at']) >= since]
+            chunk *= 4
+
+    def _parse(self, user_id: str, data: bytes, offset: int) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """Events in complete lines of ``data``, which starts at ``offset``."""
+        start = 0
+        while True:
+            end = data.find(b'\n', start)
+            if end < 0:
+                return
+            try:
+                event = orjson.loads(data[start:end])
+            except orjson.JSONDecodeError:
+                logger.warning(
+                    f"Skipping malformed line at offset {offset + start} of {user_id}'s game events"
+                )
+            else:
+                yield offset + end + 1, event
+            start = end + 1
+
+    def close(self) -> None:
+        """Release the log's resources."""
+
+
+class MemoryGameEventLog(GameEventLog):
+    """Keeps the streams in process memory; nothing survives a restart."""
+
+    def __init__(self):
+        self.streams: Dict[str, bytearray] = {}
+
+    def append(self, user_id: str, events: Sequence[Dict[str, Any]]) -> int:
+        stream = self.streams.setdefault(user_id, bytearray())
+        stream += encode_events(events)
+        return len(stream)
+
+    def _read_bytes(self, user_id: str, offset: int) -> bytes:
+        return bytes(self.streams.get(user_id, b'')[offset:])
+
+    def size(self, user_id: str) -> int:
+        return len(self.streams.get(user_id, b''))
+
+    def users(self) -> List[str]:
+        return list(self.streams)
+
+
+class NDJSONGameEventLog(GameEventLog):
+    """One ``<user>.ndjson`` file per user in a directory.
+
+    Appends go straight to the OS (no fsync per event). ``locked`` takes
+    an ``flock`` on the user's file, so server processes sharing the
+    directory serialize their appends; within a process GameService's
+    user locks do the same.
+    """
+
+    def __init__(self, directory: Path = GAME_EVENTS_PATH):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def path_for(self, user_id: str) -> Path:
+        """Log file of a user; the ID is percent-encoded to a safe filename."""
+        return self.directory / f"{quote(user_id, safe='')}.ndjson"
+
+    @contextmanager
+    def locked(self, user_id: str) -> Iterator[None]:
+        with open(self.path_for(user_id), 'ab') as f:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+    def append(self, user_id: str, events: Sequence[Dict[str, Any]]) -> int:
+        with open(self.path_for(user_id), 'a+b') as f:
+            data = encode_events(events)
+            size = f.seek(0, os.SEEK_END)
+            if size:
+                f.seek(size - 1)
+                if f.read(1) != b'\n':
+                    # End a line torn by a crash so it cannot swallow these events
+                    data = b'\n' + data
+            f.write(data)
+            return f.tell()
+
+    def users(self) -> List[str]:
+        return [unquote(path.stem) for path in self.directory.glob('*.ndjson')]
+
+    def _read_bytes(self, user_id: str, offset: int) -> bytes:
+        try:
+            with open(self.path_for(user_id), 'rb') as f:
+                f.seek(offset)
+                return f.read()
+        except FileNotFoundError:
+            return b''
+
+    def size(self, user_id: str) -> int:
+        try:
+            return self.path_for(user_id).stat().st_size
+        except FileNotFoundError:
+            return 0
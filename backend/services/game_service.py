@@ -1,15 +1,47 @@
 """Game service for managing nutrition game state and progress."""
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, Iterator, List, Any, Optional, Sequence, Tuple
+from contextlib import contextmanager
 from datetime import datetime
 from dataclasses import dataclass, field
-from enum import Enum
+import copy
+import logging
+import threading
+import orjson
+from services.game_events import (
+    LEVEL_UP,
+    MISSION_COMPLETE,
+    RESET,
+    GameEventLog,
+    MemoryGameEventLog,
+    NDJSONGameEventLog,
+)
+from data.missions import TimeWindow
+from models.game import MissionCompletion
+from services.mission_service import MissionService, mission_service
+from services.leaderboard import Leaderboard, SQLiteLeaderboard, week_start
+from services.game_store import (
+    GameStateStore,
+    MemoryGameStateStore,
+    SQLiteGameStateStore,
+    WriteBehindQueue,
+)
+from utils.cache import LRUCache
 
+logger = logging.getLogger(__name__)
 
-class TimeWindow(str, Enum):
-    MORNING = "morning"
-    MIDDAY = "midday"
-    AFTERNOON = "afternoon"
-    EVENING = "evening"
+# Game states served from memory without touching the store
+GAME_STATE_CACHE_SIZE = 10_000
+
+# Lock stripes guarding game states; users hashing to different stripes
+# update in parallel
+GAME_STATE_LOCK_SHARDS = 64
+
+# Snapshot a user's state after this many events, bounding the log tail
+# replayed when the state is rebuilt
+GAME_SNAPSHOT_EVERY = 50
+
+# Most requirement ticks accepted in one batch completion
+MAX_BATCH_COMPLETIONS = 100
 
 
 @dataclass
@@ -23,174 +55,560 @@ class GameState:
     level_progress: Dict[str, Dict[str, Any]] = field(default_factory=dict)
     completed_missions: List[str] = field(default_factory=list)
     achievements: List[str] = field(default_factory=list)
+    # Mission ID -> bits of its completed requirements
+    requirement_masks: Dict[str, int] = field(default_factory=dict)
+    # "<time window>/level<N>" -> bits of its completed missions
+    level_masks: Dict[str, int] = field(default_factory=dict)
+    # Content hash of the catalog the masks were built against
+    catalog_hash: str = ""
     last_updated: datetime = field(default_factory=datetime.now)
+    # Event log offset this state has folded up to
+    event_offset: int = 0
+    # Events folded in since the last snapshot
+    events_since_snapshot: int = 0
+
+    def encode(self) -> bytes:
+        """Serialize for a ``GameStateStore``."""
+        return orjson.dumps(self)
+
+    @classmethod
+    def decode(cls, payload: bytes) -> "GameState":
+        """Inverse of ``encode``."""
+        data = orjson.loads(payload)
+        data['last_updated'] = datetime.fromisoformat(data['last_updated'])
+        return cls(**data)
     
 
 class GameService:
-    """Service for managing game state and progress."""
+    """Service for managing game state and progress.
+    
+    Every completion, level-up and reset is appended to the user's
+    ``GameEventLog`` and then folded into the state, so the state is always
+    a replay of the log. Every ``snapshot_every`` events the serialized
+    state goes on a ``WriteBehindQueue`` as a snapshot, which writes it to
+    the ``GameStateStore`` in a batched transaction. A state missing from
+    the in-memory cache is rebuilt from its snapshot plus the few events
+    logged after it.
+    
+    The log, not the store, is the source of truth, so several server
+    processes may share both. Each snapshot records the log offset it
+    covers; a stale one written by another process only lengthens the
+    tail replayed. Cached states are caught up with the log tail on
+    every access rather than trusted.
     
-    def __init__(self):
-        # In a real app, this would be backed by a database
-        self.game_states: Dict[str, GameState] = {}
+    Every read-modify-write of a user's state, and loading it into the
+    cache, holds that user's lock stripe, so updates for one user are
+    serialized and never lose points or double-count a mission while
+    other users proceed in parallel. A write also holds the log's lock
+    on the user's stream and first folds in whatever other server
+    processes logged since, so workers sharing the log never append
+    from a stale state.
+    
+    The leaderboard is updated after the append, keyed by log offset. A
+    failed update is logged rather than failing the already-recorded
+    request; the events it missed are applied from the log with the
+    user's next events, or by ``reconcile_leaderboard`` at startup.
+    """
+    
+    def __init__(
+        self,
+        store: Optional[GameStateStore] = None,
+        events: Optional[GameEventLog] = None,
+        snapshot_every: int = GAME_SNAPSHOT_EVERY,
+        leaderboard: Optional[Leaderboard] = None,
+        missions: Optional[MissionService] = None
+    ):
+        self.store = store if store is not None else MemoryGameStateStore()
+        self.events = events if events is not None else MemoryGameEventLog()
+        self.snapshot_every = snapshot_every
+        self.leaderboard = leaderboard if leaderboard is not None else Leaderboard()
+        self.missions = missions if missions is not None else mission_service
+        self.writes = WriteBehindQueue(self.store)
+        self.game_states = LRUCache(maxsize=GAME_STATE_CACHE_SIZE)
+        self._locks = [threading.RLock() for _ in range(GAME_STATE_LOCK_SHARDS)]
+    
+    def user_lock(self, user_id: str) -> threading.RLock:
+        """The lock serializing changes to a user's state (re-entrant)."""
+        return self._locks[hash(user_id) % GAME_STATE_LOCK_SHARDS]
         
     def get_or_create_game_state(self, user_id: str) -> GameState:
-        """Get existing game state or create new one."""
-        if user_id not in self.game_states:
-            self.game_states[user_id] = GameState(
-                user_id=user_id,
-                level_progress={
-                    "level1": {
-                        "completed": 0,
-                        "total": 4,
-                        "canLevelUp": False,
-                        "leveledUpAt": None
-                    },
-                    "level2": {
-                        "locked": True,
-                        "completed": 0,
-                        "total": 3,
-                        "canLevelUp": False,
-                        "leveledUpAt": None
-                    },
-                    "level3": {
-                        "locked": True,
-                        "completed": 0,
-                        "total": 2,
-                        "canLevelUp": False,
-                        "leveledUpAt": None
-                    }
-                }
-            )
-        return self.game_states[user_id]
+        """Get existing game state or create new one.
+        
+        A cached state is first caught up with the log, so it includes
+        events other server processes recorded. Callers that modify the
+        returned state must do so in ``_mutating``.
+        """
+        with self.user_lock(user_id):
+            game_state = self.game_states.get(user_id)
+            if game_state is None:
+                game_state = self._rebuild_game_state(user_id)
+            else:
+                game_state = self._catch_up(game_state)
+            self.game_states.put(user_id, game_state)
+        return game_state
     
-    def complete_mission(
-        self, 
+    def _rebuild_game_state(self, user_id: str) -> GameState:
+        """Latest snapshot (flushed or not) plus the events logged after it."""
+        found, payload = self.writes.pending(user_id)
+        if not found:
+            payload = self.store.load(user_id)
+        game_state = (
+            GameState.decode(payload) if payload is not None else self._new_game_state(user_id)
+        )
+        return self._catch_up(game_state)
+    
+    def _catch_up(self, game_state: GameState) -> GameState:
+        """Fold the events logged after the state's offset into it.
+        
+        Besides rebuilding from a snapshot, this picks up events another
+        server process appended to the shared log.
+        """
+        for offset, event in self.events.read(game_state.user_id, game_state.event_offset):
+            game_state = self._apply_event(game_state, event)
+            game_state.event_offset = offset
+            game_state.events_since_snapshot += 1
+        return game_state
+    
+    @contextmanager
+    def _mutating(self, user_id: str) -> Iterator[GameState]:
+        """Hold the user's lock and log lock and yield the state, caught up with the log.
+        
+        Everything other processes logged is folded in before the caller
+        records its events, so no append is made from a stale state.
+        """
+        with self.user_lock(user_id), self.events.locked(user_id):
+            yield self.get_or_create_game_state(user_id)
+    
+    def _record(self, game_state: GameState, events: Sequence[Dict[str, Any]]) -> GameState:
+        """Fold events into a copy of the state, log them in one append and commit.
+        
+        Must be called inside ``_mutating``. All events are applied or
+        none: if folding fails nothing is logged and the cached state is
+        untouched. The new state replaces the cached one, snapshotted
+        when due, and is returned; then the leaderboard counts the events.
+        """
+        user_id = game_state.user_id
+        at = datetime.now().isoformat()
+        # A serialization round trip copies several times faster than deepcopy
+        next_state = GameState.decode(game_state.encode())
+        for event in events:
+            event['at'] = at
+            next_state = self._apply_event(next_state, event)
+        
+        next_state.event_offset = self.events.append(user_id, events)
+        next_state.events_since_snapshot += len(events)
+        if (
+            next_state.events_since_snapshot >= self.snapshot_every
+            or any(event['type'] == RESET for event in events)
+        ):
+            self._snapshot(next_state)
+        self.game_states.put(user_id, next_state)
+        self._update_leaderboard(
+            user_id, [(next_state.event_offset, event) for event in events], game_state.event_offset
+        )
+        return next_state
+    
+    def _update_leaderboard(
+        self,
         user_id: str,
-        mission_id: str,
-        completion_data: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        """Handle mission completion."""
-        game_state = self.get_or_create_game_state(user_id)
+        events: Sequence[Tuple[int, Dict[str, Any]]],
+        start: int
+    ) -> None:
+        """Count newly logged events, first catching up any the leaderboard missed.
+        
+        Must be called holding the user's lock and log lock. The events
+        are already logged, so a leaderboard error is logged, not raised.
+        """
+        try:
+            if not self.leaderboard.apply(user_id, events, start):
+                self._catch_up_leaderboard(user_id)
+        except Exception:
+            logger.exception(f"Leaderboard update for {user_id} failed; will retry from the log")
+    
+    def _catch_up_leaderboard(self, user_id: str) -> bool:
+        """Apply the user's logged events past the leaderboard's offset, if any.
+        
+        Must be called holding the user's lock and log lock, so the events
+        read are all there is to apply.
+        """
+        start = self.leaderboard.offset(user_id)
+        events = list(self.events.read(user_id, start))
+        return bool(events) and self.leaderboard.apply(user_id, events, start)
+    
+    def _snapshot(self, game_state: GameState) -> None:
+        """Queue the state for the next batched write."""
+        game_state.events_since_snapshot = 0
+        self.writes.put(game_state.user_id, game_state.encode())
+    
+    def _apply_event(self, game_state: GameState, event: Dict[str, Any]) -> GameState:
+        """Fold one logged event into a state."""
+        kind = event['type']
+        if kind == RESET:
+            game_state = self._new_game_state(game_state.user_id)
+        elif kind == MISSION_COMPLETE:
+            self._sync_progress(game_state)
+            self._apply_mission_complete(game_state, event)
+        elif kind == LEVEL_UP:
+            self._sync_progress(game_state)
+            self._apply_level_up(game_state, event)
+        else:
+            raise ValueError(f"Unknown game event type: {kind}")
+        game_state.last_updated = datetime.fromisoformat(event['at'])
+        return game_state
+    
+    def _sync_progress(self, game_state: GameState) -> None:
+        """Rebuild the masks and level counts if the catalog changed since they were built.
+        
+        Mask bits follow catalog order, so after a reload they are
+        recomputed from ``requirement_progress`` and ``completed_missions``
+        instead of being trusted.
+        """
+        catalog = self.missions.catalog
+        if game_state.catalog_hash == catalog.content_hash:
+            return
+        game_state.requirement_masks = {}
+        for mission_id, requirements in game_state.requirement_progress.items():
+            mask = 0
+            for requirement_id in requirements:
+                mask |= catalog.requirement_bits.get((mission_id, requirement_id), 0)
+            game_state.requirement_masks[mission_id] = mask
+        game_state.level_masks = {}
+        for mission_id in game_state.completed_missions:
+            if mission_id in catalog.level_bits:
+                time_window, level, bit = catalog.level_bits[mission_id]
+                mask_key = f"{time_window}/level{level}"
+                game_state.level_masks[mask_key] = game_state.level_masks.get(mask_key, 0) | bit
+        game_state.catalog_hash = catalog.content_hash
+        for level in catalog.level_mission_counts:
+            level_key = f"level{level}"
+            if level_key not in game_state.level_progress:
+                progress = {
+                    "completed": 0,
+                    "total": 0,
+                    "canLevelUp": False,
+                    "leveledUpAt": None
+                }
+                # Only the first level starts unlocked
+                game_state.level_progress[level_key] = {"locked": True, **progress} if level > 1 else progress
+            self._refresh_level_progress(game_state, level)
+    
+    def _refresh_level_progress(self, game_state: GameState, level: int) -> None:
+        """Recount a level's progress in each time window from the level masks.
+        
+        A window can level up once all of its missions at that level are
+        complete. The level's own counts show the window furthest along.
+        """
+        level_key = f"level{level}"
+        level_data = game_state.level_progress[level_key]
+        previous = level_data.get('windows', {})
+        windows = {}
+        for time_window, total in self.missions.catalog.level_mission_counts.get(level, {}).items():
+            completed = game_state.level_masks.get(f"{time_window}/{level_key}", 0).bit_count()
+            leveled_up_at = previous.get(time_window, {}).get('leveledUpAt')
+            windows[time_window] = {
+                "completed": completed,
+                "total": total,
+                "canLevelUp": completed >= total and leveled_up_at is None,
+                "leveledUpAt": leveled_up_at
+            }
+        level_data['windows'] = windows
+        if windows:
+            furthest = max(windows.values(), key=lambda w: w['completed'] / w['total'])
+            level_data['completed'] = furthest['completed']
+            level_data['total'] = furthest['total']
+        level_data['canLevelUp'] = any(w['canLevelUp'] for w in windows.values())
+    
+    def _mission_complete(self, game_state: GameState, mission_id: str) -> bool:
+        """Whether all of a mission's requirements are done (False if unknown)."""
+        self._sync_progress(game_state)
+        full_mask = self.missions.catalog.requirement_masks.get(mission_id)
+        if full_mask is None:
+            return False
+        return game_state.requirement_masks.get(mission_id, 0) & full_mask == full_mask
+    
+    def _level_up_available(self, game_state: GameState, mission_ids: Sequence[str]) -> bool:
+        """Whether the current level can level up in the window of any of these missions.
+        
+        Missions the catalog does not know fall back to the level as a whole.
+        """
+        level_data = game_state.level_progress.get(f"level{game_state.current_level}", {})
+        windows = level_data.get('windows', {})
+        level_bits = self.missions.catalog.level_bits
+        return any(
+            windows.get(level_bits[mission_id][0], {}).get('canLevelUp', False)
+            if mission_id in level_bits else level_data.get('canLevelUp', False)
+            for mission_id in mission_ids
+        )
+    
+    def _apply_mission_complete(self, game_state: GameState, event: Dict[str, Any]) -> None:
+        catalog = self.missions.catalog
+        mission_id = event['mission_id']
         
         # Track requirement completion
-        requirement_id = completion_data.get('requirementId')
+        requirement_id = event.get('requirement_id')
         if requirement_id:
             if mission_id not in game_state.requirement_progress:
                 game_state.requirement_progress[mission_id] = {}
             game_state.requirement_progress[mission_id][requirement_id] = True
+            bit = catalog.requirement_bits.get((mission_id, requirement_id), 0)
+            game_state.requirement_masks[mission_id] = (
+                game_state.requirement_masks.get(mission_id, 0) | bit
+            )
         
-        # Calculate points earned
-        points_earned = completion_data.get('pointsEarned', 0)
-        game_state.total_points += points_earned
-        
-        # Check if all requirements are complete for this mission
-        # In a real app, we'd check against the mission definition
-        # For now, assume 4 requirements per mission
-        requirements_complete = len(game_state.requirement_progress.get(mission_id, {}))
-        mission_complete = requirements_complete >= 4  # Placeholder
+        game_state.total_points += event['points']
         
-        if mission_complete and mission_id not in game_state.completed_missions:
+        if self._mission_complete(game_state, mission_id) and mission_id not in game_state.completed_missions:
             game_state.completed_missions.append(mission_id)
             
-            # Update level progress
-            current_level_key = f"level{game_state.current_level}"
-            if current_level_key in game_state.level_progress:
-                level_data = game_state.level_progress[current_level_key]
-                level_data['completed'] += 1
-                
-                # Check if can level up
-                if level_data['completed'] >= level_data['total']:
-                    level_data['canLevelUp'] = True
-        
-        # Update last modified
-        game_state.last_updated = datetime.now()
-        
-        return {
-            "success": True,
-            "pointsEarned": points_earned,
-            "newAchievements": [],
-            "levelUpAvailable": game_state.level_progress[f"level{game_state.current_level}"].get('canLevelUp', False),
-            "missionComplete": mission_complete,
-            "totalPoints": game_state.total_points
-        }
+            # Update the progress of the mission's own window and level
+            time_window, level, bit = catalog.level_bits[mission_id]
+            level_key = f"level{level}"
+            mask_key = f"{time_window}/{level_key}"
+            game_state.level_masks[mask_key] = game_state.level_masks.get(mask_key, 0) | bit
+            if level_key in game_state.level_progress:
+                self._refresh_level_progress(game_state, level)
     
-    def level_up(
-        self,
-        user_id: str,
-        level: int,
-        time_window: str
-    ) -> Dict[str, Any]:
-        """Handle level up."""
-        game_state = self.get_or_create_game_state(user_id)
+    def _apply_level_up(self, game_state: GameState, event: Dict[str, Any]) -> None:
+        level = event['level']
         
         # Update current level
         game_state.current_level = level
         
-        # Mark level as completed
+        # Mark level as completed in the window it was levelled up from
         level_key = f"level{level}"
         if level_key in game_state.level_progress:
-            game_state.level_progress[level_key]['leveledUpAt'] = datetime.now().isoformat()
-            game_state.level_progress[level_key]['canLevelUp'] = False
+            level_data = game_state.level_progress[level_key]
+            level_data['leveledUpAt'] = event['at']
+            window_data = level_data.get('windows', {}).get(event.get('time_window'))
+            if window_data is not None:
+                window_data['leveledUpAt'] = event['at']
+                window_data['canLevelUp'] = False
+            level_data['canLevelUp'] = any(
+                w['canLevelUp'] for w in level_data.get('windows', {}).values()
+            )
         
         # Unlock next level
         next_level_key = f"level{level + 1}"
         if next_level_key in game_state.level_progress:
             game_state.level_progress[next_level_key]['locked'] = False
+    
+    def _new_game_state(self, user_id: str) -> GameState:
+        """Initial state for a new player, with a level per catalog level."""
+        game_state = GameState(user_id=user_id)
+        self._sync_progress(game_state)
+        return game_state
+    
+    def complete_mission(
+        self, 
+        user_id: str,
+        mission_id: str,
+        completion_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Handle mission completion."""
+        with self._mutating(user_id) as game_state:
+            # Calculate points earned
+            points_earned = completion_data.get('pointsEarned', 0)
+            game_state = self._record(game_state, [{
+                "type": MISSION_COMPLETE,
+                "mission_id": mission_id,
+                "requirement_id": completion_data.get('requirementId'),
+                "points": points_earned
+            }])
+            mission_complete = self._mission_complete(game_state, mission_id)
+            
+            return {
+                "success": True,
+                "pointsEarned": points_earned,
+                "newAchievements": [],
+                "levelUpAvailable": self._level_up_available(game_state, [mission_id]),
+                "missionComplete": mission_complete,
+                "totalPoints": game_state.total_points
+            }
+    
+    def complete_missions(
+        self,
+        user_id: str,
+        completions: Sequence[MissionCompletion]
+    ) -> Dict[str, Any]:
+        """Apply several requirement ticks at once, as a single state change.
         
-        # Generate insight (placeholder)
-        insight = {
-            "title": f"Welcome to Level {level + 1}!",
-            "content": "You've unlocked new nutritional optimization strategies.",
-            "highlights": [
+        Raises ValueError for an empty or oversized batch.
+        """
+        if not completions:
+            raise ValueError("No completions given")
+        if len(completions) > MAX_BATCH_COMPLETIONS:
+            raise ValueError(f"At most {MAX_BATCH_COMPLETIONS} completions per batch")
+        
+        with self._mutating(user_id) as game_state:
+            already_completed = set(game_state.completed_missions)
+            game_state = self._record(game_state, [
                 {
-                    "value": f"{game_state.total_points:.0f}",
-                    "label": "Total Points",
-                    "explanation": "Keep up the great work!"
+                    "type": MISSION_COMPLETE,
+                    "mission_id": completion.mission_id,
+                    "requirement_id": completion.requirement_id,
+                    "points": completion.points_earned
                 }
-            ]
-        }
-        
-        return {
-            "success": True,
-            "newLevel": level + 1,
-            "unlockedMissions": [],
-            "specialRewards": [],
-            "insight": insight,
-            "achievements": [],
-            "bonusPoints": 100,
-            "nextLevelMissions": []
-        }
+                for completion in completions
+            ])
+            missions = list(dict.fromkeys(completion.mission_id for completion in completions))
+            
+            return {
+                "success": True,
+                "applied": len(completions),
+                "pointsEarned": sum(completion.points_earned for completion in completions),
+                "newAchievements": [],
+                "missionsCompleted": [
+                    mission_id for mission_id in game_state.completed_missions
+                    if mission_id not in already_completed
+                ],
+                "missionComplete": {
+                    mission_id: self._mission_complete(game_state, mission_id)
+                    for mission_id in missions
+                },
+                "levelUpAvailable": self._level_up_available(game_state, missions),
+                "totalPoints": game_state.total_points
+            }
+    
+    def level_up(
+        self,
+        user_id: str,
+        level: int,
+        time_window: str
+    ) -> Dict[str, Any]:
+        """Handle level up."""
+        with self._mutating(user_id) as game_state:
+            game_state = self._record(game_state, [{
+                "type": LEVEL_UP,
+                "level": level,
+                "time_window": time_window
+            }])
+            
+            # Generate insight (placeholder)
+            insight = {
+                "title": f"Welcome to Level {level + 1}!",
+                "content": "You've unlocked new nutritional optimization strategies.",
+                "highlights": [
+                    {
+                        "value": f"{game_state.total_points:.0f}",
+                        "label": "Total Points",
+                        "explanation": "Keep up the great work!"
+                    }
+                ]
+            }
+            
+            return {
+                "success": True,
+                "newLevel": level + 1,
+                "unlockedMissions": [],
+                "specialRewards": [],
+                "insight": insight,
+                "achievements": [],
+                "bonusPoints": 100,
+                "nextLevelMissions": []
+            }
     
     def get_game_state(self, user_id: str) -> Dict[str, Any]:
-        """Get current game state for a user."""
-        game_state = self.get_or_create_game_state(user_id)
+        """Get current game state for a user.
         
-        return {
-            "userId": game_state.user_id,
-            "currentLevel": game_state.current_level,
-            "totalPoints": game_state.total_points,
-            "missionProgress": game_state.mission_progress,
-            "requirementProgress": game_state.requirement_progress,
-            "levelProgress": game_state.level_progress,
-            "completedMissions": game_state.completed_missions,
-            "achievements": game_state.achievements,
-            "lastUpdated": game_state.last_updated.isoformat()
-        }
+        Returns copies taken under the user's lock, so the response is
+        consistent and safe to serialize while the state changes.
+        """
+        with self.user_lock(user_id):
+            game_state = self.get_or_create_game_state(user_id)
+            self._sync_progress(game_state)
+            
+            return {
+                "userId": game_state.user_id,
+                "currentLevel": game_state.current_level,
+                "totalPoints": game_state.total_points,
+                "missionProgress": copy.deepcopy(game_state.mission_progress),
+                "requirementProgress": copy.deepcopy(game_state.requirement_progress),
+                "levelProgress": copy.deepcopy(game_state.level_progress),
+                "completedMissions": list(game_state.completed_missions),
+                "achievements": list(game_state.achievements),
+                "lastUpdated": game_state.last_updated.isoformat()
+            }
     
     def reset_game_state(self, user_id: str) -> Dict[str, Any]:
         """Reset game state for a user."""
-        if user_id in self.game_states:
-            del self.game_states[user_id]
-        
-        # Create fresh state
-        new_state = self.get_or_create_game_state(user_id)
+        with self._mutating(user_id) as game_state:
+            # Logged like any other event, so the history is kept
+            self._record(game_state, [{"type": RESET}])
         
         return {
             "success": True,
             "message": "Game state reset successfully",
             "gameState": self.get_game_state(user_id)
         }
+    
+    def get_events(self, user_id: str) -> List[Dict[str, Any]]:
+        """A user's full event history, oldest first."""
+        return [event for _, event in self.events.read(user_id)]
+    
+    def replay_game_state(
+        self,
+        user_id: str,
+        points: Optional[Callable[[Dict[str, Any]], float]] = None
+    ) -> GameState:
+        """Fold a user's whole log into a fresh state, leaving the live one alone.
+        
+        ``points``, if given, re-prices every mission completion event,
+        e.g. after mission ``basePoints`` change.
+        """
+        game_state = self._new_game_state(user_id)
+        for offset, event in self.events.read(user_id):
+            if points is not None and event['type'] == MISSION_COMPLETE:
+                event = {**event, "points": points(event)}
+            game_state = self._apply_event(game_state, event)
+            game_state.event_offset = offset
+        return game_state
+    
+    def load_leaderboard(self) -> int:
+        """Fill an empty leaderboard from the game logs; returns the players loaded.
+        
+        All-time points come from each user's snapshot plus its log tail,
+        and the daily and weekly boards from the current week's events,
+        read back from the end of each log, so startup does not replay
+        whole histories. A shared leaderboard another process already
+        filled is left alone (0 players loaded).
+        """
+        if not self.leaderboard.needs_seed():
+            return 0
+        since = week_start(datetime.now())
+        totals: Dict[str, float] = {}
+        recent: Dict[str, List[Dict[str, Any]]] = {}
+        offsets: Dict[str, int] = {}
+        for user_id in self.events.users():
+            with self.user_lock(user_id), self.events.locked(user_id):
+                game_state = self._rebuild_game_state(user_id)
+                totals[user_id] = game_state.total_points
+                offsets[user_id] = game_state.event_offset
+                recent[user_id] = self.events.read_since(user_id, since)
+        return len(totals) if self.leaderboard.seed(totals, recent, offsets) else 0
+    
+    def reconcile_leaderboard(self) -> int:
+        """Apply logged events the leaderboard missed; returns the players caught up.
+        
+        Only users whose log is longer than the leaderboard's offset for
+        them are locked and read, e.g. after a failed update or a crash
+        between an append and its leaderboard transaction.
+        """
+        offsets = self.leaderboard.all_offsets()
+        caught_up = 0
+        for user_id in self.events.users():
+            if self.events.size(user_id) <= offsets.get(user_id, 0):
+                continue
+            with self.user_lock(user_id), self.events.locked(user_id):
+                caught_up += self._catch_up_leaderboard(user_id)
+        return caught_up
+    
+    def close(self) -> None:
+        """Flush pending state writes and close the store and leaderboard."""
+        self.writes.close()
+        self.leaderboard.close()
 
 
 # Singleton instance
-game_service = GameService()
\ No newline at end of file
+game_service = GameService(
+    SQLiteGameStateStore(), NDJSONGameEventLog(), leaderboard=SQLiteLeaderboard()
+)
\ No newline at end of file
@@ -0,0 +1,219 @@
+"""Persistent game-state backends and the write-behind queue in front of them."""
+import abc
+import logging
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+GAME_STATE_PATH = Path(
+    os.getenv("GAME_STATE_DB", Path(__file__).parent.parent.parent / 'data' / 'game_state.db')
+)
+
+# Flush pending states at least this often...
+FLUSH_INTERVAL_SECONDS = 1.0
+# ...or as soon as this many users have unflushed changes
+FLUSH_BATCH_SIZE = 256
+
+
+def open_database(path: Path) -> sqlite3.Connection:
+    """Connect to a SQLite file in WAL mode, shareable across threads.
+
+    WAL lets several server processes read while one writes, and with
+    ``synchronous=NORMAL`` a commit only syncs at checkpoints. The
+    connection is in autocommit mode; callers open their own
+    transactions and serialize use of it.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA busy_timeout=5000")
+    return conn
+
+
+class GameStateStore(abc.ABC):
+    """Where serialized game states live between restarts.
+
+    Backends store opaque payloads by user ID and must apply a batch of
+    writes atomically.
+    """
+
+    @abc.abstractmethod
+    def load(self, user_id: str) -> Optional[bytes]:
+        """Stored payload for a user, or None."""
+
+    @abc.abstractmethod
+    def write_batch(self, states: Mapping[str, Optional[bytes]]) -> None:
+        """Store every payload in one transaction; None deletes the user."""
+
+    def close(self) -> None:
+        """Release the backend's resources."""
+
+
+class MemoryGameStateStore(GameStateStore):
+    """Keeps payloads in process memory; nothing survives a restart."""
+
+    def __init__(self):
+        self.states: Dict[str, bytes] = {}
+
+    def load(self, user_id: str) -> Optional[bytes]:
+        return self.states.get(user_id)
+
+    def write_batch(self, states: Mapping[str, Optional[bytes]]) -> None:
+        for user_id, payload in states.items():
+            if payload is None:
+                self.states.pop(user_id, None)
+            else:
+                self.states[user_id] = payload
+
+
+class SQLiteGameStateStore(GameStateStore):
+    """Game states in a SQLite database in WAL mode.
+
+    WAL lets several server processes read while one writes, and with
+    ``synchronous=NORMAL`` a commit only syncs at checkpoints, so a batch
+    costs one transaction rather than one fsync per state.
+    """
+
+    def __init__(self, path: Path = GAME_STATE_PATH):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._conn = open_database(self.path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS game_states ("
+            "user_id TEXT PRIMARY KEY, "
+            "state BLOB NOT NULL, "
+            "updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP)"
+        )
+
+    def load(self, user_id: str) -> Optional[bytes]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT state FROM game_states WHERE user_id = ?", (user_id,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def write_batch(self, states: Mapping[str, Optional[bytes]]) -> None:
+        upserts = [(user_id, payload) for user_id, payload in states.items() if payload is not None]
+        deletes = [(user_id,) for user_id, payload in states.items() if payload is None]
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                if deletes:
+                    self._conn.executemany("DELETE FROM game_states WHERE user_id = ?", deletes)
+                if upserts:
+                    self._conn.executemany(
+                        "INSERT INTO game_states (user_id, state) VALUES (?, ?) "
+                        "ON CONFLICT(user_id) DO UPDATE SET "
+                        "state = excluded.state, updated_at = CURRENT_TIMESTAMP",
+                        upserts
+                    )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class WriteBehindQueue:
+    """Coalesce state writes and flush them to a store in batches.
+
+    ``put`` records the latest payload per user and returns immediately;
+    a background thread writes everything pending in one ``write_batch``
+    every ``interval`` seconds, or sooner once ``batch_size`` users are
+    pending. A user changed many times between flushes is written once.
+    A failed batch is logged and retried with the next one.
+    """
+
+    def __init__(
+        self,
+        store: GameStateStore,
+        interval: float = FLUSH_INTERVAL_SECONDS,
+        batch_size: int = FLUSH_BATCH_SIZE
+    ):
+        self.store = store
+        self.interval = interval
+        self.batch_size = batch_size
+        self._pending: Dict[str, Optional[bytes]] = {}
+        # The batch being written, still visible to ``pending``
+        self._flushing: Dict[str, Optional[bytes]] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        self.batches = 0
+        self.writes = 0
+        self._thread = threading.Thread(
+            target=self._run, name="game-state-flush", daemon=True
+        )
+        self._thread.start()
+
+    def put(self, user_id: str, payload: Optional[bytes]) -> None:
+        """Queue a user's latest payload (None to delete the user)."""
+        with self._lock:
+            self._pending[user_id] = payload
+            full = len(self._pending) >= self.batch_size
+        if full:
+            self._wake.set()
+
+    def pending(self, user_id: str) -> Tuple[bool, Optional[bytes]]:
+        """Whether a user has an unflushed write, and its payload.
+
+        Lets reads see writes the store does not have yet; the payload is
+        None for a pending delete.
+        """
+        with self._lock:
+            for writes in (self._pending, self._flushing):
+                if user_id in writes:
+                    return True, writes[user_id]
+        return False, None
+
+    def flush(self) -> int:
+        """Write everything pending now; returns the number of users written."""
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+                self._flushing = batch
+            if not batch:
+                return 0
+            try:
+                self.store.write_batch(batch)
+            except Exception:
+                logger.exception(f"Game state flush of {len(batch)} users failed; will retry")
+                with self._lock:
+                    # Anything queued meanwhile is newer than the failed batch
+                    self._pending = {**batch, **self._pending}
+                    self._flushing = {}
+                return 0
+            with self._lock:
+                self._flushing = {}
+            self.batches += 1
+            self.writes += len(batch)
+            return len(batch)
+
+    def _run(self) -> None:
+        while not self._closed:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            self.flush()
+
+    def close(self) -> None:
+        """Stop the flush thread, write what is pending and close the store."""
+        self._closed = True
+        self._wake.set()
+        self._thread.join()
+        self.flush()
+        self.store.close()
+
+    def stats(self) -> Dict[str, int]:
+        """Pending users plus batches and user writes flushed so far."""
+        with self._lock:
+            pending = len(self._pending)
+        return {"pending": pending, "batches": self.batches, "writes": self.writes}
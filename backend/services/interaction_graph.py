@@ -0,0 +1,130 @@
+"""Nutrient interaction graph compiled from the receptor mapping's interaction matrix."""
+from typing import Any, Dict, Iterable, List, NamedTuple, Set
+
+from models.nutrition import NutrientInput
+from utils.data_parser import load_interaction_matrix
+from utils.nutrient_resolver import normalize_nutrient_name, nutrient_resolver
+
+
+# Matrix entries that name a class of nutrients rather than one nutrient
+NUTRIENT_GROUPS: Dict[str, List[str]] = {
+    'fat_soluble_vitamins': ['vitamin_a', 'vitamin_d', 'vitamin_e', 'vitamin_k'],
+    # Substrates of the LAT1 transporter
+    'large_amino_acids': [
+        'leucine', 'isoleucine', 'valine', 'phenylalanine', 'tyrosine',
+        'tryptophan', 'methionine', 'histidine', 'threonine'
+    ],
+}
+
+INTERACTION_KINDS = ('competition', 'synergy')
+
+
+class InteractionEdge(NamedTuple):
+    """One directed half of an undirected interaction between two nutrients."""
+    nutrient: str
+    kind: str
+    description: str
+
+
+class InteractionGraph:
+    """Adjacency list of competing and synergistic nutrient pairs.
+
+    Every matrix entry is expanded into pairwise edges between canonical
+    nutrient IDs. An entry with several members links every pair of
+    nutrients taken from different members ("B6, B12, Folate" gives three
+    edges); an entry with a single group member links the group's
+    nutrients to each other ("Fat-Soluble Vitamins" compete among
+    themselves).
+
+    Checking a day's log only visits the edges of the nutrients in it, so
+    it runs in O(n + edges) rather than comparing every pair of intakes.
+    """
+
+    def __init__(self):
+        self.reload()
+
+    def reload(self) -> None:
+        """Rebuild the graph from the current interaction matrix."""
+        matrix = load_interaction_matrix()
+        self.adjacency: Dict[str, List[InteractionEdge]] = {}
+        self.edge_count = 0
+        for kind in INTERACTION_KINDS:
+            for entry in matrix.get(kind, []):
+                self._add_entry(kind, entry)
+
+        self.timing_rules: Dict[str, List[str]] = {}
+        for entry in matrix.get('timing', []):
+            for canonical_id in self._expand(entry['nutrient']):
+                self.timing_rules.setdefault(canonical_id, []).append(entry['rule'])
+
+    def _expand(self, member: str) -> Set[str]:
+        """Canonical IDs a matrix member stands for."""
+        group = NUTRIENT_GROUPS.get(normalize_nutrient_name(member))
+        if group is not None:
+            return set(group)
+        return {nutrient_resolver.resolve(member)}
+
+    def _add_entry(self, kind: str, entry: Dict[str, Any]) -> None:
+        """Add the pairwise edges of one competition/synergy entry."""
+        members = [self._expand(member) for member in entry['members']]
+        if len(members) == 1:
+            members = [{canonical_id} for canonical_id in members[0]]
+
+        pairs = set()
+        for i, first in enumerate(members):
+            for second in members[i + 1:]:
+                for a in first:
+                    for b in second:
+                        if a != b:
+                            pairs.add((a, b) if a < b else (b, a))
+
+        for a, b in sorted(pairs):
+            self.adjacency.setdefault(a, []).append(InteractionEdge(b, kind, entry['description']))
+            self.adjacency.setdefault(b, []).append(InteractionEdge(a, kind, entry['description']))
+            self.edge_count += 1
+
+    def neighbors(self, nutrient: str) -> List[InteractionEdge]:
+        """Interactions of a nutrient (any spelling)."""
+        return self.adjacency.get(nutrient_resolver.resolve(nutrient), [])
+
+    def find_interactions(self, nutrients: Iterable[NutrientInput]) -> Dict[str, List[Dict[str, Any]]]:
+        """Every competing and synergistic pair present in a nutrient log.
+
+        Each pair is reported once with the logged names that resolved to
+        its two nutrients. Timing rules for the logged nutrients are
+        returned alongside.
+        """
+        names: Dict[str, List[str]] = {}
+        for n in nutrients:
+            logged = names.setdefault(nutrient_resolver.resolve(n.name), [])
+            if n.name not in logged:
+                logged.append(n.name)
+
+        found: Dict[str, List[Dict[str, Any]]] = {kind: [] for kind in INTERACTION_KINDS}
+        for canonical_id in names:
+            for edge in self.adjacency.get(canonical_id, ()):
+                # Each undirected edge is stored twice; report it from its smaller end
+                if edge.nutrient in names and canonical_id < edge.nutrient:
+                    found[edge.kind].append({
+                        "nutrients": [canonical_id, edge.nutrient],
+                        "logged_as": [names[canonical_id], names[edge.nutrient]],
+                        "description": edge.description
+                    })
+
+        found['timing'] = [
+            {"nutrient": canonical_id, "rules": self.timing_rules[canonical_id]}
+            for canonical_id in names
+            if canonical_id in self.timing_rules
+        ]
+        return found
+
+    def to_dict(self) -> Dict[str, List[Dict[str, str]]]:
+        """The adjacency list in a JSON-friendly shape."""
+        return {
+            canonical_id: [edge._asdict() for edge in edges]
+            for canonical_id, edges in self.adjacency.items()
+        }
+
+
+# Singleton instance
+interaction_graph = InteractionGraph()
@@ -0,0 +1,286 @@
+"""Mission catalog file loading and the immutable, indexed catalog snapshot."""
+import base64
+import binascii
+import hashlib
+import json
+import logging
+from bisect import bisect_right
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+from models.mission import Mission, MissionCatalogFile, encode_catalog
+
+MISSIONS_PATH = Path(__file__).parent.parent.parent / 'data' / 'missions.json'
+SCHEMA_PATH = MISSIONS_PATH.with_suffix('.schema.json')
+
+logger = logging.getLogger(__name__)
+
+# Mission attributes the inverted indexes cover, keyed by filter name
+INDEXED_FIELDS = {
+    'category': 'category',
+    'window': 'time_window',
+    'level': 'level',
+}
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+def requirement_ids(mission: Mission) -> List[str]:
+    """IDs the client reports requirement completions under, in order.
+
+    The client numbers a mission's requirements ``<id>-req-<index>`` and
+    uses ``<id>-complete`` for a mission without requirements.
+    """
+    return [
+        f"{mission.id}-req-{index}" for index in range(len(mission.requirements))
+    ] or [f"{mission.id}-complete"]
+
+
+@dataclass(frozen=True)
+class CatalogView:
+    """A mission response serialized once, with its strong ETag."""
+    body: bytes
+    etag: str
+
+
+@dataclass(frozen=True)
+class MissionPage:
+    """One page of filtered missions."""
+    missions: List[Mission]
+    # Pre-serialized JSON array of ``missions``
+    body: bytes
+    total: int
+    next_cursor: Optional[str]
+
+
+def serialize_view(payload: Dict[str, Any]) -> CatalogView:
+    """Serialize a response payload and derive its ETag from the bytes."""
+    body = encode_catalog(payload)
+    return CatalogView(body=body, etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"')
+
+
+def read_catalog_file(
+    raw: bytes
+) -> Tuple[Dict[str, Dict[str, Tuple[Mission, ...]]], int]:
+    """Validate catalog file contents and load them into records.
+
+    Returns the missions by time window and level plus the file's
+    version. Raises ``pydantic.ValidationError`` (a ValueError) when the
+    file does not match ``MissionCatalogFile``.
+    """
+    catalog_file = MissionCatalogFile.model_validate_json(raw)
+    windows = {
+        time_window.value: {
+            level_key: tuple(
+                Mission.from_dict(mission.model_dump(mode='json')) for mission in missions
+            )
+            for level_key, missions in levels.items()
+        }
+        for time_window, levels in catalog_file.missions.items()
+    }
+    return windows, catalog_file.version
+
+
+class MissionCatalog:
+    """One immutable version of the mission catalog with its indexes and views.
+
+    Missions are numbered in catalog order and every posting list is a
+    sorted tuple of those ordinals (with a frozenset alongside for
+    membership tests), so filters intersect without scanning. Every
+    response the router serves is serialized up front, keyed by (time
+    window, level), category, receptor and mission ID.
+
+    Progress tables give every requirement of a mission a bit of the
+    mission's requirement mask and every mission a bit of its (time
+    window, level) mask, so completion is a mask comparison and level
+    progress a popcount. Bits follow catalog order and change between
+    versions; masks built from them are only valid for this catalog.
+
+    ``changed_at`` maps each mission ID to the catalog version its content
+    last changed in and ``removed_at`` holds tombstones for deleted IDs;
+    together they answer delta-sync requests.
+    """
+
+    def __init__(
+        self,
+        windows: Dict[str, Dict[str, Tuple[Mission, ...]]],
+        version: int,
+        content_hash: str,
+        changed_at: Dict[str, int],
+        removed_at: Dict[str, int]
+    ):
+        self.windows = windows
+        self.version = version
+        self.content_hash = content_hash
+        self.changed_at = changed_at
+        self.removed_at = removed_at
+        self._build_indexes()
+        self._build_progress_tables()
+        self._build_views()
+
+    def _build_indexes(self) -> None:
+        """Build the inverted indexes over the catalog."""
+        self.missions: List[Mission] = [
+            mission
+            for levels in self.windows.values()
+            for missions in levels.values()
+            for mission in missions
+        ]
+        self.mission_index: Dict[str, int] = {
+            mission.id: ordinal for ordinal, mission in enumerate(self.missions)
+        }
+        self.mission_bytes: List[bytes] = [encode_catalog(mission) for mission in self.missions]
+
+        postings: Dict[str, Dict[Any, List[int]]] = {
+            kind: {} for kind in (*INDEXED_FIELDS, 'receptor')
+        }
+        for ordinal, mission in enumerate(self.missions):
+            for kind, field_name in INDEXED_FIELDS.items():
+                postings[kind].setdefault(getattr(mission, field_name), []).append(ordinal)
+            for receptor in dict.fromkeys(mission.target_receptors):
+                postings['receptor'].setdefault(receptor, []).append(ordinal)
+
+        self.postings: Dict[str, Dict[Any, Tuple[int, ...]]] = {
+            kind: {key: tuple(ordinals) for key, ordinals in index.items()}
+            for kind, index in postings.items()
+        }
+        self.posting_sets: Dict[str, Dict[Any, FrozenSet[int]]] = {
+            kind: {key: frozenset(ordinals) for key, ordinals in index.items()}
+            for kind, index in self.postings.items()
+        }
+
+    def _build_progress_tables(self) -> None:
+        """Precompute requirement and level bitmasks."""
+        # (mission ID, requirement ID) -> the requirement's bit
+        self.requirement_bits: Dict[Tuple[str, str], int] = {}
+        # Mission ID -> mask with a bit per requirement
+        self.requirement_masks: Dict[str, int] = {}
+        # Mission ID -> (time window, level, the mission's bit within them)
+        self.level_bits: Dict[str, Tuple[str, int, int]] = {}
+        # Level -> missions of that level in each time window
+        self.level_mission_counts: Dict[int, Dict[str, int]] = {}
+        for time_window, levels in self.windows.items():
+            for missions in levels.values():
+                for mission in missions:
+                    ids = requirement_ids(mission)
+                    for index, requirement_id in enumerate(ids):
+                        self.requirement_bits[(mission.id, requirement_id)] = 1 << index
+                    self.requirement_masks[mission.id] = (1 << len(ids)) - 1
+
+                    counts = self.level_mission_counts.setdefault(mission.level, {})
+                    position = counts.get(time_window, 0)
+                    self.level_bits[mission.id] = (time_window, mission.level, 1 << position)
+                    counts[time_window] = position + 1
+        self.level_mission_counts = dict(sorted(self.level_mission_counts.items()))
+
+    def _build_views(self) -> None:
+        """Serialize every catalog response once."""
+        self.views: Dict[Tuple[str, ...], CatalogView] = {
+            ('all',): serialize_view({"success": True, "data": self.windows})
+        }
+        for time_window, levels in self.windows.items():
+            for level_key, missions in levels.items():
+                self.views[('window', time_window, level_key)] = self._list_view(missions)
+        for mission in self.missions:
+            self.views[('id', mission.id)] = serialize_view({"success": True, "data": mission})
+        for kind in ('category', 'receptor'):
+            for key, ordinals in self.postings[kind].items():
+                self.views[(kind, key)] = self._list_view([self.missions[o] for o in ordinals])
+        self.empty_list_view = self._list_view([])
+
+    @staticmethod
+    def _list_view(missions: Sequence[Mission]) -> CatalogView:
+        return serialize_view({"success": True, "data": missions, "count": len(missions)})
+
+    def filter(
+        self,
+        filters: Dict[str, Any],
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE
+    ) -> MissionPage:
+        """Missions matching every given filter, one page at a time.
+
+        ``filters`` maps 'category', 'receptor', 'window' or 'level' to a
+        value; ``None`` values are ignored. The shortest posting list is
+        walked and checked against the others' sets, so the cost depends
+        on the rarest filter rather than the catalog size. ``cursor`` is
+        the ``next_cursor`` of the previous page; raises ValueError for an
+        unknown filter, a malformed cursor, or a cursor from another
+        catalog version.
+        """
+        active = {kind: value for kind, value in filters.items() if value is not None}
+        for kind in active:
+            if kind not in self.postings:
+                raise ValueError(f"Unknown mission filter: {kind}")
+
+        if active:
+            lists = sorted(
+                ((self.postings[kind].get(value, ()), kind, value) for kind, value in active.items()),
+                key=lambda entry: len(entry[0])
+            )
+            smallest = lists[0][0]
+            others = [self.posting_sets[kind].get(value, frozenset()) for _, kind, value in lists[1:]]
+            matches = [o for o in smallest if all(o in other for other in others)]
+        else:
+            matches = range(len(self.missions))
+
+        start = bisect_right(matches, self._decode_cursor(cursor)) if cursor else 0
+        page = matches[start:start + limit]
+        has_more = start + limit < len(matches)
+        return MissionPage(
+            missions=[self.missions[o] for o in page],
+            body=b'[' + b','.join(self.mission_bytes[o] for o in page) + b']',
+            total=len(matches),
+            next_cursor=self._encode_cursor(page[-1]) if has_more and page else None
+        )
+
+    def _encode_cursor(self, ordinal: int) -> str:
+        """Opaque cursor pointing after a mission ordinal of this version."""
+        token = f"{self.version}:{ordinal}".encode()
+        return base64.urlsafe_b64encode(token).decode().rstrip('=')
+
+    def _decode_cursor(self, cursor: str) -> int:
+        try:
+            decoded = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode()
+            version, ordinal = (int(part) for part in decoded.split(':'))
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            raise ValueError(f"Invalid cursor: {cursor}")
+        if version != self.version:
+            raise ValueError("Cursor is from an older catalog version; restart pagination")
+        return ordinal
+
+    def changes_since(self, since: int) -> Dict[str, Any]:
+        """Missions changed and IDs removed after catalog version ``since``.
+
+        A client holding a version this catalog cannot vouch for (newer
+        than the current one, e.g. from a worker that saw a later file)
+        gets the full catalog with ``full`` set.
+        """
+        full = since <= 0 or since > self.version
+        return {
+            "version": self.version,
+            "full": full,
+            "updated": [
+                mission for mission in self.missions
+                if full or self.changed_at[mission.id] > since
+            ],
+            "removed": [] if full else [
+                mission_id for mission_id, version in self.removed_at.items() if version > since
+            ],
+        }
+
+
+def write_schema(path: Path = SCHEMA_PATH) -> None:
+    """Write the JSON Schema of the catalog file, for editors and CI."""
+    schema = MissionCatalogFile.model_json_schema()
+    # The file references its own schema
+    schema.setdefault('properties', {})['$schema'] = {'type': 'string'}
+    path.write_text(json.dumps(schema, indent=2) + "\n", encoding='utf-8')
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    write_schema()
+    logger.info(f"Wrote {SCHEMA_PATH}")
@@ -0,0 +1,234 @@
+"""Rank the next missions for a user from game progress and receptor status."""
+import heapq
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from data.mission_receptors import RECEPTOR_CLUSTERS
+from models.mission import Mission
+from models.nutrition import NutrientInput
+from services.game_service import GameService, game_service
+from services.mission_catalog import MissionCatalog
+from services.mission_service import MissionService, mission_service
+from services.receptor_service import ReceptorService, receptor_service
+from services.receptor_session import ReceptorSessionManager, receptor_sessions
+from utils.nutrient_resolver import nutrient_resolver
+
+# Missions returned when the client does not ask for a count
+DEFAULT_RECOMMENDATIONS = 5
+MAX_RECOMMENDATIONS = 50
+
+# How strongly one link between a mission and a cluster lifts that cluster
+RECEPTOR_WEIGHT = 1.0   # the mission targets the cluster's receptor
+SUBSTRATE_WEIGHT = 1.0  # a requirement is a substrate the cluster carries
+ENHANCER_WEIGHT = 0.5   # a requirement enhances the cluster
+
+# Clusters below this efficiency (%) count as weak
+TARGET_EFFICIENCY = 100.0
+
+# Where the receptor efficiencies behind a ranking came from
+RECEPTOR_DATA_REQUEST = 'request'  # nutrients sent with the request
+RECEPTOR_DATA_SESSION = 'session'  # the user's live session on this worker
+RECEPTOR_DATA_NONE = 'none'        # nothing to go on; ranked by base points
+
+ClusterKey = Tuple[str, str]
+
+
+@dataclass(frozen=True)
+class Recommendation:
+    """A recommended mission and the weak clusters it would lift."""
+    mission: Mission
+    # Sum of link weight x efficiency deficit over the lifted clusters
+    score: float
+    # (system, cluster, efficiency) of each weak cluster it targets
+    lifts: Tuple[Tuple[str, str, float], ...]
+
+
+class RecommendationIndex:
+    """Mission/cluster links precomputed for one catalog and receptor dataset.
+
+    Each mission is linked to the clusters its target receptors belong to
+    (through the receptor lookup indexes, then ``RECEPTOR_CLUSTERS``) and
+    to the clusters its requirement nutrients are substrates or enhancers
+    of. ``cluster_missions`` inverts that, so ranking only visits missions
+    linked to a weak cluster.
+    """
+
+    def __init__(self, catalog: MissionCatalog, receptors: ReceptorService):
+        self.catalog = catalog
+        self.data_version = receptors.data_version
+        self.mission_clusters: List[Dict[ClusterKey, float]] = [
+            self._link_mission(mission, receptors) for mission in catalog.missions
+        ]
+
+        cluster_missions: Dict[ClusterKey, List[Tuple[int, float]]] = {}
+        for ordinal, links in enumerate(self.mission_clusters):
+            for cluster, weight in links.items():
+                cluster_missions.setdefault(cluster, []).append((ordinal, weight))
+        self.cluster_missions: Dict[ClusterKey, Tuple[Tuple[int, float], ...]] = {
+            cluster: tuple(links) for cluster, links in cluster_missions.items()
+        }
+
+        # Fallback order when too few missions lift a weak cluster
+        self.by_base_points: Tuple[int, ...] = tuple(sorted(
+            range(len(catalog.missions)),
+            key=lambda o: (-catalog.missions[o].base_points, o)
+        ))
+
+    @staticmethod
+    def _link_mission(mission: Mission, receptors: ReceptorService) -> Dict[ClusterKey, float]:
+        """Clusters a mission lifts, with the strongest weight linking each."""
+        links: Dict[ClusterKey, float] = {}
+
+        def link(cluster: ClusterKey, weight: float) -> None:
+            links[cluster] = max(weight, links.get(cluster, 0.0))
+
+        for name in mission.target_receptors:
+            matches = [
+                (entry['system'], entry['cluster'])
+                for kind in ('receptor', 'protein', 'gene')
+                for entry in receptors.lookup_receptors(kind, name)
+            ]
+            for cluster in matches or RECEPTOR_CLUSTERS.get(name, ()):
+                link(cluster, RECEPTOR_WEIGHT)
+
+        for requirement in mission.requirements:
+            for entry in receptors.lookup_receptors('substrate', requirement.target):
+                link((entry['system'], entry['cluster']), SUBSTRATE_WEIGHT)
+            canonical_id = nutrient_resolver.resolve(requirement.target)
+            for receptor in receptors.receptors_by_nutrient.get(canonical_id, ()):
+                if any(c == canonical_id and w > 0 for c, _, w in receptor.enhancers):
+                    link((receptor.system, receptor.key), ENHANCER_WEIGHT)
+
+        return links
+
+
+class MissionRecommender:
+    """Recommend missions that lift a user's weakest receptor clusters.
+
+    Candidates are missions unlocked at the user's level and not yet
+    completed. Only missions linked to a cluster below
+    ``TARGET_EFFICIENCY`` are scored, and the top K come off a heap; any
+    remaining slots are filled by base points. The index is rebuilt when
+    the mission catalog or the receptor dataset changes.
+
+    Efficiencies come from nutrients passed with the request, else from
+    the user's live session. Sessions live in one worker's memory, so a
+    user whose session is elsewhere (or gone after a restart) has no
+    receptor data and gets missions by base points; ``recommend`` says
+    which source it used.
+    """
+
+    def __init__(
+        self,
+        missions: MissionService,
+        receptors: ReceptorService,
+        sessions: ReceptorSessionManager,
+        games: GameService
+    ):
+        self.missions = missions
+        self.receptors = receptors
+        self.sessions = sessions
+        self.games = games
+        self._index: Optional[RecommendationIndex] = None
+
+    @property
+    def index(self) -> RecommendationIndex:
+        """The index for the current catalog and dataset, rebuilt if either changed."""
+        index = self._index
+        catalog = self.missions.catalog
+        if (
+            index is None
+            or index.catalog is not catalog
+            or index.data_version != self.receptors.data_version
+        ):
+            index = self._index = RecommendationIndex(catalog, self.receptors)
+        return index
+
+    def weak_clusters(
+        self,
+        user_id: str,
+        nutrients: Optional[Sequence[NutrientInput]] = None
+    ) -> Tuple[Dict[ClusterKey, float], str]:
+        """Efficiency of each cluster below target, and where it came from.
+
+        ``nutrients`` takes precedence over the user's session; with
+        neither, there are no weak clusters and the source is
+        ``RECEPTOR_DATA_NONE``.
+        """
+        if nutrients is not None:
+            status = self.receptors.get_receptor_status(list(nutrients))
+            efficiencies = {
+                (system_key, receptor_id): efficiency
+                for system_key, system_status in status.items()
+                for receptor_id, efficiency in system_status.receptor_details.items()
+            }
+            source = RECEPTOR_DATA_REQUEST
+        else:
+            session = self.sessions.get(user_id)
+            if session is None:
+                return {}, RECEPTOR_DATA_NONE
+            efficiencies = session.efficiencies()
+            source = RECEPTOR_DATA_SESSION
+        return {
+            cluster: efficiency.efficiency_percentage
+            for cluster, efficiency in efficiencies.items()
+            if efficiency.efficiency_percentage < TARGET_EFFICIENCY
+        }, source
+
+    def recommend(
+        self,
+        user_id: str,
+        k: int = DEFAULT_RECOMMENDATIONS,
+        nutrients: Optional[Sequence[NutrientInput]] = None
+    ) -> Tuple[List[Recommendation], str]:
+        """Top ``k`` missions for a user, best first, and the receptor data source."""
+        index = self.index
+        missions = index.catalog.missions
+        game_state = self.games.get_or_create_game_state(user_id)
+        completed = set(game_state.completed_missions)
+        level = game_state.current_level
+
+        def eligible(ordinal: int) -> bool:
+            mission = missions[ordinal]
+            return mission.level <= level and mission.id not in completed
+
+        weak, source = self.weak_clusters(user_id, nutrients)
+        scores: Dict[int, float] = {}
+        for cluster, efficiency in weak.items():
+            deficit = TARGET_EFFICIENCY - efficiency
+            for ordinal, weight in index.cluster_missions.get(cluster, ()):
+                scores[ordinal] = scores.get(ordinal, 0.0) + weight * deficit
+
+        top = heapq.nlargest(
+            k,
+            (o for o in scores if eligible(o)),
+            key=lambda o: (scores[o], missions[o].base_points, -o)
+        )
+
+        if len(top) < k:
+            chosen = set(top)
+            for ordinal in index.by_base_points:
+                if len(top) == k:
+                    break
+                if ordinal not in chosen and eligible(ordinal):
+                    top.append(ordinal)
+
+        recommendations = [
+            Recommendation(
+                mission=missions[o],
+                score=round(scores.get(o, 0.0), 2),
+                lifts=tuple(
+                    (system, cluster, weak[(system, cluster)])
+                    for system, cluster in index.mission_clusters[o]
+                    if (system, cluster) in weak
+                )
+            )
+            for o in top
+        ]
+        return recommendations, source
+
+
+# Singleton instance
+mission_recommender = MissionRecommender(
+    mission_service, receptor_service, receptor_sessions, game_service
+)
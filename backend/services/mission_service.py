@@ -1,104 +1,211 @@
 """Mission service for managing nutrition game missions."""
-from typing import List, Dict, Any, Optional
-from datetime import datetime
-from data.missions import MISSIONS_DATA, MissionCategory, RequirementType
+import asyncio
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, Any, Optional, Sequence, Tuple
+from pydantic import ValidationError
+from models.mission import Mission
+from services.mission_catalog import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    MISSIONS_PATH,
+    CatalogView,
+    MissionCatalog,
+    MissionPage,
+    read_catalog_file,
+)
+
+logger = logging.getLogger(__name__)
+
+# Seconds between checks of the catalog file for changes
+CATALOG_POLL_SECONDS = 5.0
 
 
 class MissionService:
-    """Service for managing nutrition game missions."""
-    
-    def __init__(self):
-        self.missions_data = MISSIONS_DATA
-        
-    def get_missions(self, time_window: str, level: int) -> List[Dict[str, Any]]:
-        """Get missions for a specific time window and level."""
+    """Service for managing nutrition game missions.
+
+    The catalog is loaded from ``data/missions.json`` into an immutable
+    ``MissionCatalog`` of shared, frozen ``Mission`` records; nothing is
+    copied or mutated per request. When the file changes, a new catalog
+    is built off to the side and swapped in with a single assignment, so
+    requests already holding the old catalog finish against it. A file
+    that fails validation is logged and ignored.
+    """
+
+    def __init__(self, path: Path = MISSIONS_PATH):
+        self.path = path
+        self._mtime: Optional[float] = None
+        self._reload_lock = threading.Lock()
+        self.catalog: Optional[MissionCatalog] = None
+        self.reload_catalog()
+
+    def reload_catalog(self, force: bool = False) -> bool:
+        """Load the catalog file if its mtime and content hash changed.
+
+        Returns True when a new catalog was swapped in. On the first load
+        errors propagate; afterwards invalid files are logged and the
+        current catalog stays.
+        """
+        with self._reload_lock:
+            mtime = self.path.stat().st_mtime
+            if not force and mtime == self._mtime:
+                return False
+
+            raw = self.path.read_bytes()
+            content_hash = hashlib.sha256(raw).hexdigest()
+            current = self.catalog
+            self._mtime = mtime
+            if not force and current is not None and content_hash == current.content_hash:
+                return False
+
+            try:
+                windows, file_version = read_catalog_file(raw)
+            except ValidationError as e:
+                if current is None:
+                    raise
+                logger.warning(f"Ignoring invalid mission catalog {self.path}: {e}")
+                return False
+
+            self.catalog = self._next_catalog(current, windows, file_version, content_hash)
+            logger.info(f"Loaded mission catalog version {self.catalog.version}")
+            return True
+
+    def _next_catalog(
+        self,
+        current: Optional[MissionCatalog],
+        windows: Dict[str, Dict[str, Tuple[Mission, ...]]],
+        file_version: int,
+        content_hash: str
+    ) -> MissionCatalog:
+        """Build the catalog that replaces ``current``, tracking what changed."""
+        missions = {
+            mission.id: mission
+            for levels in windows.values()
+            for level_missions in levels.values()
+            for mission in level_missions
+        }
+        if current is None:
+            return MissionCatalog(
+                windows, file_version, content_hash,
+                changed_at={mission_id: file_version for mission_id in missions},
+                removed_at={}
+            )
+
+        version = file_version
+        if version <= current.version:
+            # Deltas need a new version even if the editor forgot to bump it
+            logger.warning(
+                f"Mission catalog changed without a version bump; "
+                f"using version {current.version + 1}"
+            )
+            version = current.version + 1
+
+        changed_at = {}
+        for mission_id, mission in missions.items():
+            ordinal = current.mission_index.get(mission_id)
+            unchanged = ordinal is not None and current.missions[ordinal] == mission
+            changed_at[mission_id] = current.changed_at[mission_id] if unchanged else version
+
+        removed_at = {
+            mission_id: removed for mission_id, removed in current.removed_at.items()
+            if mission_id not in missions
+        }
+        for mission_id in current.mission_index:
+            if mission_id not in missions:
+                removed_at[mission_id] = version
+
+        return MissionCatalog(windows, version, content_hash, changed_at, removed_at)
+
+    async def watch_catalog(self, interval: float = CATALOG_POLL_SECONDS) -> None:
+        """Poll the catalog file and hot-swap it when it changes; runs until cancelled."""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await asyncio.to_thread(self.reload_catalog)
+            except OSError as e:
+                logger.warning(f"Could not read mission catalog {self.path}: {e}")
+
+    @property
+    def version(self) -> int:
+        """Current catalog version."""
+        return self.catalog.version
+
+    def _check_window(self, catalog: MissionCatalog, time_window: str, level: int) -> str:
+        """Validate a time window and level; return the level key."""
         level_key = f"level{level}"
-        
-        if time_window not in self.missions_data:
+
+        if time_window not in catalog.windows:
             raise ValueError(f"Invalid time window: {time_window}")
-            
-        if level_key not in self.missions_data[time_window]:
+
+        if level_key not in catalog.windows[time_window]:
             raise ValueError(f"Invalid level: {level} for time window: {time_window}")
-            
-        # Convert enum values to strings for JSON serialization
-        missions = []
-        for mission in self.missions_data[time_window][level_key]:
-            mission_copy = mission.copy()
-            if isinstance(mission_copy.get('category'), MissionCategory):
-                mission_copy['category'] = mission_copy['category'].value
-                
-            # Convert requirement types to strings
-            if 'requirements' in mission_copy:
-                for req in mission_copy['requirements']:
-                    if isinstance(req.get('type'), RequirementType):
-                        req['type'] = req['type'].value
-                        
-            missions.append(mission_copy)
-            
-        return missions
-    
-    def get_mission_by_id(self, mission_id: str) -> Optional[Dict[str, Any]]:
+
+        return level_key
+
+    def get_missions(self, time_window: str, level: int) -> Sequence[Mission]:
+        """Get missions for a specific time window and level."""
+        catalog = self.catalog
+        return catalog.windows[time_window][self._check_window(catalog, time_window, level)]
+
+    def get_missions_view(self, time_window: str, level: int) -> CatalogView:
+        """Serialized ``get_missions`` response; raises ValueError like it."""
+        catalog = self.catalog
+        level_key = self._check_window(catalog, time_window, level)
+        return catalog.views[('window', time_window, level_key)]
+
+    def get_mission_by_id(self, mission_id: str) -> Optional[Mission]:
         """Get a specific mission by ID."""
-        for time_window in self.missions_data:
-            for level_key in self.missions_data[time_window]:
-                for mission in self.missions_data[time_window][level_key]:
-                    if mission['id'] == mission_id:
-                        mission_copy = mission.copy()
-                        if isinstance(mission_copy.get('category'), MissionCategory):
-                            mission_copy['category'] = mission_copy['category'].value
-                        return mission_copy
-        return None
-    
-    def get_all_missions(self) -> Dict[str, Dict[str, List[Dict[str, Any]]]]:
+        catalog = self.catalog
+        ordinal = catalog.mission_index.get(mission_id)
+        return catalog.missions[ordinal] if ordinal is not None else None
+
+    def get_mission_view(self, mission_id: str) -> Optional[CatalogView]:
+        """Serialized response for one mission, or None if unknown."""
+        return self.catalog.views.get(('id', mission_id))
+
+    def get_all_missions(self) -> Dict[str, Dict[str, Tuple[Mission, ...]]]:
         """Get all missions organized by time window and level."""
-        all_missions = {}
-        
-        for time_window in self.missions_data:
-            all_missions[time_window] = {}
-            for level_key in self.missions_data[time_window]:
-                missions = []
-                for mission in self.missions_data[time_window][level_key]:
-                    mission_copy = mission.copy()
-                    if isinstance(mission_copy.get('category'), MissionCategory):
-                        mission_copy['category'] = mission_copy['category'].value
-                    missions.append(mission_copy)
-                all_missions[time_window][level_key] = missions
-                
-        return all_missions
-    
-    def get_missions_by_category(self, category: str) -> List[Dict[str, Any]]:
+        return self.catalog.windows
+
+    def get_all_missions_view(self) -> CatalogView:
+        """Serialized response for the whole catalog."""
+        return self.catalog.views[('all',)]
+
+    def get_missions_by_category(self, category: str) -> Sequence[Mission]:
         """Get all missions of a specific category."""
-        missions = []
-        
-        for time_window in self.missions_data:
-            for level_key in self.missions_data[time_window]:
-                for mission in self.missions_data[time_window][level_key]:
-                    mission_category = mission.get('category')
-                    if isinstance(mission_category, MissionCategory):
-                        mission_category = mission_category.value
-                        
-                    if mission_category == category:
-                        mission_copy = mission.copy()
-                        mission_copy['category'] = mission_category
-                        missions.append(mission_copy)
-                        
-        return missions
-    
-    def get_missions_by_receptor(self, receptor: str) -> List[Dict[str, Any]]:
+        catalog = self.catalog
+        return [catalog.missions[o] for o in catalog.postings['category'].get(category, ())]
+
+    def get_category_view(self, category: str) -> CatalogView:
+        """Serialized response for a category (empty list if unknown)."""
+        catalog = self.catalog
+        return catalog.views.get(('category', category), catalog.empty_list_view)
+
+    def get_missions_by_receptor(self, receptor: str) -> Sequence[Mission]:
         """Get all missions that target a specific receptor."""
-        missions = []
-        
-        for time_window in self.missions_data:
-            for level_key in self.missions_data[time_window]:
-                for mission in self.missions_data[time_window][level_key]:
-                    if receptor in mission.get('targetReceptors', []):
-                        mission_copy = mission.copy()
-                        if isinstance(mission_copy.get('category'), MissionCategory):
-                            mission_copy['category'] = mission_copy['category'].value
-                        missions.append(mission_copy)
-                        
-        return missions
+        catalog = self.catalog
+        return [catalog.missions[o] for o in catalog.postings['receptor'].get(receptor, ())]
+
+    def get_receptor_view(self, receptor: str) -> CatalogView:
+        """Serialized response for a receptor (empty list if unknown)."""
+        catalog = self.catalog
+        return catalog.views.get(('receptor', receptor), catalog.empty_list_view)
+
+    def filter_missions(
+        self,
+        filters: Dict[str, Any],
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE
+    ) -> MissionPage:
+        """Missions matching every given filter (see ``MissionCatalog.filter``)."""
+        return self.catalog.filter(filters, cursor=cursor, limit=limit)
+
+    def get_changes(self, since: int) -> Dict[str, Any]:
+        """Missions changed since a catalog version (see ``MissionCatalog.changes_since``)."""
+        return self.catalog.changes_since(since)
 
 
 # Singleton instance
-mission_service = MissionService()
\ No newline at end of file
+mission_service = MissionService()
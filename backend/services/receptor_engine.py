@@ -0,0 +1,93 @@
+"""Vectorized receptor efficiency engine over a receptor x nutrient matrix."""
+from typing import TYPE_CHECKING, Dict, Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+from utils.dose_response import half_saturation, saturation
+
+if TYPE_CHECKING:
+    from services.receptor_service import CompiledReceptor
+
+
+MIN_EFFICIENCY = 20.0
+MAX_EFFICIENCY = 150.0
+
+
+class ReceptorMatrixEngine:
+    """Evaluate every receptor for many nutrient logs with one matrix product.
+
+    The engine mirrors ``ReceptorService._calculate_receptor_efficiency``:
+    a log becomes a dose vector over canonical nutrient IDs, the saturation
+    curve turns doses into effect fractions ``S``, and
+    ``100 * exp(S @ W)`` clipped to 20-150% gives each receptor's
+    efficiency, where ``W`` holds the log fold changes.
+    """
+
+    def __init__(self, compiled_receptors: Dict[str, List['CompiledReceptor']]):
+        self.receptors: List['CompiledReceptor'] = []
+        self.system_slices: Dict[str, slice] = {}
+        for system_key, receptors in compiled_receptors.items():
+            start = len(self.receptors)
+            self.receptors.extend(receptors)
+            self.system_slices[system_key] = slice(start, len(self.receptors))
+
+        self.nutrient_index: Dict[str, int] = {}
+        rows, cols, weights = [], [], []
+        for row, receptor in enumerate(self.receptors):
+            for canonical_id, _, log_fold in receptor.enhancers + receptor.inhibitors:
+                col = self.nutrient_index.setdefault(canonical_id, len(self.nutrient_index))
+                rows.append(row)
+                cols.append(col)
+                weights.append(log_fold)
+
+        # Keep the sparse triplets for inspection; the dense (nutrient x receptor)
+        # form is tiny and is what the matrix product actually uses.
+        self.weight_triplets: Tuple[np.ndarray, np.ndarray, np.ndarray] = (
+            np.asarray(rows, dtype=np.intp),
+            np.asarray(cols, dtype=np.intp),
+            np.asarray(weights, dtype=np.float64),
+        )
+        self.weights = np.zeros(
+            (len(self.nutrient_index), len(self.receptors)), dtype=np.float64
+        )
+        # A nutrient that both enhances and inhibits a receptor nets out
+        np.add.at(self.weights, (self.weight_triplets[1], self.weight_triplets[0]),
+                  self.weight_triplets[2])
+        self.half_saturation = np.asarray(
+            [half_saturation(canonical_id) for canonical_id in self.nutrient_index],
+            dtype=np.float64
+        )
+
+    def vectorize(self, nutrient_logs: Sequence[Iterable[Tuple[str, float]]]) -> np.ndarray:
+        """Turn logs of (canonical ID, dose) into a (logs x nutrients) dose matrix.
+
+        Doses of the same nutrient add up; nutrients that no receptor
+        references have no column and are dropped.
+        """
+        row_idx, col_idx, doses = [], [], []
+        for row, entries in enumerate(nutrient_logs):
+            for canonical_id, dose in entries:
+                col = self.nutrient_index.get(canonical_id)
+                if col is not None:
+                    row_idx.append(row)
+                    col_idx.append(col)
+                    doses.append(dose)
+
+        matrix = np.zeros((len(nutrient_logs), len(self.nutrient_index)), dtype=np.float64)
+        np.add.at(matrix, (row_idx, col_idx), doses)
+        return matrix
+
+    def receptor_efficiencies(self, doses: np.ndarray) -> np.ndarray:
+        """Return a (logs x receptors) matrix of efficiency percentages."""
+        effect = saturation(doses, self.half_saturation) @ self.weights
+        return np.clip(100.0 * np.exp(effect), MIN_EFFICIENCY, MAX_EFFICIENCY)
+
+    def system_efficiencies(self, efficiencies: np.ndarray) -> Dict[str, np.ndarray]:
+        """Average receptor efficiencies per body system (100% when empty)."""
+        result = {}
+        for system_key, columns in self.system_slices.items():
+            if columns.stop > columns.start:
+                result[system_key] = efficiencies[:, columns].mean(axis=1)
+            else:
+                result[system_key] = np.full(efficiencies.shape[0], 100.0)
+        return result
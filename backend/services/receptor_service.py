@@ -1,7 +1,28 @@
 """Receptor service for managing nutrient receptor data and calculations."""
-from typing import Dict, List, Any, Optional
+import math
+import re
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Any, Mapping, Optional, Sequence, Tuple
 from datetime import datetime
+import numpy as np
 from utils.data_parser import load_receptor_data
+from utils.nutrient_resolver import nutrient_resolver, normalize_nutrient_name
+from utils.cache import LRUCache
+from data.commentary import (
+    COMMENTARY_NUTRIENT_COUNT,
+    COMMENTARY_TEMPLATES,
+    DEFAULT_COMMENTARY,
+    EFFICIENCY_TIERS,
+    NO_NUTRIENTS,
+    SYSTEM_NOTES,
+    TIER_FALLBACKS,
+)
+from utils.dose_response import dose_mg, half_saturation, log_fold, saturation
+from services.receptor_engine import (
+    ReceptorMatrixEngine,
+    MIN_EFFICIENCY,
+    MAX_EFFICIENCY
+)
 from models.nutrition import (
     NutrientInput, 
     ReceptorEfficiency, 
@@ -11,115 +32,358 @@ from models.nutrition import (
 )
 
 
+# Status cache bounds: identical supplement stacks are common within a day
+STATUS_CACHE_SIZE = 2048
+STATUS_CACHE_TTL_SECONDS = 15 * 60
+
+# Rendered commentary strings kept; keys are (system, tier, recent nutrients)
+COMMENTARY_CACHE_SIZE = 4096
+
+# Lookup kinds supported by the secondary receptor indexes
+LOOKUP_KINDS = ('receptor', 'gene', 'protein', 'substrate', 'location')
+
+# Receptor keys in the parsed mapping -> ReceptorType reported to clients
+RECEPTOR_TYPES: Dict[str, ReceptorType] = {
+    'iron': ReceptorType.IRON_ABSORPTION,
+    'calcium': ReceptorType.CALCIUM_CHANNELS,
+    'b_vitamins': ReceptorType.B_COMPLEX_NETWORK,
+    'fat_soluble': ReceptorType.FAT_SOLUBLE_PATHWAY,
+    'trace_minerals': ReceptorType.TRACE_MINERALS,
+}
+
+
+@dataclass(frozen=True)
+class CompiledReceptor:
+    """Receptor factors pre-resolved to canonical nutrient IDs."""
+    system: str
+    key: str
+    # (canonical ID, display name, log of the maximal fold change)
+    enhancers: Tuple[Tuple[str, str, float], ...]
+    inhibitors: Tuple[Tuple[str, str, float], ...]
+    factor_ids: FrozenSet[str]
+    substrate_ids: FrozenSet[str] = frozenset()
+
+
 class ReceptorService:
     """Service for managing receptor data and calculating efficiencies."""
     
     def __init__(self):
+        self.status_cache = LRUCache(
+            maxsize=STATUS_CACHE_SIZE,
+            ttl_seconds=STATUS_CACHE_TTL_SECONDS
+        )
+        self.commentary_cache = LRUCache(maxsize=COMMENTARY_CACHE_SIZE)
+        self.commentary_templates = self._compile_commentary_templates()
+        self.data_version = 0
+        self.reload_receptor_data()
+        
+    def reload_receptor_data(self) -> int:
+        """(Re)load the receptor dataset and rebuild everything derived from it.
+        
+        Cached statuses are computed against the previous dataset, so the
+        status cache is cleared. Returns the new data version.
+        """
         self.receptor_data = load_receptor_data()
+        self.compiled_receptors = self._compile_receptors(self.receptor_data)
+        self.receptors_by_nutrient = self._index_receptors_by_nutrient(
+            self.compiled_receptors
+        )
+        self.receptor_indexes = self._build_receptor_indexes(self.receptor_data)
+        self.engine = ReceptorMatrixEngine(self.compiled_receptors)
+        self.status_cache.clear()
+        self.data_version += 1
+        return self.data_version
+        
+    def _compile_receptors(
+        self,
+        receptor_data: Dict[str, Any]
+    ) -> Dict[str, List[CompiledReceptor]]:
+        """Resolve every enhancer/inhibitor to its canonical ID and magnitude once."""
+        compiled = {}
+        for system_key, system_data in receptor_data.items():
+            receptors = []
+            for receptor_key, receptor_info in system_data.get('receptors', {}).items():
+                enhancers = tuple(
+                    (
+                        nutrient_resolver.resolve(e['name']),
+                        e['name'],
+                        log_fold(e.get('fold_increase'), is_enhancer=True)
+                    )
+                    for e in receptor_info.get('enhancers', [])
+                )
+                inhibitors = tuple(
+                    (
+                        nutrient_resolver.resolve(i['name']),
+                        i['name'],
+                        log_fold(i.get('fold_decrease'), is_enhancer=False)
+                    )
+                    for i in receptor_info.get('inhibitors', [])
+                )
+                receptors.append(CompiledReceptor(
+                    system=system_key,
+                    key=receptor_key,
+                    enhancers=enhancers,
+                    inhibitors=inhibitors,
+                    factor_ids=frozenset(factor[0] for factor in enhancers + inhibitors),
+                    substrate_ids=nutrient_resolver.resolve_all(
+                        receptor_info.get('substrates', [])
+                    )
+                ))
+            compiled[system_key] = receptors
+        return compiled
+    
+    def _index_receptors_by_nutrient(
+        self,
+        compiled_receptors: Dict[str, List[CompiledReceptor]]
+    ) -> Dict[str, List[CompiledReceptor]]:
+        """Map each canonical nutrient ID to the receptors it affects."""
+        index: Dict[str, List[CompiledReceptor]] = {}
+        for receptors in compiled_receptors.values():
+            for receptor in receptors:
+                for canonical_id in receptor.factor_ids:
+                    index.setdefault(canonical_id, []).append(receptor)
+        return index
         
+    def _build_receptor_indexes(
+        self,
+        receptor_data: Dict[str, Any]
+    ) -> Dict[str, Dict[str, List[Dict[str, Any]]]]:
+        """Build secondary hash indexes from lookup keys to owning clusters.
+        
+        Keys are normalized once here (and per query in ``lookup_receptors``),
+        so lookups are plain dict hits. Substrates are indexed by canonical
+        nutrient ID, so "fe" and "Iron" find the same clusters.
+        """
+        indexes: Dict[str, Dict[str, List[Dict[str, Any]]]] = {
+            kind: {} for kind in LOOKUP_KINDS
+        }
+        
+        def add(kind: str, key: Optional[str], entry: Dict[str, Any]) -> None:
+            normalized = self._lookup_key(kind, key or '')
+            if not normalized:
+                return
+            entries = indexes[kind].setdefault(normalized, [])
+            if entry not in entries:
+                entries.append(entry)
+        
+        for system_key, system_data in receptor_data.items():
+            for receptor_key, receptor_info in system_data.get('receptors', {}).items():
+                entry = {
+                    "system": system_key,
+                    "cluster": receptor_key,
+                    "receptor": receptor_info
+                }
+                add('receptor', receptor_info.get('primary_receptor'), entry)
+                add('receptor', receptor_info.get('primary_receptor_name'), entry)
+                add('receptor', receptor_key, entry)
+                add('gene', receptor_info.get('gene'), entry)
+                for protein in receptor_info.get('supporting_proteins', []):
+                    add('protein', protein.get('name'), entry)
+                    add('protein', protein.get('full_name'), entry)
+                    # "ZIP1, ZIP2, ZIP3" and "THTR1/THTR2" name several proteins
+                    for part in re.split(r'[,/]', protein.get('name', '')):
+                        add('protein', part, entry)
+                for substrate in receptor_info.get('substrates', []):
+                    add('substrate', substrate, entry)
+                add('substrate', receptor_info.get('substrate'), entry)
+                location = receptor_info.get('location')
+                if location:
+                    add('location', location, entry)
+                    for part in location.split(','):
+                        add('location', part, entry)
+        return indexes
+    
+    def _lookup_key(self, kind: str, key: str) -> str:
+        """Normalize a lookup key the same way for indexing and querying."""
+        if kind == 'substrate':
+            return nutrient_resolver.resolve(key) if key.strip() else ''
+        return normalize_nutrient_name(key)
+    
+    def lookup_receptors(self, kind: str, key: str) -> List[Dict[str, Any]]:
+        """Find clusters by receptor, gene, protein, substrate or location.
+        
+        Returns ``{"system", "cluster", "receptor"}`` entries; raises
+        ValueError for an unknown lookup kind.
+        """
+        if kind not in self.receptor_indexes:
+            raise ValueError(f"Invalid lookup kind: {kind}")
+        return list(self.receptor_indexes[kind].get(self._lookup_key(kind, key), []))
+    
     def get_receptor_status(
         self, 
         nutrients: List[NutrientInput],
         user_id: Optional[str] = None
     ) -> Dict[str, SystemStatus]:
-        """Calculate receptor status based on current nutrient inputs."""
+        """Calculate receptor status based on current nutrient inputs.
+        
+        Results are memoized by the canonical nutrient doses, so the
+        returned statuses are shared and must be treated as read-only.
+        """
+        nutrient_doses = self.nutrient_doses(nutrients)
+        cache_key = self._status_fingerprint(nutrient_doses)
+        cached = self.status_cache.get(cache_key)
+        if cached is not None:
+            return dict(cached)
+        
         status = {}
+        now = datetime.now()
         
         # Calculate status for each body system
-        for system_key, system_data in self.receptor_data.items():
-            receptor_efficiencies = []
-            
+        for system_key, receptors in self.compiled_receptors.items():
             # Calculate efficiency for each receptor in the system
-            for receptor_key, receptor_info in system_data.get('receptors', {}).items():
-                efficiency = self._calculate_receptor_efficiency(
-                    receptor_info, 
-                    nutrients
-                )
-                receptor_efficiencies.append(efficiency)
+            receptor_efficiencies = [
+                self._calculate_receptor_efficiency(receptor, nutrient_doses)
+                for receptor in receptors
+            ]
+            status[system_key] = self.build_system_status(system_key, receptor_efficiencies, now)
             
-            # Create system status
-            status[system_key] = SystemStatus(
-                system=BodySystem(system_key),
-                efficiency=self._calculate_average_efficiency(receptor_efficiencies),
-                active_receptors=len(receptor_efficiencies),
-                receptor_details=receptor_efficiencies,
-                last_updated=datetime.now(),
-                notes=self._generate_system_notes(system_key, receptor_efficiencies)
+        self.status_cache.put(cache_key, status)
+        return dict(status)
+    
+    def nutrient_doses(self, nutrients: List[NutrientInput]) -> Dict[str, float]:
+        """Total dose per canonical nutrient ID for a nutrient log."""
+        doses: Dict[str, float] = {}
+        for nutrient in nutrients:
+            canonical_id = nutrient_resolver.resolve(nutrient.name)
+            doses[canonical_id] = doses.get(canonical_id, 0.0) + dose_mg(
+                canonical_id, nutrient.amount, nutrient.unit
             )
+        return doses
+    
+    def _status_fingerprint(self, nutrient_doses: Mapping[str, float]) -> Tuple:
+        """Order-independent cache key for a resolved nutrient log."""
+        return (self.data_version, tuple(sorted(nutrient_doses.items())))
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Return status and commentary cache counters plus the current data version."""
+        return {
+            **self.status_cache.stats(),
+            "data_version": self.data_version,
+            "commentary": self.commentary_cache.stats()
+        }
+    
+    def compute_system_efficiencies(
+        self,
+        nutrient_lists: Sequence[List[NutrientInput]]
+    ) -> Dict[str, np.ndarray]:
+        """Vectorized per-system efficiencies for many nutrient logs at once.
+
+        Returns one array per body system, aligned with ``nutrient_lists``.
+        Intended for bulk recomputation where only the numbers are needed.
+        """
+        doses = self.engine.vectorize([
+            self.nutrient_doses(nutrients).items() for nutrients in nutrient_lists
+        ])
+        return self.engine.system_efficiencies(self.engine.receptor_efficiencies(doses))
+    
+    def get_receptor_status_batch(
+        self,
+        nutrient_lists: Sequence[List[NutrientInput]]
+    ) -> List[Dict[str, SystemStatus]]:
+        """Calculate ``get_receptor_status`` for many nutrient logs in one pass.
+
+        Efficiencies come from a single matrix product over all logs; the
+        per-receptor factor lists are only assembled for receptors that one
+        of the logged nutrients actually touches.
+        """
+        resolved = [self.nutrient_doses(nutrients) for nutrients in nutrient_lists]
+        efficiencies = self.engine.receptor_efficiencies(
+            self.engine.vectorize([doses.items() for doses in resolved])
+        )
+        
+        results = []
+        now = datetime.now()
+        for row, present in enumerate(resolved):
+            status = {}
+            for system_key, columns in self.engine.system_slices.items():
+                receptor_efficiencies = []
+                for col in range(columns.start, columns.stop):
+                    receptor = self.engine.receptors[col]
+                    touched = not receptor.factor_ids.isdisjoint(present)
+                    receptor_efficiencies.append(ReceptorEfficiency.model_construct(
+                        receptor_id=receptor.key,
+                        receptor_type=RECEPTOR_TYPES.get(receptor.key),
+                        efficiency_percentage=float(efficiencies[row, col]),
+                        limiting_factors=[
+                            name for cid, name, _ in receptor.inhibitors if cid in present
+                        ] if touched else [],
+                        enhancement_factors=[
+                            name for cid, name, _ in receptor.enhancers if cid in present
+                        ] if touched else []
+                    ))
+                status[system_key] = self.build_system_status(
+                    system_key, receptor_efficiencies, now
+                )
+            results.append(status)
             
-        return status
+        return results
     
     def _calculate_receptor_efficiency(
         self, 
-        receptor_info: Dict[str, Any],
-        nutrients: List[NutrientInput]
+        receptor: CompiledReceptor,
+        nutrient_doses: Mapping[str, float]
     ) -> ReceptorEfficiency:
-        """Calculate efficiency for a single receptor."""
-        base_efficiency = 100.0
-        enhancer_boost = 0.0
-        inhibitor_penalty = 0.0
-        
-        # Check for enhancers
-        enhancers = receptor_info.get('enhancers', [])
-        for enhancer in enhancers:
-            for nutrient in nutrients:
-                if self._matches_nutrient(enhancer['name'], nutrient.name):
-                    enhancer_boost += 15.0  # 15% boost per enhancer
+        """Calculate efficiency for a single receptor.
+
+        ``nutrient_doses`` maps canonical nutrient IDs to their total logged
+        dose. Each matching factor scales efficiency by its fold change,
+        weighted by how saturated its dose is (see ``utils.dose_response``).
+        """
+        enhancement_factors = []
+        limiting_factors = []
+        log_effect = 0.0
+        
+        if not receptor.factor_ids.isdisjoint(nutrient_doses):
+            for canonical_id, name, weight in receptor.enhancers:
+                if canonical_id in nutrient_doses:
+                    log_effect += weight * saturation(
+                        nutrient_doses[canonical_id], half_saturation(canonical_id)
+                    )
+                    enhancement_factors.append(name)
                     
-        # Check for inhibitors
-        inhibitors = receptor_info.get('inhibitors', [])
-        for inhibitor in inhibitors:
-            for nutrient in nutrients:
-                if self._matches_nutrient(inhibitor['name'], nutrient.name):
-                    inhibitor_penalty += 20.0  # 20% penalty per inhibitor
+            for canonical_id, name, weight in receptor.inhibitors:
+                if canonical_id in nutrient_doses:
+                    log_effect += weight * saturation(
+                        nutrient_doses[canonical_id], half_saturation(canonical_id)
+                    )
+                    limiting_factors.append(name)
                     
         # Calculate final efficiency
-        efficiency_percentage = min(
-            base_efficiency + enhancer_boost - inhibitor_penalty,
-            150.0  # Max 150% efficiency
-        )
-        efficiency_percentage = max(efficiency_percentage, 20.0)  # Min 20% efficiency
+        efficiency_percentage = min(100.0 * math.exp(log_effect), MAX_EFFICIENCY)
+        efficiency_percentage = max(efficiency_percentage, MIN_EFFICIENCY)
         
-        return ReceptorEfficiency(
-            receptor_type=ReceptorType.IRON_ABSORPTION 
-            if 'iron' in receptor_info.get('primary_receptor', '').lower() 
-            else ReceptorType.VITAMIN_D,
+        # Inputs are already typed; skip pydantic validation on the hot path
+        return ReceptorEfficiency.model_construct(
+            receptor_id=receptor.key,
+            receptor_type=RECEPTOR_TYPES.get(receptor.key),
             efficiency_percentage=efficiency_percentage,
-            limiting_factors=[
-                inhibitor['name'] for inhibitor in inhibitors
-                if any(self._matches_nutrient(inhibitor['name'], n.name) for n in nutrients)
-            ],
-            enhancement_factors=[
-                enhancer['name'] for enhancer in enhancers
-                if any(self._matches_nutrient(enhancer['name'], n.name) for n in nutrients)
-            ]
+            limiting_factors=limiting_factors,
+            enhancement_factors=enhancement_factors
         )
     
-    def _matches_nutrient(self, factor_name: str, nutrient_name: str) -> bool:
-        """Check if a factor name matches a nutrient name."""
-        factor_lower = factor_name.lower()
-        nutrient_lower = nutrient_name.lower()
-        
-        # Direct match
-        if factor_lower == nutrient_lower:
-            return True
-            
-        # Common variations
-        variations = {
-            'vitamin c': ['vitamin-c', 'ascorbic acid', 'ascorbate'],
-            'vitamin d': ['vitamin-d', 'vitamin d3', 'd3', 'cholecalciferol'],
-            'calcium': ['ca', 'calcium carbonate', 'calcium citrate'],
-            'iron': ['fe', 'ferrous', 'ferric'],
-            'magnesium': ['mg', 'magnesium glycinate', 'magnesium citrate'],
-            'zinc': ['zn', 'zinc picolinate', 'zinc citrate']
-        }
-        
-        for key, values in variations.items():
-            if factor_lower in values or nutrient_lower in values:
-                if key in factor_lower or key in nutrient_lower:
-                    return True
-                    
-        return False
+    def build_system_status(
+        self,
+        system_key: str,
+        receptor_efficiencies: List[ReceptorEfficiency],
+        last_updated: Optional[datetime] = None,
+        efficiency: Optional[float] = None
+    ) -> SystemStatus:
+        """Assemble a system's status with its receptors keyed by receptor ID.
+
+        ``efficiency`` may be passed when the caller already tracks the
+        average. Built with ``model_construct``: every field is produced
+        here, so pydantic validation would only re-check our own values.
+        """
+        if efficiency is None:
+            efficiency = self._calculate_average_efficiency(receptor_efficiencies)
+        return SystemStatus.model_construct(
+            system=BodySystem(system_key),
+            efficiency=efficiency,
+            active_receptors=len(receptor_efficiencies),
+            receptor_details={rd.receptor_id: rd for rd in receptor_efficiencies},
+            last_updated=last_updated or datetime.now(),
+            notes=self._describe_efficiency(efficiency)
+        )
     
     def _calculate_average_efficiency(
         self, 
@@ -132,30 +396,21 @@ class ReceptorService:
         total = sum(e.efficiency_percentage for e in efficiencies)
         return total / len(efficiencies)
     
-    def _generate_system_notes(
-        self, 
-        system_key: str,
-        efficiencies: List[ReceptorEfficiency]
-    ) -> str:
-        """Generate notes about system status."""
-        avg_efficiency = self._calculate_average_efficiency(efficiencies)
-        
-        if avg_efficiency >= 120:
-            return "System operating at enhanced efficiency"
-        elif avg_efficiency >= 90:
-            return "System functioning optimally"
-        elif avg_efficiency >= 70:
-            return "System functioning adequately with room for improvement"
-        else:
-            return "System efficiency compromised - check limiting factors"
+    def _efficiency_tier(self, avg_efficiency: float) -> str:
+        """Tier of an average system efficiency (see ``data.commentary``)."""
+        for threshold, tier in EFFICIENCY_TIERS:
+            if avg_efficiency >= threshold:
+                return tier
+        return EFFICIENCY_TIERS[-1][1]
+    
+    def _describe_efficiency(self, avg_efficiency: float) -> str:
+        """Describe an average system efficiency."""
+        return SYSTEM_NOTES[self._efficiency_tier(avg_efficiency)]
     
     def get_receptor_info(self, receptor_name: str) -> Optional[Dict[str, Any]]:
         """Get detailed information about a specific receptor."""
-        for system_data in self.receptor_data.values():
-            for receptor_key, receptor_info in system_data.get('receptors', {}).items():
-                if receptor_info.get('primary_receptor', '').lower() == receptor_name.lower():
-                    return receptor_info
-        return None
+        matches = self.lookup_receptors('receptor', receptor_name)
+        return matches[0]['receptor'] if matches else None
     
     def get_system_receptors(self, system: str) -> Dict[str, Any]:
         """Get all receptors for a specific body system."""
@@ -163,49 +418,52 @@ class ReceptorService:
             return self.receptor_data[system].get('receptors', {})
         return {}
     
+    def _compile_commentary_templates(self) -> Dict[Tuple[str, str], Tuple[str, bool]]:
+        """Resolve the commentary table into one template per (system, tier).
+
+        Each entry is the template plus whether it mentions the efficiency,
+        which then has to be part of the rendered-text cache key.
+        """
+        compiled = {}
+        for system_key, templates in COMMENTARY_TEMPLATES.items():
+            for _, tier in EFFICIENCY_TIERS:
+                template = templates.get(tier) or templates.get(TIER_FALLBACKS.get(tier, ''))
+                if template is None:
+                    template = DEFAULT_COMMENTARY
+                compiled[(system_key, tier)] = (template, '{efficiency' in template)
+        return compiled
+    
     def generate_expert_commentary(
         self, 
         system_key: str, 
         efficiency: float,
         nutrients: List[NutrientInput]
     ) -> str:
-        """Generate expert commentary based on system efficiency and nutrients."""
-        recent_nutrients = [n.name for n in nutrients[-5:]] if nutrients else []
-        nutrient_list = ', '.join(recent_nutrients) if recent_nutrients else 'no tracked nutrients'
-        
-        if system_key == 'intestinal':
-            if efficiency >= 90:
-                return f"Your absorption patterns show excellent utilization of {nutrient_list}. The intestinal receptors are optimally primed for nutrient uptake."
-            elif efficiency >= 70:
-                return f"Good intestinal absorption detected. Recent intake of {nutrient_list} is being processed efficiently with minor optimization opportunities."
-            else:
-                return f"Absorption efficiency could be improved. Consider timing and combinations when taking {nutrient_list} for better uptake."
-                
-        elif system_key == 'hepatic':
-            if efficiency >= 90:
-                return f"Liver enzyme activity is well-supported. Your recent nutrients ({nutrient_list}) are being metabolized optimally."
-            elif efficiency >= 70:
-                return f"Hepatic processing is functioning well. The nutrients you've taken are supporting detoxification pathways adequately."
-            else:
-                return f"Liver support could be enhanced. Consider spacing your nutrient intake and supporting Phase II detoxification."
-                
-        elif system_key == 'circulatory':
-            if efficiency >= 90:
-                return f"Nutrient delivery systems are performing excellently. Your {nutrient_list} are being transported efficiently throughout your body."
-            elif efficiency >= 70:
-                return f"Good circulatory transport detected. Nutrients are reaching their targets with reasonable efficiency."
-            else:
-                return f"Transport efficiency could be improved. Consider cardiovascular support nutrients alongside {nutrient_list}."
-                
-        elif system_key == 'cellular':
-            if efficiency >= 90:
-                return f"Cellular utilization is optimal. Mitochondrial function is well-supported by your current nutrient profile including {nutrient_list}."
-            elif efficiency >= 70:
-                return f"Cells are utilizing nutrients adequately. Energy production pathways are functioning with good efficiency."
-            else:
-                return f"Cellular efficiency needs support. Consider cofactors for energy production alongside your current nutrients."
-                
-        return f"System analysis shows {efficiency:.0f}% efficiency with recent nutrients: {nutrient_list}."
+        """Generate expert commentary based on system efficiency and nutrients.
+        
+        Rendered text is cached per (system, tier, recent nutrient names),
+        so repeated status calls for the same log reuse the same string.
+        """
+        tier = self._efficiency_tier(efficiency)
+        template, uses_efficiency = self.commentary_templates.get(
+            (system_key, tier), (DEFAULT_COMMENTARY, True)
+        )
+        recent_nutrients = tuple(n.name for n in nutrients[-COMMENTARY_NUTRIENT_COUNT:])
+        cache_key = (
+            system_key,
+            tier,
+            recent_nutrients,
+            round(efficiency) if uses_efficiency else None
+        )
+        
+        commentary = self.commentary_cache.get(cache_key)
+        if commentary is None:
+            commentary = template.format(
+                nutrients=', '.join(recent_nutrients) if recent_nutrients else NO_NUTRIENTS,
+                efficiency=efficiency
+            )
+            self.commentary_cache.put(cache_key, commentary)
+        return commentary
 
 
 # Singleton instance
@@ -0,0 +1,261 @@
+"""Stateful per-user receptor sessions updated one nutrient at a time."""
+import asyncio
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from models.nutrition import NutrientInput, ReceptorEfficiency, SystemStatus
+from services.receptor_service import ReceptorService, receptor_service
+from utils.cache import LRUCache
+from utils.dose_response import dose_mg
+from utils.nutrient_resolver import nutrient_resolver
+
+# Sessions kept in memory; the least recently used go first beyond this
+MAX_SESSIONS = 10_000
+# A session nobody touched for this long is dropped
+SESSION_IDLE_SECONDS = 60 * 60
+
+# Pending pushes per live subscriber before it is told to resync instead
+SUBSCRIBER_QUEUE_SIZE = 64
+
+# Queued in place of the backlog when a subscriber falls behind; the
+# consumer replaces it with a full status snapshot
+RESYNC: Dict[str, Any] = {"type": "resync"}
+
+
+class ReceptorSession:
+    """Running receptor status for one user's nutrient log.
+
+    The session keeps the canonical nutrient doses plus the current
+    efficiency of every receptor and the per-system efficiency sums. Adding
+    or removing a nutrient only recomputes the receptors that nutrient is a
+    factor for, and reports just those receptors and their systems.
+    """
+
+    def __init__(self, service: ReceptorService, nutrients: Optional[List[NutrientInput]] = None):
+        self.service = service
+        self.version = 0
+        self._rebuild(nutrients or [])
+
+    def _rebuild(self, nutrients: List[NutrientInput]) -> None:
+        """Recompute everything from scratch against the current dataset."""
+        self.data_version = self.service.data_version
+        self.nutrients: List[NutrientInput] = list(nutrients)
+        self.nutrient_counts: Counter = Counter(
+            nutrient_resolver.resolve(n.name) for n in self.nutrients
+        )
+        self.nutrient_doses: Dict[str, float] = self.service.nutrient_doses(self.nutrients)
+        self.receptor_efficiencies: Dict[Tuple[str, str], ReceptorEfficiency] = {}
+        self.system_totals: Dict[str, float] = {}
+        self.system_sizes: Dict[str, int] = {}
+        for system_key, receptors in self.service.compiled_receptors.items():
+            for receptor in receptors:
+                efficiency = self.service._calculate_receptor_efficiency(
+                    receptor, self.nutrient_doses
+                )
+                self.receptor_efficiencies[(system_key, receptor.key)] = efficiency
+            self.system_totals[system_key] = self._system_total(system_key)
+            self.system_sizes[system_key] = len(receptors)
+
+    def _system_total(self, system_key: str) -> float:
+        """Sum of a system's receptor efficiencies, from the current values."""
+        return sum(
+            self.receptor_efficiencies[(system_key, receptor.key)].efficiency_percentage
+            for receptor in self.service.compiled_receptors[system_key]
+        )
+
+    def _is_stale(self) -> bool:
+        """True when the receptor dataset was reloaded since the last rebuild."""
+        return self.data_version != self.service.data_version
+
+    def efficiencies(self) -> Dict[Tuple[str, str], ReceptorEfficiency]:
+        """Current efficiency per (system, receptor), rebuilt after a dataset reload."""
+        if self._is_stale():
+            self._rebuild(self.nutrients)
+        return self.receptor_efficiencies
+
+    def system_efficiency(self, system_key: str) -> float:
+        """Average efficiency of a system (100% when it has no receptors)."""
+        size = self.system_sizes.get(system_key, 0)
+        return self.system_totals[system_key] / size if size else 100.0
+
+    def add(self, nutrient: NutrientInput) -> Dict[str, Dict]:
+        """Log one more nutrient and return the changed systems/receptors."""
+        self.nutrients.append(nutrient)
+        if self._is_stale():
+            self._rebuild(self.nutrients)
+            return self._full_diff()
+
+        canonical_id = nutrient_resolver.resolve(nutrient.name)
+        self.nutrient_counts[canonical_id] += 1
+        self.nutrient_doses[canonical_id] = self.nutrient_doses.get(canonical_id, 0.0) + dose_mg(
+            canonical_id, nutrient.amount, nutrient.unit
+        )
+        return self._apply(canonical_id)
+
+    def remove(self, nutrient: NutrientInput) -> Dict[str, Dict]:
+        """Remove the most recent matching nutrient and return the diff.
+
+        Raises ValueError when no logged nutrient resolves to the same
+        canonical ID.
+        """
+        canonical_id = nutrient_resolver.resolve(nutrient.name)
+        for idx in range(len(self.nutrients) - 1, -1, -1):
+            if nutrient_resolver.resolve(self.nutrients[idx].name) == canonical_id:
+                removed = self.nutrients.pop(idx)
+                break
+        else:
+            raise ValueError(f"Nutrient not in session: {nutrient.name}")
+
+        if self._is_stale():
+            self._rebuild(self.nutrients)
+            return self._full_diff()
+
+        self.nutrient_counts[canonical_id] -= 1
+        if self.nutrient_counts[canonical_id] <= 0:
+            # Drop the entry outright so float residue never lingers
+            del self.nutrient_counts[canonical_id]
+            del self.nutrient_doses[canonical_id]
+        else:
+            self.nutrient_doses[canonical_id] -= dose_mg(
+                canonical_id, removed.amount, removed.unit
+            )
+        return self._apply(canonical_id)
+
+    def _apply(self, canonical_id: str) -> Dict[str, Dict]:
+        """Recompute the receptors affected by ``canonical_id``."""
+        self.version += 1
+        changed: Dict[str, List[ReceptorEfficiency]] = {}
+        for receptor in self.service.receptors_by_nutrient.get(canonical_id, []):
+            key = (receptor.system, receptor.key)
+            previous = self.receptor_efficiencies[key]
+            current = self.service._calculate_receptor_efficiency(
+                receptor, self.nutrient_doses
+            )
+            if current == previous:
+                continue
+            self.receptor_efficiencies[key] = current
+            changed.setdefault(receptor.system, []).append(current)
+
+        # Summed afresh rather than adjusted by deltas, so float error
+        # cannot build up over long add/remove sequences
+        for system_key in changed:
+            self.system_totals[system_key] = self._system_total(system_key)
+
+        return {
+            system_key: self._system_diff(system_key, receptors)
+            for system_key, receptors in changed.items()
+        }
+
+    def _full_diff(self) -> Dict[str, Dict]:
+        """Diff covering every receptor, used after a dataset reload."""
+        self.version += 1
+        changed: Dict[str, List[ReceptorEfficiency]] = {
+            system_key: [] for system_key in self.system_totals
+        }
+        for (system_key, _), efficiency in self.receptor_efficiencies.items():
+            changed[system_key].append(efficiency)
+        return {
+            system_key: self._system_diff(system_key, receptors)
+            for system_key, receptors in changed.items()
+        }
+
+    def _system_diff(self, system_key: str, receptors: List[ReceptorEfficiency]) -> Dict:
+        """System-level summary plus the receptors that changed in it."""
+        efficiency = self.system_efficiency(system_key)
+        return {
+            "efficiency": efficiency,
+            "notes": self.service._describe_efficiency(efficiency),
+            "receptors": receptors,
+        }
+
+    def status(self) -> Dict[str, SystemStatus]:
+        """Full status in the same shape as ``get_receptor_status``."""
+        if self._is_stale():
+            self._rebuild(self.nutrients)
+        status = {}
+        now = datetime.now()
+        for system_key, receptors in self.service.compiled_receptors.items():
+            details = [self.receptor_efficiencies[(system_key, r.key)] for r in receptors]
+            status[system_key] = self.service.build_system_status(
+                system_key, details, now, efficiency=self.system_efficiency(system_key)
+            )
+        return status
+
+
+class ReceptorSessionManager:
+    """Keep one receptor session per user and fan its updates out.
+
+    Live connections (WebSocket or server-sent events) subscribe to a
+    user's session and receive every message published for that user on
+    their own queue, so a change made on one connection, or through the
+    REST endpoints, reaches all of them.
+
+    Sessions live in a bounded LRU cache: one untouched for
+    ``SESSION_IDLE_SECONDS`` expires, and beyond ``MAX_SESSIONS`` the
+    least recently used is evicted, so clients inventing user IDs
+    cannot grow memory without bound.
+    """
+
+    def __init__(self, service: ReceptorService):
+        self.service = service
+        self.sessions = LRUCache(maxsize=MAX_SESSIONS, ttl_seconds=SESSION_IDLE_SECONDS)
+        self.subscribers: Dict[str, Set[asyncio.Queue]] = {}
+
+    def get(self, user_id: str) -> Optional[ReceptorSession]:
+        """The user's live session, or None; using it restarts its idle timer."""
+        session = self.sessions.get(user_id)
+        if session is not None:
+            self.sessions.put(user_id, session)
+        return session
+
+    def get_or_create(self, user_id: str) -> ReceptorSession:
+        """Get the user's session, starting an empty one if needed."""
+        session = self.get(user_id)
+        if session is None:
+            session = ReceptorSession(self.service)
+            self.sessions.put(user_id, session)
+        return session
+
+    def reset(self, user_id: str) -> None:
+        """Drop a user's session."""
+        self.sessions.pop(user_id, None)
+
+    def subscribe(self, user_id: str) -> asyncio.Queue:
+        """Register a live connection and return its message queue."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self.subscribers.setdefault(user_id, set()).add(queue)
+        return queue
+
+    def unsubscribe(self, user_id: str, queue: asyncio.Queue) -> None:
+        """Forget a live connection."""
+        queues = self.subscribers.get(user_id)
+        if queues is None:
+            return
+        queues.discard(queue)
+        if not queues:
+            del self.subscribers[user_id]
+
+    def publish(self, user_id: str, message: Dict[str, Any]) -> None:
+        """Queue a message for every live connection of a user.
+
+        Must be called from the event loop. A subscriber whose queue is
+        full has its backlog replaced by ``RESYNC``, since the deltas it
+        missed cannot be applied out of order anyway.
+        """
+        for queue in self.subscribers.get(user_id, ()):
+            self.send(queue, message)
+
+    @staticmethod
+    def send(queue: asyncio.Queue, message: Dict[str, Any]) -> None:
+        """Queue a message for one connection, resyncing it if its queue is full."""
+        try:
+            queue.put_nowait(message)
+        except asyncio.QueueFull:
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(RESYNC)
+
+
+# Singleton instance
+receptor_sessions = ReceptorSessionManager(receptor_service)
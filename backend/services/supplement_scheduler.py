@@ -0,0 +1,322 @@
+"""Assign a day's supplements and foods to the four mission time windows."""
+import asyncio
+import math
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from data.missions import TimeWindow
+from models.nutrition import NutrientInput
+from services.interaction_graph import InteractionGraph, interaction_graph
+from services.receptor_service import ReceptorService, receptor_service
+from utils.dose_response import (
+    DEFAULT_FOLD_DECREASE,
+    DEFAULT_FOLD_INCREASE,
+    dose_mg,
+    half_saturation,
+    saturation,
+)
+from utils.nutrient_resolver import nutrient_resolver
+from utils.timing import local_naive
+
+WINDOWS: List[TimeWindow] = list(TimeWindow)
+
+# Local hours covered by each window (matches TIME_WINDOW_HOURS in the client).
+# Intakes logged outside these hours are pinned to the nearest window.
+WINDOW_HOURS = {
+    TimeWindow.MORNING: (6, 10),
+    TimeWindow.MIDDAY: (10, 14),
+    TimeWindow.AFTERNOON: (14, 18),
+    TimeWindow.EVENING: (18, 22),
+}
+
+# Log-efficiency bonus for a window a timing rule recommends, and the
+# penalty/bonus for graph interactions the receptor model gives no magnitude for
+TIMING_BONUS = math.log(DEFAULT_FOLD_INCREASE)
+COMPETITION_COST = math.log(DEFAULT_FOLD_DECREASE)
+SYNERGY_GAIN = math.log(DEFAULT_FOLD_INCREASE)
+
+# Timing rules of the interaction matrix, as the windows they favour
+WINDOW_PREFERENCES: Dict[str, List[TimeWindow]] = {
+    # "Best absorbed on empty stomach"
+    'iron': [TimeWindow.MORNING],
+    # "Evening supplementation for better absorption"
+    'magnesium': [TimeWindow.EVENING],
+    # "Requires intrinsic factor from previous meal"
+    'vitamin_b12': [TimeWindow.MIDDAY, TimeWindow.AFTERNOON, TimeWindow.EVENING],
+    # "Require dietary fat for absorption": the main meals
+    'vitamin_a': [TimeWindow.MIDDAY, TimeWindow.EVENING],
+    'vitamin_d': [TimeWindow.MIDDAY, TimeWindow.EVENING],
+    'vitamin_e': [TimeWindow.MIDDAY, TimeWindow.EVENING],
+    'vitamin_k': [TimeWindow.MIDDAY, TimeWindow.EVENING],
+}
+
+# "Better absorbed in smaller doses throughout day": doses compete with each other
+SPLIT_DOSE_NUTRIENTS = {'calcium'}
+
+# Wall-clock limit for the search; the best schedule found so far is returned
+DEFAULT_TIME_BUDGET_SECONDS = 1.0
+MAX_TIME_BUDGET_SECONDS = 10.0
+SCHEDULER_WORKERS = 2
+
+# Nodes expanded between time-budget checks
+_CLOCK_INTERVAL = 256
+
+
+def solve_schedule(
+    unary: List[List[float]],
+    pairs: List[List[float]],
+    allowed: List[List[int]],
+    time_budget: float
+) -> Dict[str, Any]:
+    """Branch-and-bound search for the best window of each item.
+
+    Maximizes ``sum(unary[i][w_i]) + sum(pairs[i][j] for i < j if w_i == w_j)``
+    with item ``i`` restricted to the windows in ``allowed[i]``. Items are
+    branched most-interacting first, starting from a greedy incumbent.
+    A node is pruned when its score plus an optimistic bound for the
+    remaining items (best window per item given the items already placed,
+    plus every positive pair still open) cannot beat the incumbent.
+
+    Pure function of plain lists, so it can run in a worker process.
+    """
+    n = len(unary)
+    deadline = time.monotonic() + time_budget
+    order = sorted(
+        range(n),
+        key=lambda i: (len(allowed[i]), -sum(abs(p) for p in pairs[i]))
+    )
+    window_count = len(unary[0]) if n else 0
+
+    # Positive pair mass among order[k:], the optimistic bound for open pairs
+    open_gain = [0.0] * (n + 1)
+    for k in range(n - 1, -1, -1):
+        i = order[k]
+        open_gain[k] = open_gain[k + 1] + sum(
+            max(0.0, pairs[i][order[t]]) for t in range(k + 1, n)
+        )
+
+    # gain[i][w]: value of placing item i in window w given the items placed so far
+    gain = [list(row) for row in unary]
+    assignment = [-1] * n
+
+    # Windows no item can tell apart are interchangeable while empty, so only
+    # the first empty window of each such class is branched on
+    window_class = []
+    for w in range(window_count):
+        signature = tuple((unary[i][w], w in allowed[i]) for i in range(n))
+        window_class.append(next(
+            (v for v in range(w) if window_class[v] == v and signature == tuple(
+                (unary[i][v], v in allowed[i]) for i in range(n)
+            )),
+            w
+        ))
+    occupancy = [0] * window_count
+
+    def place(i: int, w: int, sign: float) -> None:
+        for j in range(n):
+            if j != i:
+                gain[j][w] += sign * pairs[i][j]
+
+    # Greedy incumbent
+    for i in order:
+        w = max(allowed[i], key=lambda w: gain[i][w])
+        assignment[i] = w
+        place(i, w, 1.0)
+    best_score = sum(unary[i][assignment[i]] for i in range(n)) + sum(
+        pairs[i][j]
+        for i in range(n) for j in range(i + 1, n)
+        if assignment[i] == assignment[j]
+    )
+    best = list(assignment)
+    for i in order:
+        place(i, assignment[i], -1.0)
+        assignment[i] = -1
+
+    nodes = 0
+    timed_out = False
+
+    def search(k: int, score: float) -> None:
+        nonlocal best_score, best, nodes, timed_out
+        if k == n:
+            if score > best_score + 1e-12:
+                best_score = score
+                best = list(assignment)
+            return
+
+        nodes += 1
+        if nodes % _CLOCK_INTERVAL == 0 and time.monotonic() > deadline:
+            timed_out = True
+        if timed_out:
+            return
+
+        bound = score + open_gain[k]
+        for t in range(k, n):
+            j = order[t]
+            bound += max(gain[j][w] for w in allowed[j])
+        if bound <= best_score + 1e-12:
+            return
+
+        i = order[k]
+        tried_empty = set()
+        for w in sorted(allowed[i], key=lambda w: -gain[i][w]):
+            if occupancy[w] == 0:
+                if window_class[w] in tried_empty:
+                    continue
+                tried_empty.add(window_class[w])
+            value = gain[i][w]
+            assignment[i] = w
+            occupancy[w] += 1
+            place(i, w, 1.0)
+            search(k + 1, score + value)
+            place(i, w, -1.0)
+            occupancy[w] -= 1
+            assignment[i] = -1
+            if timed_out:
+                return
+
+    if n and window_count:
+        search(0, 0.0)
+
+    return {
+        "assignment": best,
+        "score": best_score,
+        "optimal": not timed_out,
+        "nodes": nodes,
+    }
+
+
+class SupplementScheduler:
+    """Build scheduling problems from the receptor model and solve them off-loop.
+
+    The value of a schedule is the summed log efficiency change of the
+    receptors whose substrate is taken, counting only factors taken in the
+    same window. Maximizing it maximizes the product of those receptors'
+    efficiencies.
+    Pairs the receptor model does not relate fall back to the interaction
+    graph, and the matrix timing rules become per-window bonuses. Items
+    with a ``timing`` are pinned to the window it falls in.
+    """
+
+    def __init__(self, service: ReceptorService, graph: InteractionGraph):
+        self.service = service
+        self.graph = graph
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def build_problem(self, nutrients: List[NutrientInput]) -> Dict[str, Any]:
+        """Precompute unary and pairwise costs for a list of items."""
+        canonical = [nutrient_resolver.resolve(n.name) for n in nutrients]
+        strength = [
+            saturation(dose_mg(cid, n.amount, n.unit), half_saturation(cid))
+            for cid, n in zip(canonical, nutrients)
+        ]
+
+        # Factor weights of the receptors each present nutrient is a substrate of
+        present = set(canonical)
+        substrate_weights: Dict[str, Dict[str, float]] = {}
+        for receptors in self.service.compiled_receptors.values():
+            for receptor in receptors:
+                for substrate_id in receptor.substrate_ids & present:
+                    weights = substrate_weights.setdefault(substrate_id, {})
+                    for cid, _, weight in receptor.enhancers + receptor.inhibitors:
+                        weights[cid] = weights.get(cid, 0.0) + weight
+
+        graph_weights: Dict[str, Dict[str, float]] = {}
+        for cid in present:
+            for edge in self.graph.adjacency.get(cid, ()):
+                # B12/folate both compete and cooperate; the effects add up
+                value = COMPETITION_COST if edge.kind == 'competition' else SYNERGY_GAIN
+                weights = graph_weights.setdefault(cid, {})
+                weights[edge.nutrient] = weights.get(edge.nutrient, 0.0) + value
+
+        n = len(nutrients)
+        pairs = [[0.0] * n for _ in range(n)]
+        for i in range(n):
+            for j in range(i + 1, n):
+                a, b = canonical[i], canonical[j]
+                value = (
+                    substrate_weights.get(a, {}).get(b, 0.0) * strength[j]
+                    + substrate_weights.get(b, {}).get(a, 0.0) * strength[i]
+                )
+                if value == 0.0:
+                    if a == b and a in SPLIT_DOSE_NUTRIENTS:
+                        value = COMPETITION_COST
+                    else:
+                        value = graph_weights.get(a, {}).get(b, 0.0)
+                pairs[i][j] = pairs[j][i] = value
+
+        unary = [
+            [
+                TIMING_BONUS if window in WINDOW_PREFERENCES.get(cid, ()) else 0.0
+                for window in WINDOWS
+            ]
+            for cid in canonical
+        ]
+        allowed = [
+            [WINDOWS.index(self._window_at(n.timing))] if n.timing else list(range(len(WINDOWS)))
+            for n in nutrients
+        ]
+        return {"unary": unary, "pairs": pairs, "allowed": allowed}
+
+    @staticmethod
+    def _window_at(timing: datetime) -> TimeWindow:
+        """Window containing a time's local hour, or the nearest one."""
+        hour = local_naive(timing).hour
+        for window, (start, end) in WINDOW_HOURS.items():
+            if start <= hour < end:
+                return window
+        return TimeWindow.MORNING if hour < WINDOW_HOURS[TimeWindow.MORNING][0] else TimeWindow.EVENING
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=SCHEDULER_WORKERS)
+        return self._executor
+
+    def shutdown(self) -> None:
+        """Stop the worker processes, if any were started."""
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    async def optimize(
+        self,
+        nutrients: List[NutrientInput],
+        time_budget: float = DEFAULT_TIME_BUDGET_SECONDS
+    ) -> Dict[str, Any]:
+        """Find the best window per item without blocking the event loop."""
+        problem = self.build_problem(nutrients)
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(
+            self._get_executor(),
+            solve_schedule,
+            problem["unary"],
+            problem["pairs"],
+            problem["allowed"],
+            min(time_budget, MAX_TIME_BUDGET_SECONDS)
+        )
+
+        schedule: Dict[str, List[NutrientInput]] = {window.value: [] for window in WINDOWS}
+        for nutrient, w in zip(nutrients, result["assignment"]):
+            schedule[WINDOWS[w].value].append(nutrient)
+
+        efficiencies = self.service.compute_system_efficiencies(list(schedule.values()))
+        windows = {}
+        for row, (window, items) in enumerate(schedule.items()):
+            windows[window] = {
+                "items": [item.model_dump(mode="json") for item in items],
+                "system_efficiency": {
+                    system_key: float(values[row]) for system_key, values in efficiencies.items()
+                } if items else {}
+            }
+
+        return {
+            "windows": windows,
+            "score": result["score"],
+            "optimal": result["optimal"],
+            "explored_nodes": result["nodes"]
+        }
+
+
+# Singleton instance
+supplement_scheduler = SupplementScheduler(receptor_service, interaction_graph)
@@ -1,149 +1,533 @@
 """Parser for converting receptor mapping markdown to structured data."""
 import re
-from typing import Dict, List, Any
+import copy
+import hashlib
+import logging
+import os
+import stat
+import tempfile
+import unicodedata
+from functools import lru_cache
+from typing import Dict, List, Any, Optional
 from pathlib import Path
 import json
 
+from utils.nutrient_resolver import nutrient_resolver
+
+logger = logging.getLogger(__name__)
+
+MAPPING_PATH = Path(__file__).parent.parent.parent / 'data' / 'complete_receptor_mapping.md'
+COMPILED_PATH = MAPPING_PATH.with_suffix('.compiled.json')
+
+# Bump whenever the parsed structure changes so stale artifacts are rebuilt
+FORMAT_VERSION = 2
+
+# "### 1. **Intestinal Absorption (🔬)**" overview headings -> system key
+SYSTEM_OVERVIEW_NAMES = {
+    'intestinal absorption': 'intestinal',
+    'hepatic processing': 'hepatic',
+    'circulatory transport': 'circulatory',
+    'cellular utilization': 'cellular',
+}
+
+# "### INTESTINAL ABSORPTION SYSTEM" detail headings -> system key
+SYSTEM_SECTIONS = {
+    'intestinal absorption system': 'intestinal',
+    'hepatic processing system': 'hepatic',
+    'circulatory transport system': 'circulatory',
+    'cellular utilization system': 'cellular',
+}
+
+# Stable cluster IDs for the "####" headings; others fall back to a slug
+CLUSTER_KEYS = {
+    'iron absorption complex': 'iron',
+    'calcium channel complex': 'calcium',
+    'b-vitamin transport networks': 'b_vitamins',
+    'fat-soluble vitamin pathway': 'fat_soluble',
+    'trace mineral transporters': 'trace_minerals',
+    'phase i metabolism (cytochrome p450)': 'phase_1',
+    'phase ii conjugation': 'phase_2',
+    'vitamin storage systems': 'vitamin_storage',
+    'transport protein networks': 'transport_proteins',
+    'vascular function optimization': 'vascular_function',
+    'mitochondrial energy production': 'mitochondria',
+    'protein synthesis machinery': 'protein_synthesis',
+}
+
+# "- **Gene**: SLC11A2" style labels copied onto the cluster as fields
+FIELD_LABELS = {
+    'gene': 'gene',
+    'location': 'location',
+    'substrate specificity': 'substrate',
+    'transport mechanism': 'mechanism',
+    'regulation': 'regulation',
+}
+
+# Labels (bullet or group) whose items inhibit / enhance the cluster
+INHIBITOR_LABELS = {'competitive inhibitors', 'competition', 'inhibition'}
+ENHANCER_LABELS = {
+    'enhancement factors', 'enhancement', 'cofactor', 'cofactors',
+    'nutritional cofactors', 'nutrients', 'synthesis', 'antioxidant network',
+    'anti-inflammatory', 'vasodilation',
+}
+
+# Groups whose bullet labels name a required nutrient (cofactor)
+COFACTOR_GROUPS = {'cofactor requirements', 'translation requirements'}
+
+# Groups whose bullet labels name a nutrient the cluster carries (substrate)
+SUBSTRATE_GROUPS = {'individual transport proteins', 'fat-soluble vitamin storage'}
+
+# Group headings such as "**Zinc Transport System**" name a substrate
+SUBSTRATE_GROUP_PATTERN = re.compile(r'^(.+?)\s+(?:transport system|transport|pathway)$', re.I)
+
+INTERACTION_SECTIONS = {
+    'competition interactions (negative)': 'competition',
+    'synergy interactions (positive)': 'synergy',
+}
+
+BOLD_FIELD = re.compile(r'^\*\*(.+?)\*\*:\s*(.*)$')
+BOLD_BULLET = re.compile(r'^(?:-|\d+\.)\s+\*\*(.+?)\*\*:\s*(.*)$')
+PLAIN_BULLET = re.compile(r'^-\s+(.+?):\s*(.*)$')
+OVERVIEW_HEADING = re.compile(r'^###\s+\d+\.\s+\*\*(.+?)\s*\((.+?)\)\*\*')
+TRAILING_PARENS = re.compile(r'\(([^()]*)\)\s*$')
+STEP_LABEL = re.compile(r'^step\s+\d+$', re.I)
+ITEM_QUALIFIERS = re.compile(r'\s+(?:for|at)\s+.*$|\s+synergy$', re.I)
+
 
 class ReceptorMappingParser:
-    """Parse the complete_receptor_mapping.md file into structured data."""
-    
+    """Parse the complete_receptor_mapping.md file into structured data.
+
+    Single pass over the document's lines: every ``####`` heading under the
+    detailed mapping becomes a receptor cluster, and the interaction matrix
+    becomes lists of competition/synergy/timing entries.
+    """
+
     def __init__(self, markdown_path: Path):
         self.markdown_path = markdown_path
         self.receptor_data = {}
-        
+        self.interactions = {}
+
     def parse(self) -> Dict[str, Any]:
         """Parse the markdown file and return structured receptor data."""
-        with open(self.markdown_path, 'r') as f:
+        with open(self.markdown_path, 'r', encoding='utf-8') as f:
             content = f.read()
-            
-        # Parse each body system section
+        return self.parse_text(content)
+
+    def parse_text(self, content: str) -> Dict[str, Any]:
+        """Parse markdown text; also fills ``self.interactions``."""
+        # Fold sub/superscripts (D₃, Fe²⁺) so names match user spellings
+        content = unicodedata.normalize('NFKC', content)
+
         self.receptor_data = {
-            'intestinal': self._parse_intestinal_system(content),
-            'hepatic': self._parse_hepatic_system(content),
-            'circulatory': self._parse_circulatory_system(content),
-            'cellular': self._parse_cellular_system(content)
+            system_key: {'name': '', 'icon': '', 'description': '', 'receptors': {}}
+            for system_key in SYSTEM_SECTIONS.values()
         }
-        
+        self.interactions = {'competition': [], 'synergy': [], 'timing': []}
+
+        section = None
+        code_block: Optional[List[str]] = None
+        code_blocks: List[str] = []
+        overview_system = None
+        system_key = None
+        cluster = None
+        interaction_kind = None
+
+        for raw_line in content.splitlines():
+            line = raw_line.strip()
+            if line.startswith('```'):
+                if code_block is None:
+                    code_block = []
+                else:
+                    code_blocks.append('\n'.join(code_block))
+                    code_block = None
+                continue
+            if code_block is not None:
+                code_block.append(raw_line)
+                continue
+            if not line:
+                continue
+
+            if line.startswith('## '):
+                section = line[3:].strip().lower()
+                system_key = cluster = interaction_kind = overview_system = None
+                continue
+
+            if section == 'body system coverage analysis':
+                overview_system = self._parse_overview_line(line, overview_system)
+            elif section == 'detailed receptor mapping by system':
+                if line.startswith('#### '):
+                    cluster = self._start_cluster(system_key, line[5:].strip())
+                elif line.startswith('### '):
+                    system_key = SYSTEM_SECTIONS.get(line[4:].strip().lower())
+                    cluster = None
+                elif cluster is not None:
+                    self._parse_cluster_line(cluster, line)
+            elif section == 'comprehensive interaction matrix':
+                if line.startswith('### '):
+                    heading = line[4:].strip().lower()
+                    interaction_kind = INTERACTION_SECTIONS.get(
+                        heading, 'timing' if heading == 'timing dependencies' else None
+                    )
+                elif interaction_kind is not None:
+                    self._parse_interaction_line(interaction_kind, line)
+
+        for block in code_blocks:
+            self._apply_cluster_example(block)
+
+        for system_data in self.receptor_data.values():
+            for receptor_info in system_data['receptors'].values():
+                self._finish_cluster(receptor_info)
+
         return self.receptor_data
-    
-    def _parse_intestinal_system(self, content: str) -> Dict[str, Any]:
-        """Parse intestinal absorption system data."""
-        intestinal_data = {
-            'name': 'Intestinal Absorption',
-            'icon': '=,',
-            'description': 'Nutrient uptake from food through specialized transporters',
-            'receptors': {}
-        }
-        
-        # Extract Iron Absorption Complex
-        iron_section = self._extract_section(content, 'Iron Absorption Complex', 'Calcium Channel Complex')
-        if iron_section:
-            intestinal_data['receptors']['iron'] = {
-                'primary_receptor': 'DMT1',
-                'gene': 'SLC11A2',
-                'location': 'Duodenal enterocytes, brush border membrane',
-                'substrate': 'Fe2+ (ferrous iron only)',
-                'mechanism': 'H+-coupled symport',
-                'supporting_proteins': [
-                    {'name': 'Dcytb', 'function': 'Reduces Fe3+ to Fe2+'},
-                    {'name': 'Hephaestin', 'function': 'Copper-dependent ferroxidase'},
-                    {'name': 'Ferroportin', 'function': 'Only iron export protein'},
-                    {'name': 'HCP1', 'function': 'Direct heme iron uptake'}
-                ],
-                'inhibitors': [
-                    {'name': 'Calcium', 'mechanism': 'Competes for DMT1 binding'},
-                    {'name': 'Zinc', 'mechanism': 'Uses same transporter'},
-                    {'name': 'Copper', 'mechanism': 'Shared pathway competition'},
-                    {'name': 'Manganese', 'mechanism': 'DMT1 substrate competition'}
-                ],
-                'enhancers': [
-                    {'name': 'Vitamin C', 'mechanism': 'Maintains Fe�z state, enhances Dcytb activity'},
-                    {'name': 'Citric acid', 'mechanism': 'Chelation and pH optimization'},
-                    {'name': 'Empty stomach', 'mechanism': 'Acidic environment favors Fe�z reduction'},
-                    {'name': 'Heme iron', 'mechanism': 'Bypasses competition via HCP1'}
-                ]
-            }
-        
-        # Extract Calcium Channel Complex
-        calcium_section = self._extract_section(content, 'Calcium Channel Complex', 'B-Vitamin Transport Networks')
-        if calcium_section:
-            intestinal_data['receptors']['calcium'] = {
-                'primary_receptor': 'TRPV6',
-                'gene': 'TRPV6',
-                'location': 'Small intestine epithelial cells',
-                'mechanism': 'Voltage-independent Ca2+ channel',
-                'regulation': 'Vitamin D3 (calcitriol) dependent',
-                'supporting_proteins': [
-                    {'name': 'Calbindin-D9k', 'function': 'Intracellular calcium binding protein'},
-                    {'name': 'PMCA1b', 'function': 'Calcium ATPase for extrusion'},
-                    {'name': 'NCX1', 'function': 'Na+/Ca2+ exchanger'}
-                ],
-                'inhibitors': [
-                    {'name': 'Magnesium', 'mechanism': 'Competes for TRPV6 binding'},
-                    {'name': 'Lead', 'mechanism': 'Toxic metal competition'},
-                    {'name': 'Phytates', 'mechanism': 'Chelation and precipitation'},
-                    {'name': 'High fiber', 'mechanism': 'Physical binding and reduced bioavailability'}
-                ],
-                'enhancers': [
-                    {'name': 'Vitamin D3', 'mechanism': 'Upregulates TRPV6 expression'},
-                    {'name': 'Vitamin K2', 'mechanism': 'Optimizes calcium utilization'},
-                    {'name': 'Magnesium', 'mechanism': 'Required for vitamin D activation'},
-                    {'name': 'Optimal pH', 'mechanism': 'Acidic environment improves solubility'}
-                ]
-            }
-        
-        return intestinal_data
-    
-    def _parse_hepatic_system(self, content: str) -> Dict[str, Any]:
-        """Parse hepatic processing system data."""
-        return {
-            'name': 'Hepatic Processing',
-            'icon': '<�',
-            'description': 'Metabolic conversion, storage, and detoxification',
-            'receptors': {}
-        }
-    
-    def _parse_circulatory_system(self, content: str) -> Dict[str, Any]:
-        """Parse circulatory transport system data."""
-        return {
-            'name': 'Circulatory Transport',
-            'icon': '=�',
-            'description': 'Nutrient delivery to tissues via blood and lymphatic systems',
-            'receptors': {}
+
+    def _parse_overview_line(self, line: str, overview_system: Optional[str]) -> Optional[str]:
+        """Read system names, icons and primary functions from the overview."""
+        heading = OVERVIEW_HEADING.match(line)
+        if heading:
+            name, icon = heading.group(1).strip(), heading.group(2).strip()
+            overview_system = SYSTEM_OVERVIEW_NAMES.get(name.lower())
+            if overview_system:
+                self.receptor_data[overview_system]['name'] = name
+                self.receptor_data[overview_system]['icon'] = icon
+            return overview_system
+
+        bullet = BOLD_BULLET.match(line)
+        if overview_system and bullet and bullet.group(1).lower() == 'primary function':
+            self.receptor_data[overview_system]['description'] = bullet.group(2).strip()
+        return overview_system
+
+    def _start_cluster(self, system_key: Optional[str], heading: str) -> Optional[Dict[str, Any]]:
+        """Create the cluster for a ``####`` heading."""
+        if system_key is None:
+            return None
+
+        cluster_key = CLUSTER_KEYS.get(heading.lower()) or re.sub(
+            r'[^a-z0-9]+', '_', heading.lower()
+        ).strip('_')
+        cluster = {
+            'name': heading,
+            'primary_receptor': '',
+            'supporting_proteins': [],
+            'inhibitors': [],
+            'enhancers': [],
+            'substrates': [],
+            'steps': [],
+            'groups': [],
+            '_group': None,
         }
-    
-    def _parse_cellular_system(self, content: str) -> Dict[str, Any]:
-        """Parse cellular utilization system data."""
+        # "Iron Absorption Complex" -> the cluster carries iron
+        first_word = heading.split()[0]
+        if nutrient_resolver.is_known(first_word):
+            cluster['substrates'].append(first_word)
+
+        self.receptor_data[system_key]['receptors'][cluster_key] = cluster
+        return cluster
+
+    def _parse_cluster_line(self, cluster: Dict[str, Any], line: str) -> None:
+        """Apply one body line of a ``####`` section to its cluster."""
+        group = cluster['_group']
+
+        bold_field = BOLD_FIELD.match(line)
+        if bold_field:
+            label, value = bold_field.group(1).strip(), bold_field.group(2).strip()
+            if label.lower() == 'primary receptor':
+                name, full_name = self._split_parenthetical(value)
+                cluster['primary_receptor'] = name
+                cluster['primary_receptor_name'] = full_name or name
+            elif value:
+                self._apply_labelled_value(cluster, label, value, group)
+            else:
+                cluster['_group'] = label.lower()
+                cluster['groups'].append(label)
+                substrate = SUBSTRATE_GROUP_PATTERN.match(label)
+                if substrate:
+                    name, _ = self._split_parenthetical(substrate.group(1))
+                    if nutrient_resolver.is_known(name):
+                        cluster['substrates'].append(name)
+            return
+
+        if re.match(r'^\d+\.', line):
+            step = BOLD_BULLET.match(line)
+            if step:
+                cluster['steps'].append({
+                    'name': step.group(1).strip(),
+                    'description': step.group(2).strip()
+                })
+            return
+
+        bold_bullet = BOLD_BULLET.match(line)
+        if bold_bullet and STEP_LABEL.match(bold_bullet.group(1)):
+            cluster['steps'].append({
+                'name': bold_bullet.group(1).strip(),
+                'description': bold_bullet.group(2).strip()
+            })
+        elif bold_bullet:
+            self._apply_labelled_value(
+                cluster, bold_bullet.group(1).strip(), bold_bullet.group(2).strip(), group
+            )
+            return
+
+        plain_bullet = PLAIN_BULLET.match(line)
+        if plain_bullet and group in INHIBITOR_LABELS | ENHANCER_LABELS:
+            name, _ = self._split_parenthetical(plain_bullet.group(1).strip())
+            factor = {'name': name, 'mechanism': plain_bullet.group(2).strip()}
+            if group in INHIBITOR_LABELS:
+                cluster['inhibitors'].append(factor)
+            else:
+                cluster['enhancers'].append(factor)
+
+    def _apply_labelled_value(
+        self,
+        cluster: Dict[str, Any],
+        label: str,
+        value: str,
+        group: Optional[str]
+    ) -> None:
+        """Handle a ``**Label**: value`` entry inside a cluster."""
+        label_lower = label.lower()
+
+        if label_lower in FIELD_LABELS:
+            cluster[FIELD_LABELS[label_lower]] = value
+            if label_lower == 'substrate specificity':
+                name, _ = self._split_parenthetical(value)
+                if nutrient_resolver.is_known(name):
+                    cluster['substrates'].append(name)
+        elif label_lower in INHIBITOR_LABELS:
+            cluster['inhibitors'].extend(
+                {'name': item, 'mechanism': label} for item in self._split_items(value)
+            )
+        elif label_lower in ENHANCER_LABELS:
+            cluster['enhancers'].extend(
+                {'name': item, 'mechanism': label} for item in self._split_items(value)
+            )
+        elif group in COFACTOR_GROUPS:
+            cluster['enhancers'].extend(
+                {'name': item, 'mechanism': value} for item in self._split_items(label)
+            )
+        else:
+            name, full_name = self._split_parenthetical(label)
+            protein = {'name': name, 'function': value}
+            if full_name:
+                protein['full_name'] = full_name
+            cluster['supporting_proteins'].append(protein)
+
+            if group in SUBSTRATE_GROUPS and nutrient_resolver.is_known(name):
+                cluster['substrates'].append(name)
+
+            # "NADH dehydrogenase (riboflavin, iron)" lists required cofactors
+            cofactors = TRAILING_PARENS.search(value)
+            if cofactors and ',' in cofactors.group(1):
+                cluster['enhancers'].extend(
+                    {'name': item, 'mechanism': f"{name} cofactor"}
+                    for item in self._split_items(cofactors.group(1))
+                )
+
+    def _finish_cluster(self, cluster: Dict[str, Any]) -> None:
+        """Fill derived fields and drop duplicate factors."""
+        cluster.pop('_group', None)
+        if not cluster['primary_receptor']:
+            proteins = cluster['supporting_proteins']
+            cluster['primary_receptor'] = proteins[0]['name'] if proteins else cluster['name']
+        if 'primary_receptor_name' in cluster:
+            cluster['description'] = cluster['primary_receptor_name']
+        else:
+            cluster['description'] = ', '.join(cluster['groups'])
+
+        for key in ('inhibitors', 'enhancers'):
+            seen = set()
+            unique = []
+            for factor in cluster[key]:
+                canonical_id = nutrient_resolver.resolve(factor['name'])
+                if canonical_id not in seen:
+                    seen.add(canonical_id)
+                    unique.append(factor)
+            cluster[key] = unique
+
+        substrates = {}
+        for name in cluster['substrates']:
+            substrates.setdefault(nutrient_resolver.resolve(name), name)
+        cluster['substrates'] = list(substrates.values())
+
+    def _apply_cluster_example(self, block: str) -> None:
+        """Merge a "Data Structure Requirements" JSON example into its cluster.
+
+        The example carries the quantitative ``fold_increase`` /
+        ``fold_decrease`` magnitudes; it is matched to the cluster whose
+        primary receptor is its ``primary_transporter``.
+        """
+        try:
+            example = json.loads(block)
+        except ValueError:
+            return
+        spec = example.get('receptor_cluster', {}) if isinstance(example, dict) else {}
+        transporter = spec.get('primary_transporter', '').lower()
+        system_data = self.receptor_data.get(example.get('system'), {})
+
+        for cluster in system_data.get('receptors', {}).values():
+            if cluster['primary_receptor'].lower() != transporter:
+                continue
+            for key, fold_key in (('enhancers', 'fold_increase'), ('inhibitors', 'fold_decrease')):
+                factors = {
+                    nutrient_resolver.resolve(f['name']): f for f in cluster[key]
+                }
+                for entry in spec.get(key, []):
+                    compound = entry.get('compound', '')
+                    factor = factors.get(nutrient_resolver.resolve(compound))
+                    if factor is None:
+                        factor = {
+                            'name': compound.replace('_', ' ').capitalize(),
+                            'mechanism': entry.get('mechanism', '')
+                        }
+                        cluster[key].append(factor)
+                    if fold_key in entry:
+                        factor[fold_key] = entry[fold_key]
+
+    def _parse_interaction_line(self, kind: str, line: str) -> None:
+        """Parse a numbered entry of the interaction matrix."""
+        entry = BOLD_BULLET.match(line)
+        if not entry:
+            return
+        label, description = entry.group(1).strip(), entry.group(2).strip()
+
+        if kind == 'timing':
+            self.interactions['timing'].append({
+                'nutrient': label,
+                'rule': description
+            })
+            return
+
+        members = [m.strip() for m in re.split(r'\s*(?:↔|\+)\s*', label) if m.strip()]
+        self.interactions[kind].append({
+            'members': members,
+            'description': description
+        })
+
+    @staticmethod
+    def _split_parenthetical(text: str) -> tuple:
+        """Split ``"Name (Expansion)"`` into the short name and the other part.
+
+        "Dcytb (Duodenal Cytochrome B)" and "Heme Transporter (HCP1)" both
+        yield the shorter token as the name.
+        """
+        match = re.match(r'^(.*?)\s*\(([^)]*)\)\s*(.*)$', text)
+        if not match:
+            return text.strip(), ''
+        outer = f"{match.group(1)} {match.group(3)}".strip()
+        inner = match.group(2).strip()
+        if not outer:
+            return inner, ''
+        if len(inner) < len(outer) and not re.search(r'[\s,]', inner) and inner.isupper():
+            return inner, outer
+        return outer, inner
+
+    @staticmethod
+    def _split_items(value: str) -> List[str]:
+        """Split ``"Vitamins C, E, selenium"`` into individual nutrient names."""
+        items = []
+        prefix = None
+        for part in re.split(r',\s*|\s+and\s+|/', value):
+            part, _ = ReceptorMappingParser._split_parenthetical(part)
+            part = ITEM_QUALIFIERS.sub('', part)
+            if not part:
+                continue
+            if part.lower().startswith('vitamins '):
+                prefix = 'Vitamin'
+                part = f"Vitamin {part[9:].strip()}"
+            elif prefix and len(part) <= 3:
+                part = f"{prefix} {part}"
+            else:
+                prefix = None
+            items.append(part[0].upper() + part[1:])
+        return items
+
+    def to_artifact(self, source_hash: str) -> Dict[str, Any]:
+        """Bundle parsed data into the versioned compiled-artifact layout."""
         return {
-            'name': 'Cellular Utilization',
-            'icon': '�',
-            'description': 'Intracellular nutrient utilization for energy and synthesis',
-            'receptors': {}
+            'format_version': FORMAT_VERSION,
+            'source_hash': source_hash,
+            'systems': self.receptor_data,
+            'interactions': self.interactions,
         }
-    
-    def _extract_section(self, content: str, start_marker: str, end_marker: str) -> str:
-        """Extract a section of text between two markers."""
-        start_idx = content.find(start_marker)
-        if start_idx == -1:
-            return ""
-        
-        end_idx = content.find(end_marker, start_idx)
-        if end_idx == -1:
-            return content[start_idx:]
-        
-        return content[start_idx:end_idx]
-    
+
     def save_to_json(self, output_path: Path):
         """Save parsed data to JSON file."""
         with open(output_path, 'w') as f:
             json.dump(self.receptor_data, f, indent=2)
 
 
+def compile_receptor_mapping(
+    markdown_path: Path = MAPPING_PATH,
+    compiled_path: Path = COMPILED_PATH
+) -> Dict[str, Any]:
+    """Return the compiled mapping, re-parsing only when the markdown changed.
+
+    The artifact records the markdown's SHA-256 and the parser format
+    version; if either differs the markdown is parsed again and the artifact
+    is rewritten atomically. A read-only deployment still works, it just
+    parses on every start.
+    """
+    source = markdown_path.read_bytes()
+    source_hash = hashlib.sha256(source).hexdigest()
+
+    try:
+        with open(compiled_path, 'r', encoding='utf-8') as f:
+            artifact = json.load(f)
+        if (artifact.get('format_version') == FORMAT_VERSION
+                and artifact.get('source_hash') == source_hash):
+            return artifact
+    except (OSError, ValueError):
+        pass
+
+    parser = ReceptorMappingParser(markdown_path)
+    parser.parse_text(source.decode('utf-8'))
+    artifact = parser.to_artifact(source_hash)
+
+    tmp_path = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=compiled_path.parent, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(artifact, f, ensure_ascii=False, indent=2)
+        # mkstemp creates the file 0600; give it the markdown's permissions
+        # so other deploy users and read-only sidecars can read it too
+        os.chmod(tmp_path, stat.S_IMODE(markdown_path.stat().st_mode) & 0o666)
+        os.replace(tmp_path, compiled_path)
+        tmp_path = None
+    except OSError as e:
+        logger.warning(f"Could not write compiled receptor mapping: {e}")
+    finally:
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+    return artifact
+
+
+@lru_cache(maxsize=1)
+def _load_compiled(source_mtime: float) -> Dict[str, Any]:
+    """Memoize the compiled artifact per markdown modification time."""
+    return compile_receptor_mapping()
+
+
+def load_compiled_mapping() -> Dict[str, Any]:
+    """Load the compiled mapping artifact (systems plus interaction matrix)."""
+    return _load_compiled(MAPPING_PATH.stat().st_mtime)
+
+
 # Utility function to load receptor data
 def load_receptor_data() -> Dict[str, Any]:
     """Load and return parsed receptor data."""
-    parser = ReceptorMappingParser(
-        Path(__file__).parent.parent.parent / 'data' / 'complete_receptor_mapping.md'
-    )
-    return parser.parse()
\ No newline at end of file
+    return copy.deepcopy(load_compiled_mapping()['systems'])
+
+
+def load_interaction_matrix() -> Dict[str, List[Dict[str, Any]]]:
+    """Load the parsed competition, synergy and timing interactions."""
+    return copy.deepcopy(load_compiled_mapping()['interactions'])
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    artifact = compile_receptor_mapping()
+    for key, system in artifact['systems'].items():
+        logger.info(f"{key}: {', '.join(system['receptors'])}")
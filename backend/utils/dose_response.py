@@ -0,0 +1,108 @@
+"""Dose-response curves for receptor enhancers and inhibitors.
+
+Each interaction has a maximal fold change (``fold_increase`` for enhancers,
+``fold_decrease`` for inhibitors). How much of it applies follows a
+saturating closed-form curve of the logged dose::
+
+    s(dose) = dose / (dose + half_saturation)
+    efficiency = 100% * prod(fold_i ** s_i)
+
+so one reference dose gives half the maximal effect in log space. The
+curve works elementwise on NumPy arrays, so the matrix engine evaluates it
+for every nutrient at once.
+"""
+import math
+from typing import Dict, Optional
+
+# Maximal fold change for interactions the mapping gives no magnitude for.
+# At one reference dose these give about +14% / -19%, close to the old flat
+# +15% / -20% per factor.
+DEFAULT_FOLD_INCREASE = 1.3
+DEFAULT_FOLD_DECREASE = 0.65
+
+UNIT_TO_MG: Dict[str, float] = {
+    'g': 1000.0,
+    'mg': 1.0,
+    'mcg': 0.001,
+    'ug': 0.001,
+    'µg': 0.001,
+    'μg': 0.001,
+}
+
+# International units are nutrient specific
+IU_TO_MG: Dict[str, float] = {
+    'vitamin_d': 0.000025,
+    'vitamin_a': 0.0003,
+    'vitamin_e': 0.67,
+}
+
+# Dose (mg) giving half the maximal effect; roughly one typical serving
+HALF_SATURATION_MG: Dict[str, float] = {
+    'vitamin_c': 100.0,
+    'vitamin_d': 0.025,
+    'vitamin_k': 0.1,
+    'vitamin_a': 0.9,
+    'vitamin_e': 15.0,
+    'vitamin_b1': 1.2,
+    'vitamin_b2': 1.3,
+    'vitamin_b3': 16.0,
+    'vitamin_b5': 5.0,
+    'vitamin_b6': 1.7,
+    'vitamin_b12': 0.0024,
+    'folate': 0.4,
+    'iron': 18.0,
+    'heme_iron': 5.0,
+    'calcium': 500.0,
+    'magnesium': 200.0,
+    'zinc': 11.0,
+    'copper': 0.9,
+    'manganese': 2.3,
+    'selenium': 0.055,
+    'lead': 0.01,
+    'potassium': 1000.0,
+    'molybdenum': 0.045,
+    'citric_acid': 500.0,
+    'phytates': 500.0,
+    'tannins': 200.0,
+    'omega_3': 1000.0,
+    'coq10': 100.0,
+}
+
+# Factors such as "Empty stomach" have no dose: each logged occurrence
+# counts as one unit against this half-saturation.
+PRESENCE_HALF_SATURATION = 1.0
+
+
+def half_saturation(canonical_id: str) -> float:
+    """Half-saturation dose for a nutrient (presence units if it has none)."""
+    return HALF_SATURATION_MG.get(canonical_id, PRESENCE_HALF_SATURATION)
+
+
+def dose_mg(canonical_id: str, amount: float, unit: Optional[str]) -> float:
+    """Convert a logged amount into the nutrient's dose units.
+
+    Amounts in units we cannot convert (servings, oz, ...) and amounts that
+    are not positive count as one reference dose.
+    """
+    if canonical_id not in HALF_SATURATION_MG:
+        return PRESENCE_HALF_SATURATION
+
+    unit_key = (unit or '').strip().lower()
+    if amount > 0:
+        if unit_key in UNIT_TO_MG:
+            return amount * UNIT_TO_MG[unit_key]
+        if unit_key == 'iu' and canonical_id in IU_TO_MG:
+            return amount * IU_TO_MG[canonical_id]
+    return HALF_SATURATION_MG[canonical_id]
+
+
+def saturation(dose, half_saturation_dose):
+    """Fraction of the maximal effect reached at ``dose`` (scalar or array)."""
+    return dose / (dose + half_saturation_dose)
+
+
+def log_fold(fold: Optional[float], is_enhancer: bool) -> float:
+    """Log of an interaction's maximal fold change, applying defaults."""
+    if fold is None or fold <= 0:
+        fold = DEFAULT_FOLD_INCREASE if is_enhancer else DEFAULT_FOLD_DECREASE
+    return math.log(fold)
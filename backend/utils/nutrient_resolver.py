@@ -0,0 +1,101 @@
+"""Canonical nutrient-name resolution shared by the receptor calculations."""
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List
+
+
+# Canonical nutrient ID -> every spelling we accept for it.
+# The canonical ID itself (and its space/hyphen variants) always resolves,
+# so only genuine aliases need to be listed here.
+NUTRIENT_ALIASES: Dict[str, List[str]] = {
+    'vitamin_c': ['vitamin c', 'ascorbic acid', 'ascorbate', 'sodium ascorbate'],
+    'vitamin_d': [
+        'vitamin d', 'vitamin d3', 'd3', 'cholecalciferol', 'vitamin d2',
+        'ergocalciferol', 'calcitriol'
+    ],
+    'vitamin_k': [
+        'vitamin k', 'vitamin k1', 'vitamin k2', 'k2', 'mk-7', 'menaquinone',
+        'phylloquinone'
+    ],
+    'vitamin_a': ['vitamin a', 'retinol', 'retinyl palmitate', 'beta carotene'],
+    'vitamin_e': ['vitamin e', 'tocopherol', 'alpha tocopherol'],
+    'vitamin_b1': ['vitamin b1', 'b1', 'thiamine', 'thiamin'],
+    'vitamin_b2': ['vitamin b2', 'b2', 'riboflavin'],
+    'vitamin_b3': ['vitamin b3', 'b3', 'niacin', 'niacinamide', 'nicotinamide'],
+    'vitamin_b5': ['vitamin b5', 'b5', 'pantothenic acid', 'pantothenate'],
+    'vitamin_b6': ['vitamin b6', 'b6', 'pyridoxine', 'pyridoxal 5 phosphate', 'p5p'],
+    'vitamin_b12': [
+        'vitamin b12', 'b12', 'cobalamin', 'methylcobalamin', 'cyanocobalamin'
+    ],
+    'folate': ['folic acid', 'methylfolate', 'l methylfolate', 'vitamin b9', 'b9'],
+    'calcium': ['ca', 'ca2+', 'calcium carbonate', 'calcium citrate'],
+    'iron': [
+        'fe', 'fe2+', 'fe3+', 'ferrous', 'ferric', 'ferrous sulfate',
+        'ferrous bisglycinate'
+    ],
+    'magnesium': ['mg', 'mg2+', 'magnesium glycinate', 'magnesium citrate'],
+    'zinc': ['zn', 'zn2+', 'zinc picolinate', 'zinc citrate', 'zinc gluconate'],
+    'copper': ['cu', 'cu2+', 'copper gluconate'],
+    'manganese': ['mn', 'mn2+'],
+    'selenium': ['se', 'selenomethionine'],
+    'lead': ['pb', 'pb2+'],
+    'omega_3': ['omega 3', 'omega-3 fatty acids', 'fish oil', 'epa', 'dha'],
+    'coq10': ['coenzyme q10', 'ubiquinone', 'ubiquinol'],
+    'phytates': ['phytate', 'phytic acid'],
+    'high_fiber': ['fiber', 'fibre'],
+    'tannins': ['tannin', 'tannic acid'],
+    'leucine': ['l leucine'],
+    'isoleucine': ['l isoleucine'],
+    'valine': ['l valine'],
+    'phenylalanine': ['l phenylalanine'],
+    'tyrosine': ['l tyrosine'],
+    'tryptophan': ['l tryptophan'],
+    'methionine': ['l methionine'],
+    'histidine': ['l histidine'],
+    'threonine': ['l threonine'],
+}
+
+
+def normalize_nutrient_name(name: str) -> str:
+    """Normalize a free-text nutrient name into its lookup form."""
+    # NFKC folds subscripts/superscripts (D₃, Fe²⁺) into plain characters
+    text = unicodedata.normalize('NFKC', name).lower().strip()
+    text = re.sub(r'\([^)]*\)', ' ', text)
+    text = re.sub(r'[^a-z0-9]+', '_', text)
+    return text.strip('_')
+
+
+class NutrientResolver:
+    """Resolve nutrient spellings to canonical nutrient IDs."""
+
+    def __init__(self, aliases: Dict[str, List[str]]):
+        self.alias_index: Dict[str, str] = {}
+        for canonical_id, spellings in aliases.items():
+            self.alias_index[normalize_nutrient_name(canonical_id)] = canonical_id
+            for spelling in spellings:
+                self.alias_index[normalize_nutrient_name(spelling)] = canonical_id
+
+        # Bound per instance so each resolver keeps its own memo table
+        self.resolve = lru_cache(maxsize=4096)(self._resolve)
+
+    def _resolve(self, name: str) -> str:
+        """Return the canonical ID for a nutrient name.
+
+        Unknown names resolve to their normalized form, so two unknown
+        spellings only match when they normalize identically.
+        """
+        key = normalize_nutrient_name(name)
+        return self.alias_index.get(key, key)
+
+    def is_known(self, name: str) -> bool:
+        """True if the name resolves through the alias table."""
+        return normalize_nutrient_name(name) in self.alias_index
+
+    def resolve_all(self, names: Iterable[str]) -> FrozenSet[str]:
+        """Resolve a collection of names to a set of canonical IDs."""
+        return frozenset(self.resolve(name) for name in names)
+
+
+# Singleton instance
+nutrient_resolver = NutrientResolver(NUTRIENT_ALIASES)
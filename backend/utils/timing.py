@@ -0,0 +1,13 @@
+"""Helpers for intake timestamps that may or may not carry a timezone."""
+from datetime import datetime
+
+
+def local_naive(timing: datetime) -> datetime:
+    """Convert an aware timestamp to naive local time; naive ones pass through.
+
+    Clients send both kinds, and comparing or bucketing them by hour only
+    makes sense once they are in the same (local) frame.
+    """
+    if timing.tzinfo is not None:
+        return timing.astimezone(tz=None).replace(tzinfo=None)
+    return timing